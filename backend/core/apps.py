@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from django.core.signals import request_started, request_finished
+        from .db_routers import ReplicaPin
+
+        request_started.connect(ReplicaPin.start_request, dispatch_uid="replica_pin_start")
+        request_finished.connect(ReplicaPin.end_request, dispatch_uid="replica_pin_end")
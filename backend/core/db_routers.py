@@ -0,0 +1,151 @@
+"""
+Database routing between the primary and an optional read replica.
+"""
+
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_DATABASE = 'default'
+REPLICA_DATABASE = 'replica'
+
+# Per-thread routing state, reset by request_started
+_state = threading.local()
+
+
+class ReplicaPin:
+    """
+    Read-your-writes pinning.
+    A write pins the current thread to the primary for REPLICA_PIN_SECONDS,
+    and a pin stored in the cache carries that over to the same user's
+    following requests, whichever worker serves them.
+    """
+
+    KEY_PREFIX = "db:pinned"
+
+    @staticmethod
+    def get_window():
+        """Get the pinning window in seconds."""
+        return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+    @staticmethod
+    def _make_key(user_id):
+        return f"{ReplicaPin.KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def start_request(**kwargs):
+        """Reset the pin and user for a new request (connected to request_started)."""
+        _state.pinned_until = 0
+        _state.user_id = None
+
+    @staticmethod
+    def end_request(**kwargs):
+        """Drop the request's pin and user (connected to request_finished)."""
+        _state.pinned_until = 0
+        _state.user_id = None
+
+    @staticmethod
+    def get_pinned_until():
+        """Get when this thread's pin expires, to hand it to worker threads."""
+        return getattr(_state, 'pinned_until', 0)
+
+    @staticmethod
+    def pin_until(pinned_until):
+        """Pin this thread until the given time, e.g. one inherited from a request thread."""
+        _state.pinned_until = max(getattr(_state, 'pinned_until', 0), pinned_until)
+
+    @staticmethod
+    def set_user(user_id):
+        """
+        Record the authenticated user for this request and apply their pin.
+        Called once authentication has resolved the user.
+        """
+        _state.user_id = user_id
+        if not ReplicaRouter.has_replica():
+            return
+        
+        try:
+            pinned_until = cache.get(ReplicaPin._make_key(user_id))
+        except Exception as e:
+            logger.warning(f"Failed to read replica pin: {str(e)}")
+            pinned_until = None
+        
+        if pinned_until:
+            ReplicaPin.pin_until(pinned_until)
+
+    @staticmethod
+    def record_write():
+        """Pin this thread, and its request's user, to the primary."""
+        if not ReplicaRouter.has_replica():
+            return
+        
+        window = ReplicaPin.get_window()
+        pinned_until = time.time() + window
+        already_pinned = getattr(_state, 'pinned_until', 0) > time.time() + window / 2
+        _state.pinned_until = pinned_until
+        
+        user_id = getattr(_state, 'user_id', None)
+        if user_id is None or already_pinned:
+            return
+        try:
+            cache.set(ReplicaPin._make_key(user_id), pinned_until, timeout=window)
+        except Exception as e:
+            logger.warning(f"Failed to write replica pin: {str(e)}")
+
+    @staticmethod
+    def is_pinned():
+        """Check whether this thread must read from the primary."""
+        return getattr(_state, 'pinned_until', 0) > time.time()
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica and writes to the primary.
+    Reads stay on the primary inside a transaction on it (so they see its
+    writes and row locks apply) and while the thread or user is pinned after
+    a write. Without a configured replica every query uses the primary.
+    """
+
+    @staticmethod
+    def has_replica():
+        return REPLICA_DATABASE in settings.DATABASES
+
+    def db_for_read(self, model, **hints):
+        if not self.has_replica():
+            return None
+        if getattr(_state, 'force_replica', False):
+            return REPLICA_DATABASE
+        if connections[PRIMARY_DATABASE].in_atomic_block or ReplicaPin.is_pinned():
+            return PRIMARY_DATABASE
+        return REPLICA_DATABASE
+
+    def db_for_write(self, model, **hints):
+        ReplicaPin.record_write()
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DATABASE
+
+
+@contextmanager
+def use_replica():
+    """
+    Route every read in the block to the replica, ignoring pins.
+    For read-only reporting that should never load the primary.
+    """
+    previous = getattr(_state, 'force_replica', False)
+    _state.force_replica = True
+    try:
+        yield
+    finally:
+        _state.force_replica = previous
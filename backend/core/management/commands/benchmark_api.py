@@ -0,0 +1,525 @@
+from datetime import timedelta
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tickets.cache import TicketStatsCache
+from tickets.models import Ticket, TicketLog, TicketVisibility, UserLog
+from tickets.services import TicketService
+from users.cache import ContractorCache
+
+User = get_user_model()
+
+# Seeded users are recognised (and cleaned up) by this email domain
+BENCHMARK_DOMAIN = 'benchmark.local'
+
+REPORT_VERSION = 1
+
+
+class Command(BaseCommand):
+    """
+    Management command to benchmark the ticket API hot paths against the
+    configured database. Seeds a reproducible data set, measures latency,
+    throughput and query counts for each read endpoint (as an admin and as a
+    contractor) and each TicketService mutation, and writes a JSON report
+    that a later run can be compared against.
+
+    Seeded users use the @benchmark.local domain; they and everything they
+    own are deleted before seeding and again at the end unless --keep is set.
+
+    Usage:
+        python manage.py benchmark_api
+        python manage.py benchmark_api --tickets 20000 --output before.json
+        python manage.py benchmark_api --output after.json --compare before.json --max-regression 20
+    """
+
+    help = 'Benchmark ticket API reads and TicketService writes on seeded data'
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            '--contractors',
+            type=int,
+            default=20,
+            help='Number of contractors to seed (default: 20)'
+        )
+        parser.add_argument(
+            '--tickets',
+            type=int,
+            default=5000,
+            help='Number of tickets to seed (default: 5000)'
+        )
+        parser.add_argument(
+            '--logs-per-ticket',
+            type=int,
+            default=4,
+            help='Ticket logs and user logs seeded per ticket (default: 4)'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=50,
+            help='Measured iterations per scenario (default: 50)'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=5,
+            help='Unmeasured iterations run first per scenario (default: 5)'
+        )
+        parser.add_argument(
+            '--random-seed',
+            type=int,
+            default=0,
+            help='Seed for the generated data (default: 0)'
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Invalidate the ticket stats and dashboard caches before every iteration'
+        )
+        parser.add_argument(
+            '--only',
+            default=None,
+            help='Comma-separated scenario names to run (default: all)'
+        )
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Write the JSON report to this path'
+        )
+        parser.add_argument(
+            '--compare',
+            default=None,
+            help='Baseline JSON report to compare the results against'
+        )
+        parser.add_argument(
+            '--max-regression',
+            type=float,
+            default=None,
+            help='Fail if any p50 latency regresses by more than this percentage against --compare'
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Keep the seeded data after the run'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler."""
+        if options['max_regression'] is not None and not options['compare']:
+            raise CommandError('--max-regression needs a --compare baseline')
+
+        baseline = self._load_report(options['compare']) if options['compare'] else None
+        only = set(options['only'].split(',')) if options['only'] else None
+
+        self.stdout.write('🧹 Removing previous benchmark data...')
+        self._cleanup()
+
+        try:
+            started = time.perf_counter()
+            data = self._seed(options)
+            self.stdout.write(
+                f'🌱 Seeded {len(data["contractors"])} contractors, {options["tickets"]} tickets, '
+                f'{options["tickets"] * options["logs_per_ticket"] * 2} logs '
+                f'in {time.perf_counter() - started:.1f}s'
+            )
+
+            results = []
+            for name, role, kind, func, before in self._get_scenarios(data):
+                if only and name not in only:
+                    continue
+                result = self._measure(func, before, options)
+                result.update({'name': name, 'role': role, 'kind': kind})
+                results.append(result)
+                self._write_result(result)
+        finally:
+            if not options['keep']:
+                self.stdout.write('🧹 Removing benchmark data...')
+                self._cleanup()
+
+        report = {
+            'version': REPORT_VERSION,
+            'meta': self._get_meta(options),
+            'results': results
+        }
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f'📄 Report written to {options["output"]}')
+
+        if baseline is not None:
+            regressions = self._compare(baseline, report, options['max_regression'])
+            if regressions:
+                raise CommandError(f'{len(regressions)} scenario(s) regressed: {", ".join(regressions)}')
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark complete'))
+
+    def _seed(self, options):
+        """
+        Seed users, tickets and logs with bulk inserts.
+        Returns the seeded users and the tickets the scenarios act on.
+        """
+        rng = random.Random(options['random_seed'])
+        now = timezone.now()
+        password = make_password(None)
+
+        with transaction.atomic():
+            admin = User.objects.create(
+                email=f'admin@{BENCHMARK_DOMAIN}',
+                username=f'admin@{BENCHMARK_DOMAIN}',
+                first_name='Bench',
+                last_name='Admin',
+                role=User.Role.ADMIN,
+                password=password
+            )
+            User.objects.bulk_create([
+                User(
+                    email=f'contractor{index}@{BENCHMARK_DOMAIN}',
+                    username=f'contractor{index}@{BENCHMARK_DOMAIN}',
+                    first_name='Bench',
+                    last_name=f'Contractor {index}',
+                    role=User.Role.CONTRACTOR,
+                    password=password
+                )
+                for index in range(max(options['contractors'], 2))
+            ])
+            contractors = list(
+                User.objects.filter(
+                    email__endswith=f'@{BENCHMARK_DOMAIN}', role=User.Role.CONTRACTOR
+                ).order_by('id')
+            )
+
+            statuses = [Ticket.Status.OPEN] * 5 + [Ticket.Status.IN_PROGRESS] * 3 + [Ticket.Status.CLOSED] * 2
+            tickets = [
+                Ticket(
+                    ticket_number=f'BENCH-{index:06d}',
+                    organization=f'Benchmark Org {rng.randrange(200)}',
+                    location=f'{rng.randrange(1, 999)} {rng.choice(["Main", "Oak", "Pine", "Elm"])} Street',
+                    notes=f'Benchmark ticket {index}',
+                    status=rng.choice(statuses),
+                    expiration_date=now + timedelta(hours=rng.randrange(-240, 720)),
+                    assigned_contractor=rng.choice(contractors),
+                    created_by=admin,
+                    updated_by=admin
+                )
+                for index in range(options['tickets'])
+            ]
+            Ticket.objects.bulk_create(tickets, batch_size=1000)
+
+            # Spread creation over the past 60 days instead of the insert time
+            for ticket in tickets:
+                ticket.created_date = now - timedelta(minutes=rng.randrange(60 * 24 * 60))
+            Ticket.objects.bulk_update(tickets, ['created_date'], batch_size=1000)
+            TicketVisibility.sync(tickets, prune=False)
+
+            ticket_logs = []
+            user_logs = []
+            for ticket in tickets:
+                for _ in range(options['logs_per_ticket']):
+                    timestamp = ticket.created_date + timedelta(minutes=rng.randrange(60 * 24 * 7))
+                    ticket_logs.append(TicketLog(
+                        ticket=ticket,
+                        action_by=admin,
+                        action=TicketLog.Action.UPDATED,
+                        details={'changes': {'notes': {'old': '', 'new': 'Benchmark'}}},
+                        timestamp=timestamp
+                    ))
+                    user_logs.append(UserLog(
+                        user=ticket.assigned_contractor,
+                        action=UserLog.Action.TICKET_UPDATED,
+                        details={'ticket_id': str(ticket.id), 'ticket_number': ticket.ticket_number},
+                        related_ticket=ticket,
+                        timestamp=timestamp
+                    ))
+            TicketLog.objects.bulk_create(ticket_logs, batch_size=2000)
+            UserLog.objects.bulk_create(user_logs, batch_size=2000)
+
+        ContractorCache.invalidate(*(contractor.id for contractor in contractors))
+        TicketStatsCache.invalidate_all()
+
+        contractor = contractors[0]
+        visible = [ticket for ticket in tickets if ticket.assigned_contractor_id == contractor.id]
+        if not visible:
+            raise CommandError('The first contractor has no tickets, seed more tickets')
+
+        return {
+            'admin': admin,
+            'contractors': contractors,
+            'contractor': contractor,
+            'ticket': visible[0],
+            'mutable_ticket': tickets[-1]
+        }
+
+    def _cleanup(self):
+        """Delete the seeded users, cascading to their tickets and logs."""
+        user_ids = list(
+            User.objects.filter(email__endswith=f'@{BENCHMARK_DOMAIN}').values_list('id', flat=True)
+        )
+        if not user_ids:
+            return
+
+        with transaction.atomic():
+            tickets = Ticket.objects.filter(created_by_id__in=user_ids)
+            TicketLog.objects.filter(ticket__in=tickets).delete()
+            UserLog.objects.filter(related_ticket__in=tickets).delete()
+            UserLog.objects.filter(user_id__in=user_ids).delete()
+            tickets.delete()
+            User.objects.filter(id__in=user_ids).delete()
+
+        for user_id in user_ids:
+            User.invalidate_caches(user_id)
+        TicketStatsCache.invalidate_all()
+
+    def _get_scenarios(self, data):
+        """
+        Build the (name, role, kind, func, before) scenarios.
+        func performs one operation, before (or None) runs untimed ahead of each one.
+        """
+        admin = data['admin']
+        contractor = data['contractor']
+        ticket_id = data['ticket'].id
+        clients = {
+            'admin': self._get_client(admin),
+            'contractor': self._get_client(contractor),
+        }
+
+        reads = [
+            ('ticket_list', '/api/tickets/?page_size=20'),
+            ('ticket_list_status', '/api/tickets/?status=open&page_size=20'),
+            ('ticket_search', '/api/tickets/?search=main+street&page_size=20'),
+            ('ticket_detail', f'/api/tickets/{ticket_id}/'),
+            ('ticket_stats', '/api/tickets/stats/'),
+            ('dashboard', '/api/tickets/dashboard/'),
+            ('user_logs', '/api/tickets/logs/users/'),
+            ('ticket_logs', '/api/tickets/logs/tickets/'),
+            ('activity_feed', '/api/tickets/activity/'),
+            ('audit_trail', f'/api/tickets/{ticket_id}/audit/'),
+        ]
+        scenarios = [
+            (name, role, 'read', self._make_request(client, path), None)
+            for name, path in reads
+            for role, client in clients.items()
+        ]
+
+        mutable_id = data['mutable_ticket'].id
+        assignees = data['contractors'][:2]
+        created_ids = []
+        expiration_date = timezone.now() + timedelta(days=30)
+
+        def create():
+            created_ids.append(TicketService.create_ticket(
+                created_by=admin,
+                assigned_contractor_id=contractor.id,
+                organization='Benchmark Org',
+                location='1 Main Street',
+                expiration_date=expiration_date
+            ).id)
+
+        def update():
+            TicketService.update_ticket(mutable_id, admin, notes=f'Benchmark {time.perf_counter_ns()}')
+
+        def renew():
+            TicketService.renew_ticket(mutable_id, admin, days=1)
+
+        def assign():
+            current = Ticket.objects.values_list('assigned_contractor_id', flat=True).get(id=mutable_id)
+            next_assignee = assignees[1] if current == assignees[0].id else assignees[0]
+            TicketService.assign_ticket(mutable_id, next_assignee.id, admin)
+
+        def close():
+            TicketService.close_ticket(created_ids.pop(), admin)
+
+        def ensure_open_ticket():
+            # close consumes the tickets create made, topping them up untimed
+            if not created_ids:
+                create()
+
+        scenarios += [
+            ('create_ticket', 'admin', 'write', create, None),
+            ('update_ticket', 'admin', 'write', update, None),
+            ('renew_ticket', 'admin', 'write', renew, None),
+            ('assign_ticket', 'admin', 'write', assign, None),
+            ('close_ticket', 'admin', 'write', close, ensure_open_ticket),
+        ]
+        return scenarios
+
+    def _get_client(self, user):
+        """Get a test client authenticated as the user."""
+        token = str(AccessToken.for_user(user))
+        return Client(HTTP_HOST='localhost', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def _make_request(self, client, path):
+        """Get a function that requests the path and checks the response."""
+        def request():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise CommandError(f'{path} returned {response.status_code}')
+        return request
+
+    def _measure(self, func, before, options):
+        """Run a scenario, returning latency, throughput and query count statistics."""
+        def run_once():
+            if options['cold']:
+                TicketStatsCache.invalidate_all()
+            if before:
+                before()
+            # Count queries on every alias, reads may be routed to a replica
+            contexts = [CaptureQueriesContext(connection) for connection in connections.all()]
+            for context in contexts:
+                context.__enter__()
+            try:
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+            finally:
+                for context in contexts:
+                    context.__exit__(None, None, None)
+            return elapsed * 1000, sum(len(context.captured_queries) for context in contexts)
+
+        for _ in range(options['warmup']):
+            run_once()
+
+        latencies = []
+        queries = []
+        for _ in range(max(options['iterations'], 1)):
+            latency, query_count = run_once()
+            latencies.append(latency)
+            queries.append(query_count)
+
+        latencies.sort()
+        return {
+            'iterations': len(latencies),
+            'mean_ms': round(statistics.fmean(latencies), 3),
+            'p50_ms': round(statistics.median(latencies), 3),
+            'p95_ms': round(self._percentile(latencies, 95), 3),
+            'p99_ms': round(self._percentile(latencies, 99), 3),
+            'min_ms': round(latencies[0], 3),
+            'max_ms': round(latencies[-1], 3),
+            'ops_per_second': round(len(latencies) / (sum(latencies) / 1000), 1),
+            'queries_mean': round(statistics.fmean(queries), 2),
+            'queries_max': max(queries)
+        }
+
+    def _percentile(self, sorted_values, percent):
+        """Get a nearest-rank percentile of already sorted values."""
+        return sorted_values[max(int(len(sorted_values) * percent / 100 + 0.5) - 1, 0)]
+
+    def _write_result(self, result):
+        """Write one scenario's line of the console summary."""
+        self.stdout.write(
+            f'   {result["name"]:<20} {result["role"]:<10} '
+            f'p50 {result["p50_ms"]:8.2f} ms  p95 {result["p95_ms"]:8.2f} ms  '
+            f'{result["ops_per_second"]:8.1f} ops/s  {result["queries_mean"]:6.1f} queries'
+        )
+
+    def _get_meta(self, options):
+        """Describe the code, environment and settings the results came from."""
+        database = connections['default']
+        with database.cursor() as cursor:
+            cursor.execute('SHOW server_version')
+            server_version = cursor.fetchone()[0]
+
+        return {
+            'created_at': timezone.now().isoformat(),
+            'git_commit': self._get_git_commit(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': {
+                'vendor': database.vendor,
+                'server_version': server_version,
+                'replica': 'replica' in settings.DATABASES,
+                'pool': getattr(settings, 'DB_POOL', False),
+                'conn_max_age': database.settings_dict['CONN_MAX_AGE'],
+            },
+            'settings': {
+                'api_fast_json': getattr(settings, 'API_FAST_JSON', False),
+                'dashboard_concurrent_sections': getattr(settings, 'DASHBOARD_CONCURRENT_SECTIONS', False),
+            },
+            'volumes': {
+                'contractors': max(options['contractors'], 2),
+                'tickets': options['tickets'],
+                'logs_per_ticket': options['logs_per_ticket'],
+                'random_seed': options['random_seed'],
+            },
+            'iterations': options['iterations'],
+            'warmup': options['warmup'],
+            'cold': options['cold'],
+        }
+
+    def _get_git_commit(self):
+        """Get the checked out commit, or None outside a git checkout."""
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def _load_report(self, path):
+        """Load a baseline report."""
+        try:
+            with open(path) as file:
+                report = json.load(file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read baseline report {path}: {str(e)}')
+
+        if report.get('version') != REPORT_VERSION:
+            raise CommandError(f'Baseline report {path} has an unsupported version')
+        return report
+
+    def _compare(self, baseline, report, max_regression):
+        """
+        Write p50 and query count changes against a baseline.
+        Returns the scenarios whose p50 regressed beyond max_regression percent.
+        """
+        baseline_results = {
+            (result['name'], result['role']): result for result in baseline['results']
+        }
+        self.stdout.write(f'📊 Compared with {baseline["meta"].get("git_commit") or "baseline"}:')
+        if any(
+            baseline['meta'].get(key) != report['meta'][key] for key in ('volumes', 'cold')
+        ):
+            self.stdout.write(self.style.WARNING(
+                '⚠️  The baseline was seeded or cached differently, timings may not be comparable'
+            ))
+
+        regressions = []
+        for result in report['results']:
+            previous = baseline_results.get((result['name'], result['role']))
+            if previous is None:
+                continue
+
+            change = (result['p50_ms'] - previous['p50_ms']) / previous['p50_ms'] * 100
+            query_change = result['queries_mean'] - previous['queries_mean']
+            regressed = max_regression is not None and change > max_regression
+            line = (
+                f'   {result["name"]:<20} {result["role"]:<10} '
+                f'p50 {previous["p50_ms"]:8.2f} -> {result["p50_ms"]:8.2f} ms ({change:+6.1f}%)  '
+                f'queries {query_change:+.1f}'
+            )
+            if regressed:
+                regressions.append(f'{result["name"]}/{result["role"]}')
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        return regressions
@@ -0,0 +1,138 @@
+from datetime import timedelta
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer, orjson
+from tickets.models import Ticket
+from tickets.serializers import TicketListOutputSerializer, TicketListRowSerializer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Management command to compare the stock and fast JSON paths on ticket
+    list pages: TicketListOutputSerializer against the flat TicketListRowSerializer,
+    then JSONRenderer against FastJSONRenderer. Builds the tickets in memory,
+    no database needed.
+    
+    Usage:
+        python manage.py benchmark_json
+        python manage.py benchmark_json --page-size 100 --iterations 500
+    """
+    
+    help = 'Benchmark serializing and rendering ticket list pages'
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=100,
+            help='Number of tickets per page (default: 100)'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Number of pages rendered per renderer (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler."""
+        if orjson is None:
+            raise CommandError('orjson is not installed, FastJSONRenderer would use the stock renderer')
+        
+        tickets = self._build_tickets(options['page_size'])
+        rows = self._build_rows(tickets)
+        iterations = options['iterations']
+        now = timezone.now()
+        
+        data, model_seconds = self._time(
+            lambda: TicketListOutputSerializer(tickets, many=True).data, iterations
+        )
+        row_data, row_seconds = self._time(
+            lambda: TicketListRowSerializer(rows, now=now).data, iterations
+        )
+        stock_output, stock_seconds = self._time(lambda: JSONRenderer().render(data), iterations)
+        fast_output, fast_seconds = self._time(lambda: FastJSONRenderer().render(data), iterations)
+        
+        if stock_output != fast_output:
+            raise CommandError('FastJSONRenderer output differs from JSONRenderer')
+        if JSONRenderer().render(row_data) != stock_output:
+            raise CommandError('TicketListRowSerializer output differs from TicketListOutputSerializer')
+        
+        self.stdout.write(f'📦 {len(data)} tickets per page, {len(stock_output)} bytes, {iterations} iterations')
+        self._report('TicketListOutputSerializer', model_seconds, 'TicketListRowSerializer', row_seconds, iterations)
+        self._report('JSONRenderer', stock_seconds, 'FastJSONRenderer', fast_seconds, iterations)
+        self._report(
+            'Stock page', model_seconds + stock_seconds,
+            'Fast page', row_seconds + fast_seconds,
+            iterations
+        )
+        self.stdout.write(self.style.SUCCESS('✅ Identical output on both paths'))
+
+    def _report(self, stock_name, stock_seconds, fast_name, fast_seconds, iterations):
+        """Write per-page timings for a stock/fast pair."""
+        self.stdout.write(f'   {stock_name:<28} {stock_seconds / iterations * 1000:.3f} ms/page')
+        self.stdout.write(
+            f'   {fast_name:<28} {fast_seconds / iterations * 1000:.3f} ms/page '
+            f'({stock_seconds / fast_seconds:.1f}x faster)'
+        )
+
+    def _time(self, func, iterations):
+        """Call func repeatedly, returning its result and the elapsed seconds."""
+        result = func()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return result, time.perf_counter() - start
+
+    def _build_tickets(self, count):
+        """Build unsaved tickets with a realistic spread of users and dates."""
+        now = timezone.now()
+        admin = User(id=1, email='admin@example.com', first_name='Ada', last_name='Admin', role=User.Role.ADMIN)
+        contractors = [
+            User(
+                id=index + 2,
+                email=f'contractor{index}@example.com',
+                first_name='Conrad',
+                last_name=f'Contractor {index}',
+                role=User.Role.CONTRACTOR
+            )
+            for index in range(10)
+        ]
+        statuses = list(Ticket.Status.values)
+        
+        return [
+            Ticket(
+                id=uuid.uuid4(),
+                ticket_number=f'TKT-{index:06d}',
+                organization=f'Organization {index % 25}',
+                location=f'{index} Main Street, Springfield',
+                status=statuses[index % len(statuses)],
+                created_date=now - timedelta(days=index % 30, microseconds=index),
+                expiration_date=now + timedelta(days=index % 20 - 5, seconds=index),
+                assigned_contractor=contractors[index % len(contractors)],
+                created_by=admin
+            )
+            for index in range(count)
+        ]
+
+    def _build_rows(self, tickets):
+        """Build the .values() dicts the list queryset would return for the tickets."""
+        rows = []
+        for ticket in tickets:
+            row = {}
+            for column in TicketListRowSerializer.VALUES_FIELDS:
+                value = ticket
+                for attr in column.split('__'):
+                    value = getattr(value, attr)
+                row[column] = value
+            rows.append(row)
+        return rows
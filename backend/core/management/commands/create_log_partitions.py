@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from tickets.services import LogPartitionService
+
+
+class Command(BaseCommand):
+    """
+    Management command to create upcoming monthly partitions for the log tables.
+    
+    Usage:
+        python manage.py create_log_partitions
+        python manage.py create_log_partitions --months-ahead 6
+    """
+    
+    help = 'Create monthly partitions for UserLog and TicketLog ahead of time'
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=None,
+            help='Number of months after the current one to create (default: LOG_PARTITION_MONTHS_AHEAD)'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler."""
+        try:
+            created = LogPartitionService.ensure_partitions(
+                months_ahead=options['months_ahead']
+            )
+            
+            for name in created:
+                self.stdout.write(f'   Created partition {name}')
+            
+            self.stdout.write(
+                self.style.SUCCESS(f'✅ Log partitions up to date ({len(created)} created)')
+            )
+            
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'❌ Error creating partitions: {str(e)}')
+            )
+            raise CommandError(f'Partition maintenance failed: {str(e)}')
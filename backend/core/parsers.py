@@ -0,0 +1,43 @@
+"""
+Fast JSON parser for the REST API.
+Uses orjson when it is installed and falls back to the stock DRF parser otherwise.
+"""
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+import codecs
+import io
+
+from core.renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser that decodes UTF-8 bodies with orjson.
+    Bodies orjson rejects are re-parsed by JSONParser, so what is accepted
+    (e.g. lone surrogate escapes) and the error messages stay the same.
+    Integers wider than 64 bits decode as floats.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
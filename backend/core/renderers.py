@@ -0,0 +1,58 @@
+"""
+Fast JSON renderer for the REST API.
+Uses orjson when it is installed and falls back to the stock DRF renderer otherwise.
+"""
+
+from rest_framework.renderers import JSONRenderer
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+    Output is byte-for-byte identical to JSONRenderer: datetimes, decimals and
+    other types orjson would format differently go through DRF's encoder.
+    Indented output and non-default UNICODE_JSON/COMPACT_JSON use the stock path.
+    The one difference is non-finite floats, written as null where STRICT_JSON
+    would raise; no API response carries floats.
+    """
+
+    def _can_use_orjson(self, indent):
+        return (
+            orjson is not None
+            and indent is None
+            and self.compact
+            and not self.ensure_ascii
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if not self._can_use_orjson(indent):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except (TypeError, orjson.JSONEncodeError) as e:
+            # e.g. integers wider than 64 bits
+            logger.debug(f"orjson could not encode response, using stdlib json: {str(e)}")
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same strict javascript subset escaping as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
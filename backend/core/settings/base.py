@@ -30,6 +30,7 @@ DJANGO_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -80,17 +81,71 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
-# Database
-DATABASES = {
-    'default': {
+# Seconds a connection stays open across requests and Celery tasks
+# (0 reconnects every time); unused with DB_POOL, where the pool owns connections
+DB_CONN_MAX_AGE = env.int('DB_CONN_MAX_AGE', default=60)
+
+# Use Django's native psycopg 3 connection pool instead (needs psycopg[pool])
+DB_POOL = env.bool('DB_POOL', default=False)
+
+# Threads serving requests in each gunicorn worker or Celery process. Pools
+# are per process, so processes x DB_POOL_MAX_SIZE must stay below the
+# server's max_connections
+WEB_THREADS = env.int('WEB_THREADS', default=1)
+DB_POOL_MIN_SIZE = env.int('DB_POOL_MIN_SIZE', default=WEB_THREADS)
+DB_POOL_MAX_SIZE = env.int('DB_POOL_MAX_SIZE', default=WEB_THREADS + 2)
+# Seconds to wait for a free pooled connection before failing the request
+DB_POOL_TIMEOUT = env.int('DB_POOL_TIMEOUT', default=10)
+
+
+def build_database_settings(host):
+    """Build DATABASES['default'] with persistent or pooled connections."""
+    return {
         'ENGINE': 'django.db.backends.postgresql',
         'NAME': env('DB_NAME', default='nova811'),
         'USER': env('DB_USER', default='postgres'),
         'PASSWORD': env('DB_PASSWORD', default='postgres'),
-        'HOST': env('DB_HOST', default='localhost'),
+        'HOST': env('DB_HOST', default=host),
         'PORT': env('DB_PORT', default='5432'),
+        # Django rejects persistent connections combined with a pool
+        'CONN_MAX_AGE': 0 if DB_POOL else DB_CONN_MAX_AGE,
+        # Check a reused connection is alive before the request uses it
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'pool': {
+                'min_size': DB_POOL_MIN_SIZE,
+                'max_size': DB_POOL_MAX_SIZE,
+                'timeout': DB_POOL_TIMEOUT,
+            },
+        } if DB_POOL else {},
     }
-}
+
+
+# Read replica host; when set, reads are routed to it by ReplicaRouter
+DB_REPLICA_HOST = env('DB_REPLICA_HOST', default='')
+DB_REPLICA_PORT = env('DB_REPLICA_PORT', default=env('DB_PORT', default='5432'))
+
+# Seconds a user's reads stay on the primary after they write
+REPLICA_PIN_SECONDS = env.int('REPLICA_PIN_SECONDS', default=5)
+
+
+def build_databases(host):
+    """Build DATABASES with the primary and, if configured, the replica."""
+    databases = {'default': build_database_settings(host)}
+    if DB_REPLICA_HOST:
+        databases['replica'] = {
+            **build_database_settings(host),
+            'HOST': DB_REPLICA_HOST,
+            'PORT': DB_REPLICA_PORT,
+            # Tests run against the primary only
+            'TEST': {'MIRROR': 'default'},
+        }
+    return databases
+
+
+# Database
+DATABASES = build_databases(host='localhost')
+DATABASE_ROUTERS = ['core.db_routers.ReplicaRouter']
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -128,16 +183,25 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Render and parse API JSON with orjson (identical output, falls back to
+# the stock DRF classes when orjson is not installed)
+API_FAST_JSON = env.bool('API_FAST_JSON', default=True)
+
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.FastJSONRenderer' if API_FAST_JSON else 'rest_framework.renderers.JSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser' if API_FAST_JSON else 'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
@@ -200,6 +264,66 @@ CACHES = {
     }
 }
 
+# Ticket stats snapshot TTL in seconds (invalidated early by ticket writes)
+TICKET_STATS_CACHE_TIMEOUT = env.int('TICKET_STATS_CACHE_TIMEOUT', default=60)
+
+# Seconds an ETag on ticket reads stays valid without a change, bounding how
+# long time-dependent fields (is_expired, expiring counts) can be served stale
+TICKET_ETAG_WINDOW = env.int('TICKET_ETAG_WINDOW', default=60)
+
+# Dashboard section cache TTLs in seconds; ticket sections are also retired by
+# ticket writes, activity and system counts only by their TTL
+DASHBOARD_CACHE_TIMEOUT = env.int('DASHBOARD_CACHE_TIMEOUT', default=60)
+DASHBOARD_ACTIVITY_CACHE_TIMEOUT = env.int('DASHBOARD_ACTIVITY_CACHE_TIMEOUT', default=15)
+DASHBOARD_SYSTEM_STATS_CACHE_TIMEOUT = env.int('DASHBOARD_SYSTEM_STATS_CACHE_TIMEOUT', default=60)
+
+# Most expiring tickets listed on the dashboard
+DASHBOARD_EXPIRING_LIMIT = env.int('DASHBOARD_EXPIRING_LIMIT', default=20)
+
+# Build cold dashboard sections on parallel threads (one DB connection each)
+DASHBOARD_CONCURRENT_SECTIONS = env.bool('DASHBOARD_CONCURRENT_SECTIONS', default=False)
+
+# Latest ticket logs embedded in mutation responses; the rest is paginated
+# under the ticket's audit trail
+TICKET_DETAIL_RECENT_LOGS = env.int('TICKET_DETAIL_RECENT_LOGS', default=5)
+
+# Active contractor lookup cache TTL in seconds (invalidated early by User.save)
+USER_LOOKUP_CACHE_TIMEOUT = env.int('USER_LOOKUP_CACHE_TIMEOUT', default=60)
+
+# Authenticated user cache TTL in seconds (invalidated early by User.save)
+USER_AUTH_CACHE_TIMEOUT = env.int('USER_AUTH_CACHE_TIMEOUT', default=60)
+
+# Seconds a SmartLogin temporary session waits for 2FA verification (held in
+# the cache, expired by its TTL)
+LOGIN_TEMP_SESSION_TIMEOUT = env.int('LOGIN_TEMP_SESSION_TIMEOUT', default=300)
+
+# Bulk ticket operations: largest accepted batch, and the size above which
+# a batch runs as a Celery job instead of inside the request
+TICKET_BULK_MAX_ITEMS = env.int('TICKET_BULK_MAX_ITEMS', default=5000)
+TICKET_BULK_ASYNC_THRESHOLD = env.int('TICKET_BULK_ASYNC_THRESHOLD', default=500)
+
+# Seconds a queued bulk job's owner is remembered for status checks
+# (matches Celery's default result expiry)
+TICKET_BULK_JOB_OWNER_TIMEOUT = env.int('TICKET_BULK_JOB_OWNER_TIMEOUT', default=86400)
+
+# Number of expired tickets closed per committed batch
+TICKET_EXPIRATION_BATCH_SIZE = env.int('TICKET_EXPIRATION_BATCH_SIZE', default=1000)
+
+# Log retention windows in days, and batching for the cleanup_old_logs task
+LOG_RETENTION_DAYS = {
+    'user_logs': env.int('USER_LOG_RETENTION_DAYS', default=90),
+    'ticket_logs': env.int('TICKET_LOG_RETENTION_DAYS', default=90),
+}
+LOG_RETENTION_BATCH_SIZE = env.int('LOG_RETENTION_BATCH_SIZE', default=5000)
+LOG_RETENTION_BATCH_SLEEP = env.float('LOG_RETENTION_BATCH_SLEEP', default=0.1)
+
+# Monthly log partitions kept created ahead of the current month
+LOG_PARTITION_MONTHS_AHEAD = env.int('LOG_PARTITION_MONTHS_AHEAD', default=3)
+
+# Hand every audit log flush to the write_audit_logs Celery task instead of
+# writing in-process after commit
+AUDIT_LOG_ASYNC = env.bool('AUDIT_LOG_ASYNC', default=False)
+
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
@@ -0,0 +1,96 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from core.db_routers import PRIMARY_DATABASE, REPLICA_DATABASE, ReplicaPin, ReplicaRouter, use_replica
+from users.cache import ContractorCache, UserAuthCache
+
+User = get_user_model()
+
+
+class TestReplicaRouter:
+    """Test read routing and read-your-writes pinning."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_method(self, settings, monkeypatch):
+        """Configure a replica alias and start from a fresh request."""
+        self.settings = settings
+        self.monkeypatch = monkeypatch
+        monkeypatch.setattr(ReplicaRouter, 'has_replica', staticmethod(lambda: True))
+        settings.REPLICA_PIN_SECONDS = 5
+        self.router = ReplicaRouter()
+        ReplicaPin.start_request()
+        yield
+        ReplicaPin.end_request()
+    
+    def test_reads_use_replica_and_writes_use_primary(self):
+        """Test the default routing with a replica configured."""
+        assert self.router.db_for_read(None) == REPLICA_DATABASE
+        assert self.router.db_for_write(None) == PRIMARY_DATABASE
+        assert self.router.allow_migrate(PRIMARY_DATABASE, 'tickets')
+        assert not self.router.allow_migrate(REPLICA_DATABASE, 'tickets')
+    
+    def test_no_replica_configured(self):
+        """Test every query uses the primary without a replica."""
+        self.monkeypatch.setattr(ReplicaRouter, 'has_replica', staticmethod(lambda: False))
+        
+        assert self.router.db_for_read(None) is None
+        self.router.db_for_write(None)
+        assert not ReplicaPin.is_pinned()
+    
+    def test_write_pins_request_and_user(self):
+        """Test a user's write keeps their next requests on the primary."""
+        ReplicaPin.set_user(1)
+        self.router.db_for_write(None)
+        assert self.router.db_for_read(None) == PRIMARY_DATABASE
+        
+        # The same user's next request is pinned, another user's is not
+        ReplicaPin.end_request()
+        ReplicaPin.start_request()
+        ReplicaPin.set_user(2)
+        assert self.router.db_for_read(None) == REPLICA_DATABASE
+        
+        ReplicaPin.start_request()
+        ReplicaPin.set_user(1)
+        assert self.router.db_for_read(None) == PRIMARY_DATABASE
+    
+    def test_pin_expires(self):
+        """Test the pin only lasts REPLICA_PIN_SECONDS."""
+        self.settings.REPLICA_PIN_SECONDS = 0
+        self.router.db_for_write(None)
+        
+        assert self.router.db_for_read(None) == REPLICA_DATABASE
+    
+    def test_use_replica_ignores_pin(self):
+        """Test reporting reads go to the replica even when pinned."""
+        self.router.db_for_write(None)
+        
+        with use_replica():
+            assert self.router.db_for_read(None) == REPLICA_DATABASE
+        assert self.router.db_for_read(None) == PRIMARY_DATABASE
+    
+    @pytest.mark.django_db
+    def test_reads_in_transaction_use_primary(self):
+        """Test reads inside a transaction on the primary stay on it."""
+        assert self.router.db_for_read(None) == PRIMARY_DATABASE
+    
+    @pytest.mark.django_db
+    def test_user_cache_refills_read_primary(self):
+        """Test a cache miss right after User.save never reads the lagging replica."""
+        user = User.objects.create_user(
+            email='contractor@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        UserAuthCache.get_user(user.id)
+        ContractorCache.get_contractor(user.id)
+        
+        # Route every read to the replica, which has no connection here
+        self.monkeypatch.setattr(
+            ReplicaRouter, 'db_for_read', lambda self, model, **hints: REPLICA_DATABASE
+        )
+        user.first_name = 'Changed'
+        user.save()
+        
+        assert UserAuthCache.get_user(user.id).first_name == 'Changed'
+        assert ContractorCache.get_contractor(user.id).first_name == 'Changed'
+        assert [contractor.first_name for contractor in ContractorCache.get_active_contractors()] == ['Changed']
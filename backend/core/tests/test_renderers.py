@@ -0,0 +1,92 @@
+import io
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core import parsers, renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+class TestFastJSONRenderer:
+    """Test FastJSONRenderer against the stock JSONRenderer."""
+    
+    def get_sample_data(self):
+        now = timezone.now()
+        return {
+            'id': uuid.uuid4(),
+            'created': now,
+            'date': now.date(),
+            'time': now.time(),
+            'duration': timedelta(hours=1, seconds=5),
+            'amount': Decimal('12.50'),
+            'tags': ('a', 'b'),
+            'text': 'Ünïcode   line separator  ',
+            'nested': [{1: 'int key', 'none': None, 'flag': True}],
+        }
+    
+    def test_output_matches_stock_renderer(self):
+        """Test output is byte-for-byte identical to JSONRenderer."""
+        data = self.get_sample_data()
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    def test_indent_and_none(self):
+        """Test indented output and empty bodies match JSONRenderer."""
+        data = self.get_sample_data()
+        media_type = 'application/json; indent=4'
+        
+        assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+        assert FastJSONRenderer().render(None) == b''
+    
+    def test_falls_back_for_oversized_integers(self):
+        """Test values orjson cannot encode go through the stock renderer."""
+        data = {'big': 2 ** 70}
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    def test_falls_back_without_orjson(self, monkeypatch):
+        """Test the renderer works when orjson is not installed."""
+        monkeypatch.setattr(renderers, 'orjson', None)
+        data = self.get_sample_data()
+        
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestFastJSONParser:
+    """Test FastJSONParser against the stock JSONParser."""
+    
+    def parse(self, parser, body, encoding='utf-8'):
+        return parser.parse(io.BytesIO(body), parser_context={'encoding': encoding})
+    
+    def test_parses_same_as_stock_parser(self):
+        """Test parsed data matches JSONParser."""
+        body = '{"organization": "Ünïcode", "ids": [1, 2], "nested": {"ok": true, "none": null}}'.encode()
+        
+        assert self.parse(FastJSONParser(), body) == self.parse(JSONParser(), body)
+    
+    def test_accepts_what_stock_parser_accepts(self):
+        """Test bodies orjson rejects but JSONParser accepts still parse."""
+        body = b'{"value": "\\ud800"}'
+        
+        assert self.parse(FastJSONParser(), body) == self.parse(JSONParser(), body)
+    
+    def test_invalid_json_raises_parse_error(self):
+        """Test malformed bodies raise ParseError."""
+        with pytest.raises(ParseError):
+            self.parse(FastJSONParser(), b'{"organization": ')
+    
+    def test_non_utf8_and_without_orjson(self, monkeypatch):
+        """Test other charsets and a missing orjson use the stock parser."""
+        body = '{"organization": "Ünïcode"}'
+        
+        assert self.parse(FastJSONParser(), body.encode('utf-16'), 'utf-16') == {'organization': 'Ünïcode'}
+        
+        monkeypatch.setattr(parsers, 'orjson', None)
+        assert self.parse(FastJSONParser(), body.encode()) == {'organization': 'Ünïcode'}
@@ -0,0 +1,268 @@
+"""
+Cache helpers for ticket read paths.
+Selectors read through these caches, services invalidate them after writes.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TicketStatsCache:
+    """
+    Cache for per-scope ticket statistics.
+    Admins share a single scope, each contractor has their own.
+    """
+
+    KEY_PREFIX = "tickets:stats"
+    GENERATION_KEY = "tickets:stats:generation"
+
+    @staticmethod
+    def get_timeout():
+        """Get the stats cache TTL in seconds."""
+        return getattr(settings, 'TICKET_STATS_CACHE_TIMEOUT', 60)
+
+    @staticmethod
+    def get_scope(user):
+        """Get the cache scope for a user based on role."""
+        if user.is_admin:
+            return "admin"
+        return f"contractor:{user.id}"
+
+    @staticmethod
+    def _get_generation():
+        """Get the current cache generation, bumped by bulk invalidations."""
+        return cache.get_or_set(TicketStatsCache.GENERATION_KEY, 1, timeout=None)
+
+    @staticmethod
+    def _make_key(scope, generation):
+        return f"{TicketStatsCache.KEY_PREFIX}:{generation}:{scope}"
+
+    @staticmethod
+    def get(user):
+        """
+        Get cached stats for a user's scope.
+        Returns None on a cache miss or if the cache is unavailable.
+        """
+        try:
+            key = TicketStatsCache._make_key(
+                TicketStatsCache.get_scope(user),
+                TicketStatsCache._get_generation()
+            )
+            return cache.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read ticket stats cache: {str(e)}")
+            return None
+
+    @staticmethod
+    def set(user, stats):
+        """Store stats for a user's scope."""
+        try:
+            key = TicketStatsCache._make_key(
+                TicketStatsCache.get_scope(user),
+                TicketStatsCache._get_generation()
+            )
+            cache.set(key, stats, timeout=TicketStatsCache.get_timeout())
+        except Exception as e:
+            logger.warning(f"Failed to write ticket stats cache: {str(e)}")
+
+    @staticmethod
+    def invalidate_for_users(*user_ids):
+        """
+        Invalidate the admin scope and the scopes of the given contractors,
+        and bump their change versions.
+        Call with every user the changed ticket is or was visible to.
+        """
+        scopes = ["admin"] + [
+            f"contractor:{user_id}" for user_id in set(user_ids) if user_id
+        ]
+        try:
+            generation = TicketStatsCache._get_generation()
+            cache.delete_many([
+                TicketStatsCache._make_key(scope, generation) for scope in scopes
+            ])
+        except Exception as e:
+            logger.warning(f"Failed to invalidate ticket stats cache: {str(e)}")
+        
+        TicketChangeVersion.bump(*scopes)
+
+    @staticmethod
+    def invalidate_for_ticket(ticket, *extra_user_ids):
+        """Invalidate every scope that can see a ticket."""
+        TicketStatsCache.invalidate_for_users(
+            ticket.created_by_id,
+            ticket.assigned_contractor_id,
+            *extra_user_ids
+        )
+
+    @staticmethod
+    def invalidate_all():
+        """Invalidate every scope at once, for bulk changes."""
+        try:
+            try:
+                cache.incr(TicketStatsCache.GENERATION_KEY)
+            except ValueError:
+                cache.set(TicketStatsCache.GENERATION_KEY, 2, timeout=None)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate ticket stats cache: {str(e)}")
+        
+        TicketChangeVersion.bump_all()
+
+
+class TicketChangeVersion:
+    """
+    Per-scope change counters used to build ETags for ticket reads.
+    Bumped by TicketStatsCache invalidation, i.e. whenever a ticket visible
+    to the scope changes. Counters start from the current time so a key
+    that was evicted never repeats a value a client may still hold.
+    """
+
+    KEY_PREFIX = "tickets:version"
+    GENERATION_KEY = "tickets:version:generation"
+    TICKET_KEY_PREFIX = "tickets:version:ticket"
+    TICKET_TIMEOUT = 86400
+
+    @staticmethod
+    def _read(key, timeout=None):
+        return cache.get_or_set(key, time.time_ns, timeout=timeout)
+
+    @staticmethod
+    def _incr(key, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=timeout)
+
+    @staticmethod
+    def get(user):
+        """
+        Get the change version for a user's scope.
+        Returns None if the cache is unavailable, in which case callers skip validation.
+        """
+        try:
+            scope = TicketStatsCache.get_scope(user)
+            generation = TicketChangeVersion._read(TicketChangeVersion.GENERATION_KEY)
+            version = TicketChangeVersion._read(f"{TicketChangeVersion.KEY_PREFIX}:{scope}")
+            return f"{generation}.{version}"
+        except Exception as e:
+            logger.warning(f"Failed to read ticket change version: {str(e)}")
+            return None
+
+    @staticmethod
+    def bump(*scopes):
+        """Bump the versions of the given scopes."""
+        try:
+            for scope in scopes:
+                TicketChangeVersion._incr(f"{TicketChangeVersion.KEY_PREFIX}:{scope}")
+        except Exception as e:
+            logger.warning(f"Failed to bump ticket change version: {str(e)}")
+
+    @staticmethod
+    def bump_all():
+        """Bump every scope at once, for bulk changes."""
+        try:
+            TicketChangeVersion._incr(TicketChangeVersion.GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to bump ticket change version: {str(e)}")
+
+    @staticmethod
+    def get_ticket(ticket_id):
+        """
+        Get the log version of a single ticket, bumped whenever its audit logs are written.
+        Returns None if the cache is unavailable, in which case callers skip validation.
+        """
+        try:
+            return TicketChangeVersion._read(
+                f"{TicketChangeVersion.TICKET_KEY_PREFIX}:{ticket_id}",
+                timeout=TicketChangeVersion.TICKET_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read ticket log version: {str(e)}")
+            return None
+
+    @staticmethod
+    def bump_tickets(*ticket_ids):
+        """Bump the log versions of the given tickets."""
+        try:
+            for ticket_id in set(map(str, ticket_ids)):
+                TicketChangeVersion._incr(
+                    f"{TicketChangeVersion.TICKET_KEY_PREFIX}:{ticket_id}",
+                    timeout=TicketChangeVersion.TICKET_TIMEOUT
+                )
+        except Exception as e:
+            logger.warning(f"Failed to bump ticket log version: {str(e)}")
+
+
+class DashboardCache:
+    """
+    Cache for serialized dashboard sections.
+    Keys carry the scope's change version, so ticket writes retire every
+    section built before them; each section also has its own TTL.
+    """
+
+    KEY_PREFIX = "tickets:dashboard"
+
+    @staticmethod
+    def make_key(section, scope, version):
+        return f"{DashboardCache.KEY_PREFIX}:{section}:{scope}:{version}"
+
+    @staticmethod
+    def get_many(keys):
+        """
+        Get cached sections in one round trip.
+        Returns a dict of the keys found, empty if the cache is unavailable.
+        """
+        try:
+            return cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to read dashboard cache: {str(e)}")
+            return {}
+
+    @staticmethod
+    def set(key, data, timeout):
+        """Store a serialized section."""
+        try:
+            cache.set(key, data, timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Failed to write dashboard cache: {str(e)}")
+
+
+class BulkJobCache:
+    """
+    Owners of queued bulk jobs, recorded when the job is queued so its
+    status is only revealed to the user who submitted it.
+    """
+    
+    KEY_PREFIX = "tickets:bulk:job"
+    
+    @staticmethod
+    def get_timeout():
+        """Get the job owner TTL in seconds."""
+        return getattr(settings, 'TICKET_BULK_JOB_OWNER_TIMEOUT', 86400)
+    
+    @staticmethod
+    def _make_key(job_id):
+        return f"{BulkJobCache.KEY_PREFIX}:{job_id}"
+    
+    @staticmethod
+    def set_owner(job_id, user_id):
+        """Record the user who queued a job."""
+        try:
+            cache.set(BulkJobCache._make_key(job_id), user_id, timeout=BulkJobCache.get_timeout())
+        except Exception as e:
+            logger.warning(f"Failed to record bulk job owner: {str(e)}")
+    
+    @staticmethod
+    def get_owner(job_id):
+        """
+        Get the id of the user who queued a job.
+        Returns None for unknown or expired jobs, or if the cache is unavailable.
+        """
+        try:
+            return cache.get(BulkJobCache._make_key(job_id))
+        except Exception as e:
+            logger.warning(f"Failed to read bulk job owner: {str(e)}")
+            return None
@@ -0,0 +1,165 @@
+"""
+Dashboard assembly.
+Each section is built by its own selector call, serialized once and cached
+under its own TTL and invalidation trigger.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from core.db_routers import ReplicaPin
+from users.cache import ContractorCache
+
+from .cache import DashboardCache, TicketChangeVersion, TicketStatsCache
+from .selectors import DashboardSelector, LogSelector, TicketSelector
+from .serializers import (
+    ActivityOutputSerializer,
+    ContractorOutputSerializer,
+    TicketListRowSerializer,
+    TicketStatsOutputSerializer,
+)
+
+
+class DashboardSection:
+    """
+    A dashboard section: a builder returning serialized output keys, plus
+    its caching rules. Sections without a timeout setting are not cached
+    here, because they are served from a cache of their own.
+    """
+
+    def __init__(self, name, build, timeout_setting=None, default_timeout=60, admin_only=False):
+        self.name = name
+        self.build = build
+        self.timeout_setting = timeout_setting
+        self.default_timeout = default_timeout
+        self.admin_only = admin_only
+
+    def get_timeout(self):
+        """Get the section cache TTL in seconds, or None if it is not cached."""
+        if self.timeout_setting is None:
+            return None
+        return getattr(settings, self.timeout_setting, self.default_timeout)
+
+
+class DashboardEngine:
+    """
+    Builds dashboard data from cached sections.
+    Warm sections come back in a single cache round trip; only cold ones run
+    queries, optionally in parallel (DASHBOARD_CONCURRENT_SECTIONS).
+    Ticket-derived sections are keyed by the scope's change version, so any
+    write visible to the user retires them.
+    """
+
+    @staticmethod
+    def get_sections():
+        """Get every dashboard section, in output order."""
+        return [
+            DashboardSection('ticket_stats', DashboardEngine.build_ticket_stats, 'DASHBOARD_CACHE_TIMEOUT'),
+            DashboardSection('tickets', DashboardEngine.build_tickets, 'DASHBOARD_CACHE_TIMEOUT'),
+            DashboardSection(
+                'recent_activity', DashboardEngine.build_recent_activity,
+                'DASHBOARD_ACTIVITY_CACHE_TIMEOUT', default_timeout=15
+            ),
+            # Served from ContractorCache, which User.save invalidates
+            DashboardSection('all_contractors', DashboardEngine.build_contractors, admin_only=True),
+            DashboardSection(
+                'system_stats', DashboardEngine.build_system_stats,
+                'DASHBOARD_SYSTEM_STATS_CACHE_TIMEOUT', admin_only=True
+            ),
+        ]
+
+    @staticmethod
+    def get_dashboard_data_for_user(user):
+        """
+        Get serialized dashboard data based on user role.
+        """
+        sections = [
+            section for section in DashboardEngine.get_sections()
+            if user.is_admin or not section.admin_only
+        ]
+        
+        # Without a version there is nothing to validate entries against
+        version = TicketChangeVersion.get(user)
+        scope = TicketStatsCache.get_scope(user)
+        keys = {}
+        if version is not None:
+            keys = {
+                section.name: DashboardCache.make_key(section.name, scope, version)
+                for section in sections if section.get_timeout()
+            }
+        
+        cached = DashboardCache.get_many(list(keys.values())) if keys else {}
+        section_data = {
+            section.name: cached[keys[section.name]]
+            for section in sections if keys.get(section.name) in cached
+        }
+        
+        missing = [section for section in sections if section.name not in section_data]
+        for section, data in zip(missing, DashboardEngine._build_sections(missing, user)):
+            section_data[section.name] = data
+            if section.name in keys:
+                DashboardCache.set(keys[section.name], data, section.get_timeout())
+        
+        dashboard_data = {}
+        for section in sections:
+            dashboard_data.update(section_data[section.name])
+        return dashboard_data
+
+    @staticmethod
+    def _build_sections(sections, user):
+        """Build sections in order, concurrently if enabled."""
+        if len(sections) < 2 or not getattr(settings, 'DASHBOARD_CONCURRENT_SECTIONS', False):
+            return [section.build(user) for section in sections]
+        
+        # Workers keep the request's read-your-writes pin
+        pinned_until = ReplicaPin.get_pinned_until()
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            return list(executor.map(
+                lambda section: DashboardEngine._build_in_thread(section, user, pinned_until),
+                sections
+            ))
+
+    @staticmethod
+    def _build_in_thread(section, user, pinned_until):
+        """Build a section on a worker thread, closing the thread's connections."""
+        try:
+            ReplicaPin.pin_until(pinned_until)
+            return section.build(user)
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def build_ticket_stats(user):
+        stats = TicketSelector.get_ticket_stats_for_user(user)
+        return {'ticket_stats': TicketStatsOutputSerializer(stats).data}
+
+    @staticmethod
+    def build_tickets(user):
+        now = timezone.now()
+        recent_rows, expiring_rows = DashboardSelector.get_dashboard_ticket_rows(
+            user,
+            TicketListRowSerializer.VALUES_FIELDS,
+            recent_limit=5,
+            expiring_limit=getattr(settings, 'DASHBOARD_EXPIRING_LIMIT', 20)
+        )
+        return {
+            'recent_tickets': TicketListRowSerializer(recent_rows, now=now).data,
+            'expiring_tickets': TicketListRowSerializer(expiring_rows, now=now).data,
+        }
+
+    @staticmethod
+    def build_recent_activity(user):
+        activities = LogSelector.get_recent_activity_for_user(user, limit=10)
+        return {'recent_activity': ActivityOutputSerializer(activities, many=True).data}
+
+    @staticmethod
+    def build_contractors(user):
+        # Already in the database's name collation order
+        contractors = ContractorCache.get_active_contractors()
+        return {'all_contractors': ContractorOutputSerializer(contractors, many=True).data}
+
+    @staticmethod
+    def build_system_stats(user):
+        return {'system_stats': DashboardSelector.get_system_stats()}
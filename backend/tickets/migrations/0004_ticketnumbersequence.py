@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0003_ticket_search_vector_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketNumberSequence",
+            fields=[
+                ("date", models.DateField(primary_key=True, serialize=False)),
+                (
+                    "last_value",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Last ticket sequence number allocated for this day",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "tickets_ticketnumbersequence",
+            },
+        ),
+        # Seed counters from existing ticket numbers so allocation continues
+        # where the old count-based generator left off.
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO tickets_ticketnumbersequence (date, last_value)
+                SELECT
+                    to_date(split_part(ticket_number, '-', 2), 'YYYYMMDD'),
+                    max(split_part(ticket_number, '-', 3)::integer)
+                FROM tickets_ticket
+                WHERE ticket_number ~ '^TKT-[0-9]{8}-[0-9]+$'
+                GROUP BY 1
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,102 @@
+from datetime import date
+
+from django.db import migrations
+from django.utils import timezone
+
+# Log tables rebuilt as monthly range partitions on "timestamp".
+PARTITIONED_TABLES = ["tickets_userlog", "tickets_ticketlog"]
+
+# Partitions created up front beyond the current month.
+MONTHS_AHEAD = 3
+
+
+def add_months(month, months):
+    years, month_index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, month_index + 1, 1)
+
+
+def rebuild_table(cursor, table, partitioned):
+    """
+    Rebuild a log table as a partitioned table (or back to a plain one),
+    carrying over rows, secondary indexes and foreign keys.
+    The primary key of a partitioned table must include the partition key,
+    so it becomes (id, timestamp); Django still treats id as the primary key.
+    """
+    new_table = f"{table}_rebuild"
+
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s",
+        [table, f"{table}_pkey"],
+    )
+    # Index definitions on a partitioned parent are reported as "ON ONLY",
+    # which would not cascade to partitions of the rebuilt table.
+    index_defs = [row[0].replace(" ON ONLY ", " ON ") for row in cursor.fetchall()]
+
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+
+    if partitioned:
+        cursor.execute(
+            f'CREATE TABLE {new_table} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ("timestamp")'
+        )
+
+        cursor.execute(f'SELECT min("timestamp") FROM {table}')
+        oldest = cursor.fetchone()[0] or timezone.now()
+        current_month = timezone.now().date().replace(day=1)
+        month = oldest.date().replace(day=1)
+        while month <= add_months(current_month, MONTHS_AHEAD):
+            cursor.execute(
+                f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {new_table} "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+            )
+            month = add_months(month, 1)
+
+        # Catch-all for rows outside the pre-created months
+        cursor.execute(f"CREATE TABLE {table}_default PARTITION OF {new_table} DEFAULT")
+    else:
+        cursor.execute(
+            f"CREATE TABLE {new_table} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+
+    cursor.execute(f"INSERT INTO {new_table} SELECT * FROM {table}")
+    cursor.execute(f"DROP TABLE {table}")
+    cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+
+    primary_key = '(id, "timestamp")' if partitioned else "(id)"
+    cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY {primary_key}")
+
+    for index_def in index_defs:
+        cursor.execute(index_def)
+
+    for name, definition in foreign_keys:
+        cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+
+
+def partition_log_tables(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            rebuild_table(cursor, table, partitioned=True)
+
+
+def unpartition_log_tables(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            rebuild_table(cursor, table, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0004_ticketnumbersequence"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_log_tables, unpartition_log_tables),
+    ]
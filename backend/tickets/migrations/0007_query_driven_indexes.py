@@ -0,0 +1,62 @@
+# Generated by Django 5.1.15 on 2026-10-17 02:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0006_log_timestamp_default"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ticket",
+            name="tickets_tic_assigne_7d24fe_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="ticketlog",
+            name="tickets_tic_ticket__890f00_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="userlog",
+            name="tickets_use_related_8fd569_idx",
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["assigned_contractor", "status", "-created_date"],
+                name="tickets_tic_assigne_d51840_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["created_by", "status", "-created_date"],
+                name="tickets_tic_created_d82570_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                condition=models.Q(("status", "closed"), _negated=True),
+                fields=["expiration_date"],
+                name="ticket_active_expiration_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticketlog",
+            index=models.Index(
+                fields=["ticket", "-timestamp"], name="tickets_tic_ticket__6db017_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userlog",
+            index=models.Index(
+                fields=["related_ticket", "-timestamp"],
+                name="tickets_use_related_72d7f4_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.15 on 2026-10-17 02:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_ticket_visibility(apps, schema_editor):
+    """One row per ticket for its creator and one for its assignee."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO tickets_ticketvisibility (user_id, ticket_id, created_date, status) "
+            "SELECT created_by_id, id, created_date, status FROM tickets_ticket "
+            "UNION "
+            "SELECT assigned_contractor_id, id, created_date, status FROM tickets_ticket"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0007_query_driven_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketVisibility",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_date", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="visibility",
+                        to="tickets.ticket",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_visibility",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "tickets_ticketvisibility",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "status", "-created_date"],
+                        name="tickets_tic_user_id_c7bdf3_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "ticket"),
+                        name="ticket_visibility_user_ticket_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_ticket_visibility, migrations.RunPython.noop),
+    ]
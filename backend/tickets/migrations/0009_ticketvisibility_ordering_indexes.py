@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-17 03:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tickets", "0008_ticketvisibility"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ticketvisibility",
+            name="tickets_tic_user_id_c7bdf3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="ticketvisibility",
+            index=models.Index(
+                fields=["user", "status", "-created_date", "-ticket"],
+                name="tickets_tic_user_id_06ea5c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticketvisibility",
+            index=models.Index(
+                fields=["user", "-created_date", "-ticket"],
+                name="tickets_tic_user_id_b05f03_idx",
+            ),
+        ),
+    ]
@@ -1,10 +1,30 @@
-from django.db import models
+from django.db import models, connection
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db.models import F, Value
+from django.db.models.functions import Replace
 from django.utils import timezone
 import uuid
 
 User = get_user_model()
 
+# Weighted full-text document for ticket search. The 'simple' configuration
+# skips stemming so prefix queries match as the user types. Ticket number
+# dashes are split out so "0042" is a token rather than the integer "-0042".
+# The same expression backs the GIN index below, so selectors must use it
+# verbatim for the planner to pick the index.
+TICKET_SEARCH_VECTOR = (
+    SearchVector(
+        Replace(F('ticket_number'), Value('-'), Value(' ')),
+        weight='A',
+        config='simple'
+    ) +
+    SearchVector('organization', weight='A', config='simple') +
+    SearchVector('location', weight='B', config='simple') +
+    SearchVector('notes', weight='C', config='simple')
+)
+
 
 class Ticket(models.Model):
     """
@@ -75,10 +95,21 @@ class Ticket(models.Model):
         db_table = "tickets_ticket"
         indexes = [
             models.Index(fields=["status"]),
-            models.Index(fields=["assigned_contractor"]),
             models.Index(fields=["created_date"]),
             models.Index(fields=["expiration_date"]),
             models.Index(fields=["ticket_number"]),
+            GinIndex(TICKET_SEARCH_VECTOR, name="ticket_search_vector_idx"),
+            # Per-assignee and per-creator tickets by status, newest first; these
+            # also serve the two foreign keys (contractor reads go through
+            # TicketVisibility instead)
+            models.Index(fields=["assigned_contractor", "status", "-created_date"]),
+            models.Index(fields=["created_by", "status", "-created_date"]),
+            # Expiring/expired scans only ever look at tickets that are not closed
+            models.Index(
+                fields=["expiration_date"],
+                name="ticket_active_expiration_idx",
+                condition=~models.Q(status="closed"),
+            ),
         ]
         ordering = ['-created_date']
     
@@ -86,25 +117,41 @@ class Ticket(models.Model):
         return f"{self.ticket_number} - {self.organization}"
     
     def save(self, *args, **kwargs):
-        """Override save to generate ticket number if not exists."""
+        """
+        Override save to generate ticket number if not exists,
+        and keep the ticket's visibility rows in step.
+        """
         if not self.ticket_number:
             self.ticket_number = self._generate_ticket_number()
+        
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or TicketVisibility.SOURCE_FIELDS.intersection(update_fields):
+            TicketVisibility.sync([self], prune=not adding)
     
     def _generate_ticket_number(self):
         """Generate unique ticket number in format TKT-YYYYMMDD-XXXX."""
+        return Ticket.generate_ticket_numbers(1)[0]
+    
+    @staticmethod
+    def generate_ticket_numbers(count):
+        """
+        Allocate a block of sequential ticket numbers for today.
+        Uses a per-day counter row, so cost is constant and concurrent
+        creates never receive the same number.
+        """
         today = timezone.now().date()
         date_str = today.strftime('%Y%m%d')
         
-        # Get count of tickets created today
-        today_count = Ticket.objects.filter(
-            created_date__date=today
-        ).count()
-        
-        # Generate sequential number
-        sequence = str(today_count + 1).zfill(4)
+        last_value = TicketNumberSequence.allocate(today, count)
+        first_value = last_value - count + 1
         
-        return f"TKT-{date_str}-{sequence}"
+        return [
+            f"TKT-{date_str}-{str(sequence).zfill(4)}"
+            for sequence in range(first_value, last_value + 1)
+        ]
     
     @property
     def is_expired(self):
@@ -125,6 +172,134 @@ class Ticket(models.Model):
         self.save()
 
 
+class TicketVisibility(models.Model):
+    """
+    Materialized (user, ticket) pairs for contractor-scoped reads.
+    Each ticket has a row for its creator and one for its assignee, carrying
+    the ticket's created_date and status, so contractor lists, stats and log
+    filters read one (user, ...) index range instead of OR-ing two ticket columns.
+    Kept current by Ticket.save and the set-based ticket services.
+    """
+    
+    # Ticket fields the rows are derived from
+    SOURCE_FIELDS = frozenset({'created_by', 'assigned_contractor', 'status', 'created_date'})
+    
+    # The (user, ticket) unique index already leads with user
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='ticket_visibility',
+        db_index=False
+    )
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name='visibility'
+    )
+    created_date = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=Ticket.Status.choices)
+    
+    class Meta:
+        db_table = "tickets_ticketvisibility"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "ticket"], name="ticket_visibility_user_ticket_uniq"),
+        ]
+        # Trailing ticket matches the (created_date, id) list ordering, so
+        # contractor pages are read straight off the index without a sort
+        indexes = [
+            models.Index(fields=["user", "status", "-created_date", "-ticket"]),
+            models.Index(fields=["user", "-created_date", "-ticket"]),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.ticket_id}"
+    
+    @classmethod
+    def sync(cls, tickets, prune=True):
+        """
+        Upsert the rows of saved tickets from their current creator, assignee
+        and status, then drop rows for users who no longer see them.
+        One upsert and one delete however many tickets are passed;
+        prune=False skips the delete for tickets that were just created.
+        """
+        tickets = list(tickets)
+        if not tickets:
+            return
+        
+        cls.objects.bulk_create(
+            [
+                cls(
+                    user_id=user_id,
+                    ticket_id=ticket.id,
+                    created_date=ticket.created_date,
+                    status=ticket.status
+                )
+                for ticket in tickets
+                for user_id in {ticket.created_by_id, ticket.assigned_contractor_id}
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'ticket'],
+            update_fields=['created_date', 'status']
+        )
+        
+        if prune:
+            cls.objects.filter(
+                ticket_id__in=[ticket.id for ticket in tickets]
+            ).exclude(
+                user_id=F('ticket__created_by_id')
+            ).exclude(
+                user_id=F('ticket__assigned_contractor_id')
+            ).delete()
+    
+    @classmethod
+    def sync_ticket_ids(cls, ticket_ids):
+        """Re-derive the rows of tickets changed with a queryset update()."""
+        cls.sync(
+            Ticket.objects.filter(id__in=ticket_ids).only(
+                'id', 'created_by_id', 'assigned_contractor_id', 'created_date', 'status'
+            )
+        )
+
+
+class TicketNumberSequence(models.Model):
+    """
+    Per-day counter backing ticket number allocation.
+    One row per calendar day holds the last sequence number handed out.
+    """
+    
+    date = models.DateField(primary_key=True)
+    last_value = models.PositiveIntegerField(
+        default=0,
+        help_text="Last ticket sequence number allocated for this day"
+    )
+    
+    class Meta:
+        db_table = "tickets_ticketnumbersequence"
+    
+    def __str__(self):
+        return f"{self.date} - {self.last_value}"
+    
+    @classmethod
+    def allocate(cls, date, count=1):
+        """
+        Reserve `count` sequence numbers for a day and return the last one.
+        A single upsert increments the counter atomically; the row lock it takes
+        is held until the surrounding transaction ends.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {cls._meta.db_table} (date, last_value)
+                VALUES (%s, %s)
+                ON CONFLICT (date)
+                DO UPDATE SET last_value = {cls._meta.db_table}.last_value + EXCLUDED.last_value
+                RETURNING last_value
+                """,
+                [date, count]
+            )
+            return cursor.fetchone()[0]
+
+
 class UserLog(models.Model):
     """
     Log model for tracking user actions across the system.
@@ -156,7 +331,7 @@ class UserLog(models.Model):
         choices=Action.choices,
         help_text="Type of action performed"
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     details = models.JSONField(
         default=dict,
         blank=True,
@@ -182,7 +357,8 @@ class UserLog(models.Model):
             models.Index(fields=["user"]),
             models.Index(fields=["action"]),
             models.Index(fields=["timestamp"]),
-            models.Index(fields=["related_ticket"]),
+            # A ticket's history, newest first (audit trail, activity feed)
+            models.Index(fields=["related_ticket", "-timestamp"]),
         ]
         ordering = ['-timestamp']
     
@@ -225,7 +401,7 @@ class TicketLog(models.Model):
         choices=Action.choices,
         help_text="Type of action performed on the ticket"
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     details = models.JSONField(
         default=dict,
         blank=True,
@@ -240,10 +416,11 @@ class TicketLog(models.Model):
     class Meta:
         db_table = "tickets_ticketlog"
         indexes = [
-            models.Index(fields=["ticket"]),
             models.Index(fields=["action_by"]),
             models.Index(fields=["action"]),
             models.Index(fields=["timestamp"]),
+            # A ticket's history, newest first (detail recent logs, audit trail)
+            models.Index(fields=["ticket", "-timestamp"]),
         ]
         ordering = ['-timestamp']
     
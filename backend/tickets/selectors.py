@@ -1,9 +1,17 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Prefetch
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import Q, F, Count, Prefetch, Value, Window, GenericIPAddressField, JSONField
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta
+import base64
+import binascii
+import json
+import re
+import uuid
 
-from .models import Ticket, UserLog, TicketLog
+from .models import Ticket, TicketVisibility, UserLog, TicketLog, TICKET_SEARCH_VECTOR
+from .cache import TicketStatsCache
 
 User = get_user_model()
 
@@ -26,34 +34,55 @@ class TicketSelector:
             'updated_by'
         )
         
-        # Apply role-based filtering
+        # Apply role-based filtering and the status filter
         if user.is_admin:
             # Admins can see all tickets
-            pass
+            if status:
+                queryset = queryset.filter(status=status)
+            ordering = ('-created_date', '-id')
         elif user.is_contractor:
-            # Contractors can see tickets they created or are assigned to
-            queryset = queryset.filter(
-                Q(created_by=user) |
-                Q(assigned_contractor=user)
+            # Contractors can see tickets they created or are assigned to.
+            # Filter and order on the visibility row's copies of status and
+            # created_date, so its (user, status, created_date) index serves
+            # both the WHERE and the ORDER BY ... LIMIT.
+            visibility = {'visibility__user': user}
+            if status:
+                visibility['visibility__status'] = status
+            queryset = queryset.filter(**visibility).annotate(
+                visible_created_date=F('visibility__created_date')
             )
+            ordering = ('-visible_created_date', '-id')
         else:
             # No access for other roles
             return queryset.none()
         
-        # Apply status filter
-        if status:
-            queryset = queryset.filter(status=status)
+        # Apply full-text search, ranked by relevance
+        search_query = TicketSelector.build_search_query(search)
+        if search_query is not None:
+            return queryset.alias(
+                search_document=TICKET_SEARCH_VECTOR,
+                search_rank=SearchRank(TICKET_SEARCH_VECTOR, search_query)
+            ).filter(
+                search_document=search_query
+            ).order_by('-search_rank', *ordering)
         
-        # Apply search filter
-        if search:
-            queryset = queryset.filter(
-                Q(ticket_number__icontains=search) |
-                Q(organization__icontains=search) |
-                Q(location__icontains=search) |
-                Q(notes__icontains=search)
-            )
+        return queryset.order_by(*ordering)
+    
+    @staticmethod
+    def build_search_query(search):
+        """
+        Build a prefix-matching full-text query from free-form search input.
+        Every word must match the start of a token, e.g. "acme wat" finds "ACME Water".
+        """
+        terms = re.findall(r'\w+', search or '')
+        if not terms:
+            return None
         
-        return queryset.order_by('-created_date')
+        return SearchQuery(
+            ' & '.join(f"{term}:*" for term in terms),
+            search_type='raw',
+            config='simple'
+        )
     
     @staticmethod
     def get_ticket_by_id(ticket_id, user):
@@ -83,40 +112,101 @@ class TicketSelector:
         except Ticket.DoesNotExist:
             return None
     
+    @staticmethod
+    def get_ticket_updated_at(ticket_id, user):
+        """
+        Get a ticket's last modification time if it is visible to the user.
+        A single indexed lookup, used to answer conditional requests.
+        """
+        return TicketSelector.get_tickets_for_user(user).filter(
+            id=ticket_id
+        ).values_list('updated_at', flat=True).first()
+    
+    @staticmethod
+    def get_ticket_detail(ticket_id, log_limit=None):
+        """
+        Get a ticket with only its latest logs (as recent_logs) and the total log count.
+        The payload stays the same size however long the ticket's history grows.
+        """
+        ticket = Ticket.objects.select_related(
+            'assigned_contractor',
+            'created_by',
+            'updated_by'
+        ).get(id=ticket_id)
+        return TicketSelector.attach_recent_logs(ticket, log_limit)
+    
+    @staticmethod
+    def attach_recent_logs(ticket, log_limit=None):
+        """
+        Attach the latest logs (as recent_logs) and the total log count to a
+        ticket already in hand, in a single query.
+        """
+        if log_limit is None:
+            log_limit = settings.TICKET_DETAIL_RECENT_LOGS
+        
+        # The window count is taken over every log of the ticket, before the LIMIT
+        recent_logs = list(
+            TicketLog.objects.filter(
+                ticket_id=ticket.id
+            ).select_related('action_by').annotate(
+                total=Window(Count('id'))
+            ).order_by('-timestamp', '-id')[:log_limit]
+        )
+        
+        ticket.recent_logs = recent_logs
+        ticket.log_count = recent_logs[0].total if recent_logs else 0
+        return ticket
+    
     @staticmethod
     def get_ticket_stats_for_user(user):
         """
         Get ticket statistics based on user role.
+        Served from the stats cache when warm, otherwise computed in a single query.
         """
-        # Base queryset based on user role
+        if not (user.is_admin or user.is_contractor):
+            return {}
+        
+        stats = TicketStatsCache.get(user)
+        if stats is None:
+            stats = TicketSelector.compute_ticket_stats_for_user(user)
+            TicketStatsCache.set(user, stats)
+        
+        return stats
+    
+    @staticmethod
+    def compute_ticket_stats_for_user(user):
+        """
+        Compute ticket statistics with one conditional-aggregate query.
+        """
+        # Base queryset based on user role; contractors count statuses
+        # from their visibility rows
         if user.is_admin:
             base_queryset = Ticket.objects.all()
+            status_field = 'status'
         elif user.is_contractor:
-            base_queryset = Ticket.objects.filter(
-                Q(created_by=user) |
-                Q(assigned_contractor=user)
-            )
+            base_queryset = Ticket.objects.filter(visibility__user=user)
+            status_field = 'visibility__status'
         else:
             return {}
         
-        # Calculate statistics
-        stats = {
-            'total': base_queryset.count(),
-            'open': base_queryset.filter(status=Ticket.Status.OPEN).count(),
-            'in_progress': base_queryset.filter(status=Ticket.Status.IN_PROGRESS).count(),
-            'closed': base_queryset.filter(status=Ticket.Status.CLOSED).count(),
-            'expiring_soon': base_queryset.filter(
-                expiration_date__lte=timezone.now() + timedelta(hours=48),
-                expiration_date__gt=timezone.now(),
-                status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
-            ).count(),
-            'expired': base_queryset.filter(
-                expiration_date__lt=timezone.now(),
-                status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
-            ).count()
-        }
+        now = timezone.now()
+        active_statuses = [Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
         
-        return stats
+        return base_queryset.aggregate(
+            total=Count('id'),
+            open=Count('id', filter=Q(**{status_field: Ticket.Status.OPEN})),
+            in_progress=Count('id', filter=Q(**{status_field: Ticket.Status.IN_PROGRESS})),
+            closed=Count('id', filter=Q(**{status_field: Ticket.Status.CLOSED})),
+            expiring_soon=Count('id', filter=Q(
+                expiration_date__lte=now + timedelta(hours=48),
+                expiration_date__gt=now,
+                **{f'{status_field}__in': active_statuses}
+            )),
+            expired=Count('id', filter=Q(
+                expiration_date__lt=now,
+                **{f'{status_field}__in': active_statuses}
+            ))
+        )
     
     @staticmethod
     def get_expiring_tickets_for_user(user, hours=48):
@@ -125,21 +215,23 @@ class TicketSelector:
         """
         cutoff_time = timezone.now() + timedelta(hours=hours)
         
-        # Base queryset based on user role
+        active_statuses = [Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
+        
+        # Base queryset based on user role; contractors narrow to active
+        # tickets on their visibility index first
         if user.is_admin:
-            queryset = Ticket.objects.all()
+            queryset = Ticket.objects.filter(status__in=active_statuses)
         elif user.is_contractor:
             queryset = Ticket.objects.filter(
-                Q(created_by=user) |
-                Q(assigned_contractor=user)
+                visibility__user=user,
+                visibility__status__in=active_statuses
             )
         else:
             return Ticket.objects.none()
         
         return queryset.filter(
             expiration_date__lte=cutoff_time,
-            expiration_date__gt=timezone.now(),
-            status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
+            expiration_date__gt=timezone.now()
         ).select_related('assigned_contractor', 'created_by').order_by('expiration_date')
     
     @staticmethod
@@ -147,13 +239,13 @@ class TicketSelector:
         """
         Get recently created tickets for a user.
         """
-        # Base queryset based on user role
+        # Base queryset based on user role; contractors read newest first
+        # from their visibility index
         if user.is_admin:
-            queryset = Ticket.objects.all()
+            queryset = Ticket.objects.order_by('-created_date')
         elif user.is_contractor:
-            queryset = Ticket.objects.filter(
-                Q(created_by=user) |
-                Q(assigned_contractor=user)
+            queryset = Ticket.objects.filter(visibility__user=user).order_by(
+                '-visibility__created_date'
             )
         else:
             return Ticket.objects.none()
@@ -161,7 +253,7 @@ class TicketSelector:
         return queryset.select_related(
             'assigned_contractor',
             'created_by'
-        ).order_by('-created_date')[:limit]
+        )[:limit]
     
     @staticmethod
     def get_contractors_list():
@@ -180,6 +272,44 @@ class LogSelector:
     Selector for log-related queries with role-based access control.
     """
     
+    @staticmethod
+    def get_visible_ticket_ids(user):
+        """
+        Get the ids of the tickets a contractor created or is assigned to,
+        as a subquery read from the visibility table's user index.
+        """
+        return TicketVisibility.objects.filter(user=user).values('ticket_id')
+    
+    @staticmethod
+    def get_visible_user_logs(user):
+        """
+        Get the unsliced user logs visible to a user.
+        Admins can see all logs, contractors see logs related to tickets they
+        created or are assigned to, plus their own.
+        """
+        if user.is_admin:
+            return UserLog.objects.all()
+        elif user.is_contractor:
+            return UserLog.objects.filter(
+                Q(related_ticket__in=LogSelector.get_visible_ticket_ids(user)) |
+                Q(user=user)  # Also include their own logs
+            )
+        return UserLog.objects.none()
+    
+    @staticmethod
+    def get_visible_ticket_logs(user):
+        """
+        Get the unsliced ticket logs visible to a user.
+        Admins can see all logs, contractors see logs for tickets they created or are assigned to.
+        """
+        if user.is_admin:
+            return TicketLog.objects.all()
+        elif user.is_contractor:
+            return TicketLog.objects.filter(
+                ticket__in=LogSelector.get_visible_ticket_ids(user)
+            )
+        return TicketLog.objects.none()
+    
     @staticmethod
     def get_user_logs_for_user(user, limit=50):
         """
@@ -194,11 +324,7 @@ class LogSelector:
             ).order_by('-timestamp')[:limit]
         elif user.is_contractor:
             # Contractors can see logs related to tickets they created or are assigned to
-            queryset = UserLog.objects.filter(
-                Q(related_ticket__created_by=user) |
-                Q(related_ticket__assigned_contractor=user) |
-                Q(user=user)  # Also include their own logs
-            ).select_related(
+            queryset = LogSelector.get_visible_user_logs(user).select_related(
                 'user',
                 'related_ticket'
             ).order_by('-timestamp')[:limit]
@@ -229,8 +355,7 @@ class LogSelector:
         elif user.is_contractor:
             # Contractors can see logs for tickets they created or are assigned to
             queryset = queryset.filter(
-                Q(ticket__created_by=user) |
-                Q(ticket__assigned_contractor=user)
+                ticket__in=LogSelector.get_visible_ticket_ids(user)
             )
         else:
             return queryset.none()
@@ -240,83 +365,188 @@ class LogSelector:
     @staticmethod
     def get_recent_activity_for_user(user, limit=20):
         """
-        Get recent activity combining user logs and ticket logs.
+        Get the most recent activity combining user logs and ticket logs.
+        """
+        activities, _ = LogSelector.get_activity_feed_for_user(user, limit=limit)
+        return activities
+    
+    @staticmethod
+    def get_activity_feed_for_user(user, limit=20, cursor=None):
         """
+        Get a page of the unified activity stream, newest first.
+        Returns the activities and the cursor for the next page (or None).
+        """
+        columns = ('id', 'type', 'timestamp', 'actor_id', 'action', 'details', 'ticket_ref_id')
+        user_rows = LogSelector.get_visible_user_logs(user).annotate(
+            type=Value('user_log'),
+            actor_id=F('user_id'),
+            ticket_ref_id=F('related_ticket_id')
+        ).values(*columns)
+        ticket_rows = LogSelector.get_visible_ticket_logs(user).annotate(
+            type=Value('ticket_log'),
+            actor_id=F('action_by_id'),
+            ticket_ref_id=F('ticket_id')
+        ).values(*columns)
+        
+        rows, next_cursor = LogSelector._merge_log_rows(user_rows, ticket_rows, limit, cursor)
+        
+        # Resolve actors and tickets for the whole page in two queries
+        users = User.objects.in_bulk({row['actor_id'] for row in rows if row['actor_id']})
+        tickets = Ticket.objects.in_bulk({row['ticket_ref_id'] for row in rows if row['ticket_ref_id']})
+        user_actions = dict(UserLog.Action.choices)
+        ticket_actions = dict(TicketLog.Action.choices)
+        
         activities = []
+        for row in rows:
+            activity = {
+                'id': row['id'],
+                'type': row['type'],
+                'timestamp': row['timestamp'],
+                'user': users.get(row['actor_id']),
+                'details': row['details'],
+            }
+            ticket = tickets.get(row['ticket_ref_id'])
+            if row['type'] == 'user_log':
+                activity['action'] = user_actions.get(row['action'], row['action'])
+                activity['related_ticket'] = ticket
+            else:
+                activity['action'] = ticket_actions.get(row['action'], row['action'])
+                activity['ticket'] = ticket
+            activities.append(activity)
         
-        # Get recent user logs
-        user_logs = LogSelector.get_user_logs_for_user(user, limit=limit//2)
-        for log in user_logs:
-            activities.append({
-                'type': 'user_log',
-                'timestamp': log.timestamp,
-                'user': log.user,
-                'action': log.get_action_display(),
-                'details': log.details,
-                'related_ticket': log.related_ticket
-            })
-        
-        # Get recent ticket logs
-        ticket_logs = LogSelector.get_ticket_logs_for_user(user, limit=limit//2)
-        for log in ticket_logs:
-            activities.append({
-                'type': 'ticket_log',
-                'timestamp': log.timestamp,
-                'user': log.action_by,
-                'action': log.get_action_display(),
-                'details': log.details,
-                'ticket': log.ticket
-            })
-        
-        # Sort by timestamp and limit
-        activities.sort(key=lambda x: x['timestamp'], reverse=True)
-        return activities[:limit]
+        return activities, next_cursor
     
     @staticmethod
-    def get_ticket_audit_trail(ticket_id, user):
+    def get_ticket_audit_trail(ticket_id, user, limit=50, cursor=None):
         """
-        Get complete audit trail for a specific ticket.
+        Get a page of the audit trail for a specific ticket, newest first.
+        Returns the entries and the cursor for the next page,
+        or (None, None) if the ticket does not exist or is not visible to the user.
         """
-        # First check if user can access this ticket
-        ticket = TicketSelector.get_ticket_by_id(ticket_id, user)
-        if not ticket:
-            return []
+        if not LogSelector.can_view_ticket_audit_trail(ticket_id, user):
+            return None, None
         
-        # Get all logs for this ticket
-        ticket_logs = TicketLog.objects.filter(
-            ticket_id=ticket_id
-        ).select_related('action_by').order_by('-timestamp')
+        return LogSelector.get_audit_trail_page(ticket_id, limit, cursor)
+    
+    @staticmethod
+    def can_view_ticket_audit_trail(ticket_id, user):
+        """Check with a single EXISTS query that the ticket is visible to the user."""
+        return TicketSelector.get_tickets_for_user(user).filter(id=ticket_id).exists()
+    
+    @staticmethod
+    def count_ticket_audit_trail(ticket_id):
+        """Count every entry of a ticket's audit trail, from both log tables."""
+        return (
+            UserLog.objects.filter(related_ticket_id=ticket_id).count() +
+            TicketLog.objects.filter(ticket_id=ticket_id).count()
+        )
+    
+    @staticmethod
+    def iter_audit_trail(ticket_id, batch_size=500):
+        """
+        Iterate over the full audit trail for a ticket, one page at a time,
+        without checking access (see can_view_ticket_audit_trail).
+        Only a single page is held in memory, so this is safe to stream.
+        """
+        cursor = None
+        while True:
+            entries, cursor = LogSelector.get_audit_trail_page(ticket_id, batch_size, cursor)
+            if not entries:
+                return
+            yield from entries
+            if not cursor:
+                return
+    
+    @staticmethod
+    def get_audit_trail_page(ticket_id, limit=50, cursor=None):
+        """
+        Get a page of a ticket's audit trail and the cursor for the next page,
+        without checking access.
+        """
+        # Annotated columns keep both branches of the UNION in the same order
+        columns = ('id', 'type', 'timestamp', 'actor_id', 'action', 'details', 'old_values', 'client_ip')
+        ticket_rows = TicketLog.objects.filter(ticket_id=ticket_id).annotate(
+            type=Value('ticket_action'),
+            actor_id=F('action_by_id'),
+            old_values=F('previous_values'),
+            client_ip=Value(None, output_field=GenericIPAddressField())
+        ).values(*columns)
+        user_rows = UserLog.objects.filter(related_ticket_id=ticket_id).annotate(
+            type=Value('user_action'),
+            actor_id=F('user_id'),
+            old_values=Value(None, output_field=JSONField()),
+            client_ip=F('ip_address')
+        ).values(*columns)
+        
+        rows, next_cursor = LogSelector._merge_log_rows(user_rows, ticket_rows, limit, cursor)
         
-        user_logs = UserLog.objects.filter(
-            related_ticket_id=ticket_id
-        ).select_related('user').order_by('-timestamp')
+        users = User.objects.in_bulk({row['actor_id'] for row in rows if row['actor_id']})
+        user_actions = dict(UserLog.Action.choices)
+        ticket_actions = dict(TicketLog.Action.choices)
         
-        # Combine and sort
         audit_trail = []
+        for row in rows:
+            entry = {
+                'type': row['type'],
+                'timestamp': row['timestamp'],
+                'user': users.get(row['actor_id']),
+                'details': row['details'],
+            }
+            if row['type'] == 'ticket_action':
+                entry['action'] = ticket_actions.get(row['action'], row['action'])
+                entry['previous_values'] = row['old_values']
+            else:
+                entry['action'] = user_actions.get(row['action'], row['action'])
+                entry['ip_address'] = row['client_ip']
+            audit_trail.append(entry)
+        
+        return audit_trail, next_cursor
+    
+    @staticmethod
+    def _merge_log_rows(user_rows, ticket_rows, limit, cursor=None):
+        """
+        Merge user and ticket log rows newest first with a single UNION ALL.
+        Both branches are cut to the page size before the merge, so a page
+        costs two index range scans regardless of history length.
+        Returns the rows and the cursor for the next page (or None).
+        """
+        if cursor:
+            timestamp, log_id = LogSelector.decode_log_cursor(cursor)
+            after_cursor = Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=log_id)
+            user_rows = user_rows.filter(after_cursor)
+            ticket_rows = ticket_rows.filter(after_cursor)
+        
+        ordering = ('-timestamp', '-id')
+        rows = list(
+            user_rows.order_by(*ordering)[:limit + 1].union(
+                ticket_rows.order_by(*ordering)[:limit + 1], all=True
+            ).order_by(*ordering)[:limit + 1]
+        )
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = LogSelector.encode_log_cursor(rows[-1]['timestamp'], rows[-1]['id'])
         
-        for log in ticket_logs:
-            audit_trail.append({
-                'type': 'ticket_action',
-                'timestamp': log.timestamp,
-                'user': log.action_by,
-                'action': log.get_action_display(),
-                'details': log.details,
-                'previous_values': log.previous_values
-            })
-        
-        for log in user_logs:
-            audit_trail.append({
-                'type': 'user_action',
-                'timestamp': log.timestamp,
-                'user': log.user,
-                'action': log.get_action_display(),
-                'details': log.details,
-                'ip_address': log.ip_address
-            })
-        
-        # Sort by timestamp
-        audit_trail.sort(key=lambda x: x['timestamp'], reverse=True)
-        return audit_trail
+        return rows, next_cursor
+    
+    @staticmethod
+    def encode_log_cursor(timestamp, log_id):
+        """Encode an opaque log pagination cursor."""
+        position = json.dumps([timestamp.isoformat(), str(log_id)])
+        return base64.urlsafe_b64encode(position.encode()).decode()
+    
+    @staticmethod
+    def decode_log_cursor(cursor):
+        """
+        Decode a log pagination cursor into (timestamp, id).
+        Raises ValueError for a malformed cursor.
+        """
+        try:
+            timestamp, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(timestamp), uuid.UUID(log_id)
+        except (TypeError, ValueError, binascii.Error) as e:
+            raise ValueError(f"Invalid cursor: {str(e)}")
 
 
 class DashboardSelector:
@@ -325,32 +555,52 @@ class DashboardSelector:
     """
     
     @staticmethod
-    def get_dashboard_data_for_user(user):
+    def get_dashboard_ticket_rows(user, values_fields, recent_limit=5, expiring_limit=20, hours=48):
         """
-        Get comprehensive dashboard data based on user role.
+        Get the recent and expiring ticket rows for a user's dashboard in one query.
+        Returns (recent_rows, expiring_rows) as `.values(*values_fields)` dicts.
         """
-        data = {
-            'ticket_stats': TicketSelector.get_ticket_stats_for_user(user),
-            'recent_tickets': TicketSelector.get_recent_tickets_for_user(user, limit=5),
-            'expiring_tickets': TicketSelector.get_expiring_tickets_for_user(user),
-            'recent_activity': LogSelector.get_recent_activity_for_user(user, limit=10)
-        }
+        now = timezone.now()
+        tickets = TicketSelector.get_tickets_for_user(user)
         
-        # Add admin-specific data
-        if user.is_admin:
-            data['all_contractors'] = TicketSelector.get_contractors_list()
-            data['system_stats'] = {
-                'total_users': User.objects.count(),
-                'active_contractors': User.objects.filter(
-                    role=User.Role.CONTRACTOR,
-                    is_active=True
-                ).count(),
-                'total_tickets_today': Ticket.objects.filter(
-                    created_date__date=timezone.now().date()
-                ).count()
-            }
+        # Keep the selector's ordering, which follows the user's index
+        recent = tickets.annotate(section=Value('recent')).values(
+            *values_fields, 'section'
+        )[:recent_limit]
+        expiring = tickets.filter(
+            expiration_date__lte=now + timedelta(hours=hours),
+            expiration_date__gt=now,
+            status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
+        ).annotate(section=Value('expiring')).values(
+            *values_fields, 'section'
+        ).order_by('expiration_date')[:expiring_limit]
+        
+        rows = list(recent.union(expiring, all=True))
         
-        return data
+        # UNION does not keep each branch's ordering
+        recent_rows = sorted(
+            (row for row in rows if row['section'] == 'recent'),
+            key=lambda row: row['created_date'], reverse=True
+        )
+        expiring_rows = sorted(
+            (row for row in rows if row['section'] == 'expiring'),
+            key=lambda row: row['expiration_date']
+        )
+        return recent_rows, expiring_rows
+    
+    @staticmethod
+    def get_system_stats():
+        """
+        Get system-wide counts for the admin dashboard.
+        """
+        stats = User.objects.aggregate(
+            total_users=Count('id'),
+            active_contractors=Count('id', filter=Q(role=User.Role.CONTRACTOR, is_active=True))
+        )
+        stats['total_tickets_today'] = Ticket.objects.filter(
+            created_date__date=timezone.now().date()
+        ).count()
+        return stats
     
     @staticmethod
     def get_ticket_summary_by_status():
@@ -1,7 +1,12 @@
-from rest_framework import serializers
+from django.conf import settings
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from django.utils import timezone
 
+from users.cache import ContractorCache
+
 from .models import Ticket, UserLog, TicketLog
 
 User = get_user_model()
@@ -25,11 +30,9 @@ class TicketCreateInputSerializer(serializers.Serializer):
     
     def validate_assigned_contractor_id(self, value):
         """Validate that the contractor exists and has the correct role."""
-        try:
-            contractor = User.objects.get(id=value, role=User.Role.CONTRACTOR)
-            return value
-        except User.DoesNotExist:
+        if not ContractorCache.get_contractor(value):
             raise serializers.ValidationError("Invalid contractor ID")
+        return value
 
 
 class TicketUpdateInputSerializer(serializers.Serializer):
@@ -61,11 +64,9 @@ class TicketAssignInputSerializer(serializers.Serializer):
     
     def validate_assigned_contractor_id(self, value):
         """Validate that the contractor exists and has the correct role."""
-        try:
-            contractor = User.objects.get(id=value, role=User.Role.CONTRACTOR)
-            return value
-        except User.DoesNotExist:
+        if not ContractorCache.get_contractor(value):
             raise serializers.ValidationError("Invalid contractor ID")
+        return value
 
 
 class TicketCloseInputSerializer(serializers.Serializer):
@@ -74,6 +75,65 @@ class TicketCloseInputSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True)
 
 
+class TicketBulkCreateItemInputSerializer(serializers.Serializer):
+    """
+    Input serializer for one ticket in a bulk create.
+    Contractor and expiration checks run in the service so they are reported per item.
+    """
+    
+    organization = serializers.CharField(max_length=255)
+    location = serializers.CharField(max_length=255)
+    expiration_date = serializers.DateTimeField()
+    notes = serializers.CharField(required=False, allow_blank=True)
+    assigned_contractor_id = serializers.IntegerField()
+
+
+class TicketBulkInputSerializer(serializers.Serializer):
+    """Base input serializer for bulk operations on existing tickets."""
+    
+    ticket_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=settings.TICKET_BULK_MAX_ITEMS
+    )
+    background = serializers.BooleanField(required=False, default=False)
+
+
+class TicketBulkCreateInputSerializer(serializers.Serializer):
+    """Input serializer for bulk ticket creation."""
+    
+    tickets = serializers.ListField(
+        child=TicketBulkCreateItemInputSerializer(),
+        min_length=1,
+        max_length=settings.TICKET_BULK_MAX_ITEMS
+    )
+    background = serializers.BooleanField(required=False, default=False)
+
+
+class TicketBulkAssignInputSerializer(TicketBulkInputSerializer):
+    """Input serializer for bulk ticket assignment."""
+    
+    assigned_contractor_id = serializers.IntegerField()
+    
+    def validate_assigned_contractor_id(self, value):
+        """Validate that the contractor exists and has the correct role."""
+        if not ContractorCache.get_contractor(value):
+            raise serializers.ValidationError("Invalid contractor ID")
+        return value
+
+
+class TicketBulkRenewInputSerializer(TicketBulkInputSerializer):
+    """Input serializer for bulk ticket renewal."""
+    
+    days = serializers.IntegerField(default=15, min_value=1, max_value=365)
+
+
+class TicketBulkCloseInputSerializer(TicketBulkInputSerializer):
+    """Input serializer for bulk ticket closing."""
+    
+    reason = serializers.CharField(required=False, allow_blank=True)
+
+
 # Output Serializers
 class UserBasicOutputSerializer(serializers.ModelSerializer):
     """Basic user information for ticket-related responses."""
@@ -142,6 +202,42 @@ class TicketOutputSerializer(serializers.ModelSerializer):
         ]
 
 
+class TicketRecentLogOutputSerializer(serializers.ModelSerializer):
+    """Output serializer for log entries embedded in a ticket detail."""
+    
+    action_by = UserBasicOutputSerializer(read_only=True)
+    action_display = serializers.CharField(source='get_action_display', read_only=True)
+    
+    class Meta:
+        model = TicketLog
+        fields = [
+            'id', 'action', 'action_display', 'timestamp', 
+            'details', 'previous_values', 'action_by'
+        ]
+
+
+class TicketDetailOutputSerializer(TicketOutputSerializer):
+    """
+    Output serializer for tickets with a bounded history.
+    Expects a ticket prepared by TicketSelector.attach_recent_logs.
+    """
+    
+    ticket_logs = None
+    recent_logs = TicketRecentLogOutputSerializer(many=True, read_only=True)
+    log_count = serializers.IntegerField(read_only=True)
+    history_url = serializers.SerializerMethodField()
+    
+    class Meta(TicketOutputSerializer.Meta):
+        fields = [
+            field for field in TicketOutputSerializer.Meta.fields if field != 'ticket_logs'
+        ] + ['recent_logs', 'log_count', 'history_url']
+    
+    def get_history_url(self, obj):
+        url = reverse('tickets:ticket-audit', kwargs={'ticket_id': obj.id})
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
 class TicketListOutputSerializer(serializers.ModelSerializer):
     """Simplified output serializer for ticket lists."""
     
@@ -160,6 +256,94 @@ class TicketListOutputSerializer(serializers.ModelSerializer):
         ]
 
 
+class TicketListRowSerializer:
+    """
+    Read-only fast path for TicketListOutputSerializer.
+    Builds list rows straight from `.values(*VALUES_FIELDS)` dicts with a
+    single captured "now", producing the same JSON as the DRF serializer
+    without per-field machinery or model instances.
+    """
+    
+    # (output key, values() column) pairs matching UserBasicOutputSerializer
+    USER_COLUMNS = {
+        'assigned_contractor': tuple(
+            (field, f'assigned_contractor__{field}') for field in UserBasicOutputSerializer.Meta.fields
+        ),
+        'created_by': tuple(
+            (field, f'created_by__{field}') for field in UserBasicOutputSerializer.Meta.fields
+        ),
+    }
+    VALUES_FIELDS = (
+        'id', 'ticket_number', 'organization', 'location', 'status',
+        'created_date', 'expiration_date',
+    ) + tuple(column for columns in USER_COLUMNS.values() for _, column in columns)
+    
+    # Fallback formatter for non-ISO DATETIME_FORMAT or USE_TZ = False
+    datetime_field = serializers.DateTimeField()
+    
+    def __init__(self, rows, now=None):
+        self.rows = rows
+        self.now = now
+    
+    @staticmethod
+    def get_queryset(tickets):
+        """
+        Reduce a ticket queryset to the columns a list row needs, keeping its
+        annotations, e.g. the ordering key cursor pagination reads.
+        """
+        return tickets.values(*TicketListRowSerializer.VALUES_FIELDS, *tickets.query.annotation_select)
+    
+    @property
+    def data(self):
+        now = self.now or timezone.now()
+        expiring_soon_before = now + timezone.timedelta(hours=48)
+        status_labels = {value: str(label) for value, label in Ticket.Status.choices}
+        format_datetime = self._get_datetime_formatter()
+        
+        data = []
+        for row in self.rows:
+            expiration_date = row['expiration_date']
+            data.append({
+                'id': str(row['id']),
+                'ticket_number': row['ticket_number'],
+                'organization': row['organization'],
+                'location': row['location'],
+                'status': row['status'],
+                'status_display': status_labels.get(row['status'], row['status']),
+                'created_date': format_datetime(row['created_date']),
+                'expiration_date': format_datetime(expiration_date),
+                'is_expired': now > expiration_date,
+                'is_expiring_soon': expiration_date <= expiring_soon_before,
+                'assigned_contractor': self._user(row, 'assigned_contractor'),
+                'created_by': self._user(row, 'created_by'),
+            })
+        return data
+    
+    def _get_datetime_formatter(self):
+        """
+        Get a formatter matching DateTimeField output, resolving the format and
+        timezone once per page instead of once per value.
+        """
+        output_format = getattr(self.datetime_field, 'format', api_settings.DATETIME_FORMAT)
+        field_timezone = self.datetime_field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return self.datetime_field.to_representation
+        
+        def format_datetime(value):
+            value = value.astimezone(field_timezone).isoformat()
+            if value.endswith('+00:00'):
+                value = value[:-6] + 'Z'
+            return value
+        
+        return format_datetime
+    
+    def _user(self, row, relation):
+        columns = self.USER_COLUMNS[relation]
+        if row[columns[0][1]] is None:
+            return None
+        return {field: row[column] for field, column in columns}
+
+
 class TicketStatsOutputSerializer(serializers.Serializer):
     """Output serializer for ticket statistics."""
     
@@ -189,7 +373,7 @@ class ActivityOutputSerializer(serializers.Serializer):
     
     type = serializers.CharField()
     timestamp = serializers.DateTimeField()
-    user = UserBasicOutputSerializer()
+    user = UserBasicOutputSerializer(allow_null=True)
     action = serializers.CharField()
     details = serializers.JSONField()
     related_ticket = serializers.CharField(required=False)
@@ -208,17 +392,6 @@ class AuditTrailOutputSerializer(serializers.Serializer):
     ip_address = serializers.IPAddressField(required=False)
 
 
-class DashboardDataOutputSerializer(serializers.Serializer):
-    """Output serializer for dashboard data."""
-    
-    ticket_stats = TicketStatsOutputSerializer()
-    recent_tickets = TicketListOutputSerializer(many=True)
-    expiring_tickets = TicketListOutputSerializer(many=True)
-    recent_activity = ActivityOutputSerializer(many=True)
-    all_contractors = ContractorOutputSerializer(many=True, required=False)
-    system_stats = serializers.JSONField(required=False)
-
-
 # Response Serializers
 class MessageOutputSerializer(serializers.Serializer):
     """Generic message response serializer."""
@@ -236,21 +409,21 @@ class TicketCreateOutputSerializer(serializers.Serializer):
     """Response serializer for ticket creation."""
     
     message = serializers.CharField()
-    ticket = TicketOutputSerializer()
+    ticket = TicketDetailOutputSerializer()
 
 
 class TicketUpdateOutputSerializer(serializers.Serializer):
     """Response serializer for ticket updates."""
     
     message = serializers.CharField()
-    ticket = TicketOutputSerializer()
+    ticket = TicketDetailOutputSerializer()
 
 
 class TicketRenewOutputSerializer(serializers.Serializer):
     """Response serializer for ticket renewal."""
     
     message = serializers.CharField()
-    ticket = TicketOutputSerializer()
+    ticket = TicketDetailOutputSerializer()
     days_extended = serializers.IntegerField()
     new_expiration_date = serializers.DateTimeField()
 
@@ -259,7 +432,7 @@ class TicketAssignOutputSerializer(serializers.Serializer):
     """Response serializer for ticket assignment."""
     
     message = serializers.CharField()
-    ticket = TicketOutputSerializer()
+    ticket = TicketDetailOutputSerializer()
     previous_assignee = UserBasicOutputSerializer()
     new_assignee = UserBasicOutputSerializer()
 
@@ -273,6 +446,52 @@ class TicketListResponseSerializer(serializers.Serializer):
     results = TicketListOutputSerializer(many=True)
 
 
+class ActivityFeedResponseSerializer(serializers.Serializer):
+    """Response serializer for the keyset-paginated activity feed."""
+    
+    next = serializers.URLField(allow_null=True)
+    results = ActivityOutputSerializer(many=True)
+
+
+class AuditTrailResponseSerializer(serializers.Serializer):
+    """Response serializer for a page of a ticket audit trail."""
+    
+    count = serializers.IntegerField()
+    next = serializers.URLField(allow_null=True)
+    results = AuditTrailOutputSerializer(many=True)
+
+
+class TicketBulkResultOutputSerializer(serializers.Serializer):
+    """Output serializer for one item of a bulk operation."""
+    
+    index = serializers.IntegerField()
+    ticket_id = serializers.CharField(allow_null=True)
+    ticket_number = serializers.CharField(allow_null=True)
+    success = serializers.BooleanField()
+    error = serializers.CharField(allow_null=True)
+
+
+class TicketBulkOutputSerializer(serializers.Serializer):
+    """Response serializer for bulk operations."""
+    
+    succeeded = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    results = TicketBulkResultOutputSerializer(many=True)
+
+
+class TicketBulkJobOutputSerializer(serializers.Serializer):
+    """Response serializer for bulk operations running as a Celery job."""
+    
+    job_id = serializers.CharField()
+    status = serializers.CharField()
+    status_url = serializers.URLField(required=False)
+    operation = serializers.CharField(required=False)
+    succeeded = serializers.IntegerField(required=False)
+    failed = serializers.IntegerField(required=False)
+    results = TicketBulkResultOutputSerializer(many=True, required=False)
+    error = serializers.CharField(required=False)
+
+
 class LogListResponseSerializer(serializers.Serializer):
     """Response serializer for log lists."""
     
@@ -290,26 +509,23 @@ class TicketFilterInputSerializer(serializers.Serializer):
     created_by = serializers.UUIDField(required=False)
     expiring_soon = serializers.BooleanField(required=False)
     expired = serializers.BooleanField(required=False)
+    pagination = serializers.ChoiceField(choices=['page', 'cursor'], required=False)
+    cursor = serializers.CharField(required=False)
     
     def validate_assigned_contractor(self, value):
         """Validate contractor exists."""
-        if value:
-            try:
-                User.objects.get(id=value, role=User.Role.CONTRACTOR)
-                return value
-            except User.DoesNotExist:
-                raise serializers.ValidationError("Invalid contractor ID")
+        if value and not ContractorCache.get_contractor(value):
+            raise serializers.ValidationError("Invalid contractor ID")
         return value
     
-    def validate_created_by(self, value):
-        """Validate creator exists."""
-        if value:
-            try:
-                User.objects.get(id=value)
-                return value
-            except User.DoesNotExist:
-                raise serializers.ValidationError("Invalid user ID")
-        return value
+    def validate(self, attrs):
+        """
+        Reject search in cursor mode: keyset pagination orders by
+        (created_date, id) and would drop the relevance ranking.
+        """
+        if attrs.get('search') and (attrs.get('pagination') == 'cursor' or attrs.get('cursor')):
+            raise serializers.ValidationError("Search results cannot be cursor paginated")
+        return attrs
 
 
 class LogFilterInputSerializer(serializers.Serializer):
@@ -321,26 +537,6 @@ class LogFilterInputSerializer(serializers.Serializer):
     start_date = serializers.DateTimeField(required=False)
     end_date = serializers.DateTimeField(required=False)
     
-    def validate_user(self, value):
-        """Validate user exists."""
-        if value:
-            try:
-                User.objects.get(id=value)
-                return value
-            except User.DoesNotExist:
-                raise serializers.ValidationError("Invalid user ID")
-        return value
-    
-    def validate_ticket(self, value):
-        """Validate ticket exists."""
-        if value:
-            try:
-                Ticket.objects.get(id=value)
-                return value
-            except Ticket.DoesNotExist:
-                raise serializers.ValidationError("Invalid ticket ID")
-        return value
-    
     def validate(self, data):
         """Validate date range."""
         start_date = data.get('start_date')
@@ -350,3 +546,18 @@ class LogFilterInputSerializer(serializers.Serializer):
             raise serializers.ValidationError("Start date must be before end date")
         
         return data
+
+
+class ActivityFeedInputSerializer(serializers.Serializer):
+    """Input serializer for activity feed pagination."""
+    
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=100, default=20)
+    cursor = serializers.CharField(required=False)
+
+
+class AuditTrailInputSerializer(serializers.Serializer):
+    """Input serializer for audit trail pagination and streaming."""
+    
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=500, default=50)
+    cursor = serializers.CharField(required=False)
+    stream = serializers.BooleanField(required=False, default=False)
@@ -1,15 +1,31 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError, PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
 from django.utils import timezone
-from django.db import transaction
-from datetime import timedelta
+from django.utils.dateparse import parse_datetime
+from django.db import transaction, connection
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from contextlib import contextmanager
+from functools import partial
+import json
 import logging
+import re
+import threading
+import time
 
-from .models import Ticket, UserLog, TicketLog
+from users.cache import ContractorCache
+
+from .models import Ticket, UserLog, TicketLog, TicketVisibility
+from .cache import TicketChangeVersion, TicketStatsCache
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Per-thread handle on the audit buffer of the LoggingService.atomic() block in progress
+_audit_state = threading.local()
+
 
 class TicketPermissionService:
     """
@@ -84,44 +100,353 @@ class TicketPermissionService:
         return False
 
 
+class AuditLogBuffer:
+    """
+    Audit log entries queued during a LoggingService.atomic() block and written
+    together once it commits.
+    A failed write is handed to the write_audit_logs Celery task for retry.
+    """
+    
+    def __init__(self):
+        self.user_logs = []
+        self.ticket_logs = []
+    
+    def flush(self):
+        """Write every queued entry with one bulk INSERT per log table."""
+        if not (self.user_logs or self.ticket_logs):
+            return
+        
+        if getattr(settings, 'AUDIT_LOG_ASYNC', False):
+            AuditLogBuffer.hand_off(self.user_logs, self.ticket_logs)
+            return
+        
+        try:
+            AuditLogBuffer.write(self.user_logs, self.ticket_logs)
+        except Exception as e:
+            logger.error(f"Failed to flush audit logs, handing off to worker: {str(e)}")
+            AuditLogBuffer.hand_off(self.user_logs, self.ticket_logs)
+    
+    @staticmethod
+    @transaction.atomic
+    def write(user_logs, ticket_logs):
+        """
+        Bulk insert audit log entries given as field dicts.
+        Bumps the log version of every ticket involved once the rows commit,
+        so ticket detail validators change even when logs land after the ticket write.
+        """
+        UserLog.objects.bulk_create([UserLog(**entry) for entry in user_logs])
+        TicketLog.objects.bulk_create([TicketLog(**entry) for entry in ticket_logs])
+        
+        for entry in user_logs:
+            logger.info(f"User action logged: user {entry['user_id']} - {entry['action']}")
+        for entry in ticket_logs:
+            logger.info(
+                f"Ticket action logged: ticket {entry['ticket_id']} - {entry['action']} "
+                f"by {entry['action_by_id'] or 'system'}"
+            )
+        
+        ticket_ids = [entry['ticket_id'] for entry in ticket_logs]
+        ticket_ids += [entry['related_ticket_id'] for entry in user_logs if entry.get('related_ticket_id')]
+        if ticket_ids:
+            transaction.on_commit(partial(TicketChangeVersion.bump_tickets, *ticket_ids))
+        
+        logger.info(f"Audit logs written: {len(user_logs)} user, {len(ticket_logs)} ticket")
+    
+    @staticmethod
+    def hand_off(user_logs, ticket_logs):
+        """
+        Queue entries for the Celery batch writer.
+        If the broker is unreachable too, the entries are logged in full so
+        they can still be replayed.
+        """
+        from .tasks import write_audit_logs
+        
+        payload = json.loads(json.dumps(
+            {'user_logs': user_logs, 'ticket_logs': ticket_logs},
+            cls=DjangoJSONEncoder
+        ))
+        try:
+            write_audit_logs.delay(payload)
+        except Exception as e:
+            logger.critical(f"Failed to queue audit logs ({str(e)}): {json.dumps(payload)}")
+
+
 class LoggingService:
     """
     Service for logging user actions and ticket changes.
+    Inside LoggingService.atomic() entries are buffered and bulk written once
+    the block commits, so a rolled back change leaves no audit rows behind.
     """
     
+    @staticmethod
+    @contextmanager
+    def atomic():
+        """
+        transaction.atomic() that buffers the audit entries queued inside it.
+        The outermost block registers one on_commit flush for its buffer,
+        a nested block that rolls back discards the entries queued inside it.
+        """
+        buffer = getattr(_audit_state, 'buffer', None)
+        with transaction.atomic():
+            if buffer is None:
+                buffer = _audit_state.buffer = AuditLogBuffer()
+                # Discarded by Django along with the block if it rolls back
+                transaction.on_commit(buffer.flush)
+                try:
+                    yield
+                finally:
+                    _audit_state.buffer = None
+                return
+            
+            marks = (len(buffer.user_logs), len(buffer.ticket_logs))
+            try:
+                yield
+            except Exception:
+                del buffer.user_logs[marks[0]:]
+                del buffer.ticket_logs[marks[1]:]
+                raise
+    
+    @staticmethod
+    def _enqueue(log_list_name, entry):
+        buffer = getattr(_audit_state, 'buffer', None)
+        if buffer is None:
+            # Outside LoggingService.atomic() each entry is written on commit
+            # of the current transaction, or right away in autocommit
+            buffer = AuditLogBuffer()
+            getattr(buffer, log_list_name).append(entry)
+            transaction.on_commit(buffer.flush)
+            return
+        
+        getattr(buffer, log_list_name).append(entry)
+    
     @staticmethod
     def log_user_action(user, action, details=None, related_ticket=None, ip_address=None):
         """
         Log a user action with optional ticket relation.
         """
-        try:
-            UserLog.objects.create(
-                user=user,
-                action=action,
-                details=details or {},
-                related_ticket=related_ticket,
-                ip_address=ip_address
-            )
-            logger.info(f"User action logged: {user.email} - {action}")
-        except Exception as e:
-            logger.error(f"Failed to log user action: {str(e)}")
+        LoggingService._enqueue('user_logs', {
+            'user_id': user.id,
+            'action': action,
+            'details': details or {},
+            'related_ticket_id': related_ticket.id if related_ticket else None,
+            'ip_address': ip_address,
+            'timestamp': timezone.now(),
+        })
     
     @staticmethod
     def log_ticket_action(ticket, action_by, action, details=None, previous_values=None):
         """
         Log a ticket action with before/after values.
         """
-        try:
-            TicketLog.objects.create(
-                ticket=ticket,
-                action_by=action_by,
-                action=action,
-                details=details or {},
-                previous_values=previous_values or {}
+        LoggingService._enqueue('ticket_logs', {
+            'ticket_id': ticket.id,
+            'action_by_id': action_by.id if action_by else None,
+            'action': action,
+            'details': details or {},
+            'previous_values': previous_values or {},
+            'timestamp': timezone.now(),
+        })
+
+
+class LogPartitionService:
+    """
+    Service for managing the monthly range partitions of the log tables.
+    Partitions are named <table>_pYYYYMM and cover one UTC calendar month.
+    """
+    
+    PARTITION_SUFFIX = re.compile(r'_p(\d{4})(\d{2})$')
+    
+    @staticmethod
+    def add_months(month, months):
+        """Get the first day of the month `months` after `month`."""
+        years, month_index = divmod(month.month - 1 + months, 12)
+        return date(month.year + years, month_index + 1, 1)
+    
+    @staticmethod
+    def get_month_bounds(month):
+        """Get the [start, end) datetimes of a month partition."""
+        start = datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc)
+        next_month = LogPartitionService.add_months(month, 1)
+        end = datetime(next_month.year, next_month.month, 1, tzinfo=dt_timezone.utc)
+        return start, end
+    
+    @staticmethod
+    def get_partitions(table):
+        """
+        Get the monthly partitions of a table as {partition_name: first_day_of_month}.
+        The default partition is not included.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                """,
+                [table]
             )
-            logger.info(f"Ticket action logged: {ticket.ticket_number} - {action} by {action_by.email}")
-        except Exception as e:
-            logger.error(f"Failed to log ticket action: {str(e)}")
+            names = [row[0] for row in cursor.fetchall()]
+        
+        partitions = {}
+        for name in names:
+            match = LogPartitionService.PARTITION_SUFFIX.search(name)
+            if match:
+                partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+        return partitions
+    
+    @staticmethod
+    @transaction.atomic
+    def create_partition(table, month):
+        """
+        Create the partition for a month and attach it.
+        Rows that already landed in the default partition for that month are
+        moved into the new partition first, otherwise the attach would fail.
+        """
+        name = f"{table}_p{month:%Y%m}"
+        start, end = LogPartitionService.get_month_bounds(month)
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {table}_default
+                    WHERE "timestamp" >= %s AND "timestamp" < %s
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """,
+                [start, end]
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)",
+                [start, end]
+            )
+        
+        logger.info(f"Log partition created: {name}")
+        return name
+    
+    @staticmethod
+    def ensure_partitions(months_ahead=None):
+        """
+        Create any missing partitions from the current month up to
+        `months_ahead` months in the future for every log table.
+        Returns the names of the partitions created.
+        """
+        if months_ahead is None:
+            months_ahead = getattr(settings, 'LOG_PARTITION_MONTHS_AHEAD', 3)
+        
+        current_month = timezone.now().date().replace(day=1)
+        created = []
+        
+        for model in (UserLog, TicketLog):
+            table = model._meta.db_table
+            existing = set(LogPartitionService.get_partitions(table).values())
+            
+            for offset in range(months_ahead + 1):
+                month = LogPartitionService.add_months(current_month, offset)
+                if month not in existing:
+                    created.append(LogPartitionService.create_partition(table, month))
+        
+        return created
+    
+    @staticmethod
+    def drop_partitions_before(table, cutoff):
+        """
+        Drop every monthly partition whose whole range is older than `cutoff`.
+        Returns the names of the partitions dropped.
+        """
+        dropped = []
+        
+        for name, month in sorted(LogPartitionService.get_partitions(table).items()):
+            _, end = LogPartitionService.get_month_bounds(month)
+            if end > cutoff:
+                continue
+            
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE {name}")
+            
+            logger.info(f"Log partition dropped: {name}")
+            dropped.append(name)
+        
+        return dropped
+
+
+class LogRetentionService:
+    """
+    Service for purging old log entries in bounded, lock-friendly batches.
+    """
+    
+    LOG_MODELS = {
+        'user_logs': UserLog,
+        'ticket_logs': TicketLog,
+    }
+    
+    @staticmethod
+    def get_retention_days(log_type):
+        """Get the configured retention window in days for a log type."""
+        retention = getattr(settings, 'LOG_RETENTION_DAYS', {})
+        return retention.get(log_type, 90)
+    
+    @staticmethod
+    def purge_logs(log_type, batch_size=None, sleep_seconds=None):
+        """
+        Delete logs older than the retention window for a log type.
+        Monthly partitions entirely past the cutoff are dropped outright. The
+        remainder is deleted in batches, each a single DELETE of the oldest rows
+        by primary key, with a pause between batches so concurrent writers are
+        never blocked for long. Returns deletion counts and throughput.
+        """
+        model = LogRetentionService.LOG_MODELS[log_type]
+        batch_size = batch_size or getattr(settings, 'LOG_RETENTION_BATCH_SIZE', 5000)
+        if sleep_seconds is None:
+            sleep_seconds = getattr(settings, 'LOG_RETENTION_BATCH_SLEEP', 0.1)
+        
+        cutoff = timezone.now() - timedelta(days=LogRetentionService.get_retention_days(log_type))
+        partitions_dropped = LogPartitionService.drop_partitions_before(
+            model._meta.db_table,
+            cutoff
+        )
+        deleted = 0
+        batches = 0
+        started = time.monotonic()
+        
+        while True:
+            oldest_ids = model.objects.filter(
+                timestamp__lt=cutoff
+            ).order_by('timestamp').values('id')[:batch_size]
+            
+            batch_deleted = model.objects.filter(id__in=oldest_ids).delete()[0]
+            if not batch_deleted:
+                break
+            
+            deleted += batch_deleted
+            batches += 1
+            
+            if batch_deleted < batch_size:
+                break
+            
+            time.sleep(sleep_seconds)
+        
+        elapsed = time.monotonic() - started
+        rows_per_second = round(deleted / elapsed, 1) if elapsed else 0.0
+        
+        logger.info(
+            f"Purged {deleted} {log_type} older than {cutoff.isoformat()} "
+            f"in {batches} batches ({rows_per_second} rows/s), "
+            f"dropped {len(partitions_dropped)} partitions"
+        )
+        return {
+            'deleted': deleted,
+            'partitions_dropped': partitions_dropped,
+            'batches': batches,
+            'seconds': round(elapsed, 3),
+            'rows_per_second': rows_per_second,
+        }
 
 
 class TicketService:
@@ -130,7 +455,22 @@ class TicketService:
     """
     
     @staticmethod
-    @transaction.atomic
+    def get_ticket_for_update(ticket_id):
+        """
+        Fetch and row-lock a ticket for a mutation, with the users needed by
+        permission checks and responses joined in the same query.
+        Concurrent mutations of the same ticket wait on the lock instead of
+        overwriting each other. Must be called inside a transaction.
+        Raises Ticket.DoesNotExist if the ticket does not exist.
+        """
+        return Ticket.objects.select_for_update(of=('self',)).select_related(
+            'assigned_contractor',
+            'created_by',
+            'updated_by'
+        ).get(id=ticket_id)
+    
+    @staticmethod
+    @LoggingService.atomic()
     def create_ticket(created_by, assigned_contractor_id, organization, location, 
                      expiration_date, notes="", ip_address=None):
         """
@@ -139,12 +479,8 @@ class TicketService:
         if not TicketPermissionService.can_create_ticket(created_by):
             raise PermissionDenied("You don't have permission to create tickets")
         
-        try:
-            assigned_contractor = User.objects.get(
-                id=assigned_contractor_id, 
-                role=User.Role.CONTRACTOR
-            )
-        except User.DoesNotExist:
+        assigned_contractor = ContractorCache.get_contractor(assigned_contractor_id)
+        if not assigned_contractor:
             raise ValidationError("Invalid contractor assignment")
         
         if expiration_date <= timezone.now():
@@ -185,19 +521,18 @@ class TicketService:
             }
         )
         
+        transaction.on_commit(lambda: TicketStatsCache.invalidate_for_ticket(ticket))
+        
         logger.info(f"Ticket created: {ticket.ticket_number} by {created_by.email}")
         return ticket
     
     @staticmethod
-    @transaction.atomic
+    @LoggingService.atomic()
     def update_ticket(ticket_id, updated_by, **update_data):
         """
         Update a ticket with change tracking and logging.
         """
-        try:
-            ticket = Ticket.objects.get(id=ticket_id)
-        except Ticket.DoesNotExist:
-            raise ValidationError("Ticket not found")
+        ticket = TicketService.get_ticket_for_update(ticket_id)
         
         if not TicketPermissionService.can_update_ticket(updated_by, ticket):
             raise PermissionDenied("You don't have permission to update this ticket")
@@ -276,20 +611,19 @@ class TicketService:
                 previous_values=previous_values
             )
             
+            transaction.on_commit(lambda: TicketStatsCache.invalidate_for_ticket(ticket))
+            
             logger.info(f"Ticket updated: {ticket.ticket_number} by {updated_by.email}")
         
         return ticket
     
     @staticmethod
-    @transaction.atomic
+    @LoggingService.atomic()
     def close_ticket(ticket_id, closed_by, reason=None, ip_address=None):
         """
         Close a ticket with logging.
         """
-        try:
-            ticket = Ticket.objects.get(id=ticket_id)
-        except Ticket.DoesNotExist:
-            raise ValidationError("Ticket not found")
+        ticket = TicketService.get_ticket_for_update(ticket_id)
         
         if not TicketPermissionService.can_update_ticket(closed_by, ticket):
             raise PermissionDenied("You don't have permission to close this ticket")
@@ -324,19 +658,18 @@ class TicketService:
             previous_values={"status": previous_status}
         )
         
+        transaction.on_commit(lambda: TicketStatsCache.invalidate_for_ticket(ticket))
+        
         logger.info(f"Ticket closed: {ticket.ticket_number} by {closed_by.email}")
         return ticket
     
     @staticmethod
-    @transaction.atomic
+    @LoggingService.atomic()
     def renew_ticket(ticket_id, renewed_by, days=15, ip_address=None):
         """
         Renew a ticket by extending expiration date.
         """
-        try:
-            ticket = Ticket.objects.get(id=ticket_id)
-        except Ticket.DoesNotExist:
-            raise ValidationError("Ticket not found")
+        ticket = TicketService.get_ticket_for_update(ticket_id)
         
         if not TicketPermissionService.can_renew_ticket(renewed_by, ticket):
             raise PermissionDenied("You don't have permission to renew this ticket")
@@ -370,32 +703,28 @@ class TicketService:
             previous_values={"expiration_date": previous_expiration.isoformat()}
         )
         
+        transaction.on_commit(lambda: TicketStatsCache.invalidate_for_ticket(ticket))
+        
         logger.info(f"Ticket renewed: {ticket.ticket_number} by {renewed_by.email} (+{days} days)")
         return ticket
     
     @staticmethod
-    @transaction.atomic
+    @LoggingService.atomic()
     def assign_ticket(ticket_id, assigned_to_id, assigned_by, ip_address=None):
         """
         Assign a ticket to a contractor.
+        The returned ticket carries the replaced contractor as previous_assignee.
         """
-        try:
-            ticket = Ticket.objects.get(id=ticket_id)
-        except Ticket.DoesNotExist:
-            raise ValidationError("Ticket not found")
-        
         if not TicketPermissionService.can_assign_ticket(assigned_by):
             raise PermissionDenied("You don't have permission to assign tickets")
         
-        try:
-            new_assignee = User.objects.get(
-                id=assigned_to_id,
-                role=User.Role.CONTRACTOR
-            )
-        except User.DoesNotExist:
+        new_assignee = ContractorCache.get_contractor(assigned_to_id)
+        if not new_assignee:
             raise ValidationError("Invalid contractor for assignment")
         
+        ticket = TicketService.get_ticket_for_update(ticket_id)
         previous_assignee = ticket.assigned_contractor
+        ticket.previous_assignee = previous_assignee
         
         if previous_assignee == new_assignee:
             raise ValidationError("Ticket is already assigned to this contractor")
@@ -425,10 +754,344 @@ class TicketService:
             previous_values={"assigned_contractor": previous_assignee.email}
         )
         
+        transaction.on_commit(
+            lambda: TicketStatsCache.invalidate_for_ticket(ticket, previous_assignee.id)
+        )
+        
         logger.info(f"Ticket assigned: {ticket.ticket_number} to {new_assignee.email} by {assigned_by.email}")
         return ticket
 
 
+class TicketBulkService:
+    """
+    Set-based ticket operations for dispatchers acting on many tickets at once.
+    Each call checks the whole set up front, applies the change in one statement,
+    queues the audit logs for a single bulk insert on commit, and reports a
+    result per requested item.
+    """
+    
+    OPERATIONS = ('create', 'assign', 'renew', 'close')
+    
+    @staticmethod
+    def run(operation, user, params, ip_address=None):
+        """
+        Run a bulk operation from validated (or JSON round-tripped) input.
+        Used by the bulk endpoints and the run_bulk_ticket_operation task.
+        """
+        if operation == 'create':
+            return TicketBulkService.bulk_create_tickets(user, params['tickets'], ip_address=ip_address)
+        if operation == 'assign':
+            return TicketBulkService.bulk_assign_tickets(
+                params['ticket_ids'], params['assigned_contractor_id'], user, ip_address=ip_address
+            )
+        if operation == 'renew':
+            return TicketBulkService.bulk_renew_tickets(
+                params['ticket_ids'], user, days=params.get('days', 15), ip_address=ip_address
+            )
+        if operation == 'close':
+            return TicketBulkService.bulk_close_tickets(
+                params['ticket_ids'], user, reason=params.get('reason'), ip_address=ip_address
+            )
+        raise ValidationError(f"Unknown bulk operation: {operation}")
+    
+    @staticmethod
+    def _lock_tickets(ticket_ids):
+        """
+        Lock the requested tickets, in id order so that concurrent bulk calls
+        over overlapping sets cannot deadlock. Returns a dict keyed by str(id).
+        """
+        tickets = Ticket.objects.select_for_update(of=('self',)).select_related(
+            'assigned_contractor',
+            'created_by'
+        ).filter(id__in=ticket_ids).order_by('id')
+        return {str(ticket.id): ticket for ticket in tickets}
+    
+    @staticmethod
+    def _summarize(results):
+        succeeded = sum(1 for result in results if result['success'])
+        return {
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'results': results
+        }
+    
+    @staticmethod
+    def _result(index, ticket=None, ticket_id=None, error=None):
+        return {
+            'index': index,
+            'ticket_id': str(ticket.id) if ticket else ticket_id,
+            'ticket_number': ticket.ticket_number if ticket else None,
+            'success': error is None,
+            'error': error
+        }
+    
+    @staticmethod
+    def _apply(ticket_ids, check):
+        """
+        Lock the requested tickets and run check(ticket) on each one.
+        check returns an error message, or None if the ticket can be changed.
+        Returns the results in request order and the tickets to change.
+        """
+        requested_ids = list(dict.fromkeys(str(ticket_id) for ticket_id in ticket_ids))
+        tickets = TicketBulkService._lock_tickets(requested_ids)
+        
+        results = []
+        to_change = []
+        for index, ticket_id in enumerate(requested_ids):
+            ticket = tickets.get(ticket_id)
+            if not ticket:
+                results.append(TicketBulkService._result(index, ticket_id=ticket_id, error="Ticket not found"))
+                continue
+            error = check(ticket)
+            results.append(TicketBulkService._result(index, ticket=ticket, error=error))
+            if not error:
+                to_change.append(ticket)
+        
+        return results, to_change
+    
+    @staticmethod
+    @LoggingService.atomic()
+    def bulk_create_tickets(created_by, tickets, ip_address=None):
+        """
+        Create many tickets with one block of ticket numbers and one INSERT.
+        Items that fail validation are reported and skipped.
+        """
+        if not TicketPermissionService.can_create_ticket(created_by):
+            raise PermissionDenied("You don't have permission to create tickets")
+        
+        now = timezone.now()
+        results = []
+        valid_items = []
+        for index, item in enumerate(tickets):
+            contractor = ContractorCache.get_contractor(item['assigned_contractor_id'])
+            expiration_date = item['expiration_date']
+            if isinstance(expiration_date, str):
+                expiration_date = parse_datetime(expiration_date)
+            
+            if not contractor:
+                error = "Invalid contractor assignment"
+            elif not expiration_date or expiration_date <= now:
+                error = "Expiration date must be in the future"
+            else:
+                error = None
+                valid_items.append((index, item, contractor, expiration_date))
+            results.append(TicketBulkService._result(index, error=error))
+        
+        ticket_numbers = Ticket.generate_ticket_numbers(len(valid_items)) if valid_items else []
+        new_tickets = Ticket.objects.bulk_create([
+            Ticket(
+                ticket_number=ticket_number,
+                organization=item['organization'],
+                location=item['location'],
+                expiration_date=expiration_date,
+                notes=item.get('notes', ''),
+                assigned_contractor=contractor,
+                created_by=created_by,
+                updated_by=created_by
+            )
+            for ticket_number, (_, item, contractor, expiration_date) in zip(ticket_numbers, valid_items)
+        ])
+        TicketVisibility.sync(new_tickets, prune=False)
+        
+        for ticket, (index, item, contractor, expiration_date) in zip(new_tickets, valid_items):
+            results[index] = TicketBulkService._result(index, ticket=ticket)
+            LoggingService.log_user_action(
+                user=created_by,
+                action=UserLog.Action.TICKET_CREATED,
+                details={
+                    "ticket_id": str(ticket.id),
+                    "ticket_number": ticket.ticket_number,
+                    "organization": ticket.organization,
+                    "assigned_to": contractor.email,
+                    "bulk": True
+                },
+                related_ticket=ticket,
+                ip_address=ip_address
+            )
+            LoggingService.log_ticket_action(
+                ticket=ticket,
+                action_by=created_by,
+                action=TicketLog.Action.CREATED,
+                details={
+                    "organization": ticket.organization,
+                    "location": ticket.location,
+                    "assigned_contractor": contractor.email,
+                    "expiration_date": expiration_date.isoformat()
+                }
+            )
+        
+        if new_tickets:
+            transaction.on_commit(TicketStatsCache.invalidate_all)
+        
+        logger.info(f"Bulk created {len(new_tickets)} of {len(tickets)} tickets by {created_by.email}")
+        return TicketBulkService._summarize(results)
+    
+    @staticmethod
+    @LoggingService.atomic()
+    def bulk_assign_tickets(ticket_ids, assigned_to_id, assigned_by, ip_address=None):
+        """
+        Assign many tickets to one contractor with a single UPDATE.
+        """
+        if not TicketPermissionService.can_assign_ticket(assigned_by):
+            raise PermissionDenied("You don't have permission to assign tickets")
+        
+        new_assignee = ContractorCache.get_contractor(assigned_to_id)
+        if not new_assignee:
+            raise ValidationError("Invalid contractor for assignment")
+        
+        def check(ticket):
+            if ticket.assigned_contractor_id == new_assignee.id:
+                return "Ticket is already assigned to this contractor"
+            return None
+        
+        results, tickets = TicketBulkService._apply(ticket_ids, check)
+        if tickets:
+            ticket_ids = [ticket.id for ticket in tickets]
+            Ticket.objects.filter(id__in=ticket_ids).update(
+                assigned_contractor=new_assignee,
+                updated_by=assigned_by,
+                updated_at=timezone.now()
+            )
+            TicketVisibility.sync_ticket_ids(ticket_ids)
+        
+        for ticket in tickets:
+            previous_assignee = ticket.assigned_contractor
+            LoggingService.log_user_action(
+                user=assigned_by,
+                action=UserLog.Action.TICKET_ASSIGNED,
+                details={
+                    "ticket_id": str(ticket.id),
+                    "ticket_number": ticket.ticket_number,
+                    "previous_assignee": previous_assignee.email,
+                    "new_assignee": new_assignee.email,
+                    "bulk": True
+                },
+                related_ticket=ticket,
+                ip_address=ip_address
+            )
+            LoggingService.log_ticket_action(
+                ticket=ticket,
+                action_by=assigned_by,
+                action=TicketLog.Action.ASSIGNED,
+                details={"new_assignee": new_assignee.email},
+                previous_values={"assigned_contractor": previous_assignee.email}
+            )
+        
+        if tickets:
+            transaction.on_commit(TicketStatsCache.invalidate_all)
+        
+        logger.info(f"Bulk assigned {len(tickets)} tickets to {new_assignee.email} by {assigned_by.email}")
+        return TicketBulkService._summarize(results)
+    
+    @staticmethod
+    @LoggingService.atomic()
+    def bulk_renew_tickets(ticket_ids, renewed_by, days=15, ip_address=None):
+        """
+        Extend the expiration of many tickets with a single UPDATE.
+        """
+        def check(ticket):
+            if not TicketPermissionService.can_renew_ticket(renewed_by, ticket):
+                return "You don't have permission to renew this ticket"
+            return None
+        
+        results, tickets = TicketBulkService._apply(ticket_ids, check)
+        extension = timedelta(days=days)
+        if tickets:
+            Ticket.objects.filter(id__in=[ticket.id for ticket in tickets]).update(
+                expiration_date=F('expiration_date') + extension,
+                updated_by=renewed_by,
+                updated_at=timezone.now()
+            )
+        
+        for ticket in tickets:
+            # Rows are locked, so the fetched expiration is the one being extended
+            previous_expiration = ticket.expiration_date
+            new_expiration = previous_expiration + extension
+            LoggingService.log_user_action(
+                user=renewed_by,
+                action=UserLog.Action.TICKET_RENEWED,
+                details={
+                    "ticket_id": str(ticket.id),
+                    "ticket_number": ticket.ticket_number,
+                    "days_extended": days,
+                    "previous_expiration": previous_expiration.isoformat(),
+                    "new_expiration": new_expiration.isoformat(),
+                    "bulk": True
+                },
+                related_ticket=ticket,
+                ip_address=ip_address
+            )
+            LoggingService.log_ticket_action(
+                ticket=ticket,
+                action_by=renewed_by,
+                action=TicketLog.Action.RENEWED,
+                details={
+                    "days_extended": days,
+                    "new_expiration": new_expiration.isoformat()
+                },
+                previous_values={"expiration_date": previous_expiration.isoformat()}
+            )
+        
+        if tickets:
+            transaction.on_commit(TicketStatsCache.invalidate_all)
+        
+        logger.info(f"Bulk renewed {len(tickets)} tickets by {renewed_by.email} (+{days} days)")
+        return TicketBulkService._summarize(results)
+    
+    @staticmethod
+    @LoggingService.atomic()
+    def bulk_close_tickets(ticket_ids, closed_by, reason=None, ip_address=None):
+        """
+        Close many tickets with a single UPDATE.
+        """
+        def check(ticket):
+            if not TicketPermissionService.can_update_ticket(closed_by, ticket):
+                return "You don't have permission to close this ticket"
+            if ticket.status == Ticket.Status.CLOSED:
+                return "Ticket is already closed"
+            return None
+        
+        results, tickets = TicketBulkService._apply(ticket_ids, check)
+        if tickets:
+            ticket_ids = [ticket.id for ticket in tickets]
+            Ticket.objects.filter(id__in=ticket_ids).update(
+                status=Ticket.Status.CLOSED,
+                updated_by=closed_by,
+                updated_at=timezone.now()
+            )
+            TicketVisibility.objects.filter(ticket_id__in=ticket_ids).update(
+                status=Ticket.Status.CLOSED
+            )
+        
+        for ticket in tickets:
+            LoggingService.log_user_action(
+                user=closed_by,
+                action=UserLog.Action.TICKET_CLOSED,
+                details={
+                    "ticket_id": str(ticket.id),
+                    "ticket_number": ticket.ticket_number,
+                    "reason": reason,
+                    "previous_status": ticket.status,
+                    "bulk": True
+                },
+                related_ticket=ticket,
+                ip_address=ip_address
+            )
+            LoggingService.log_ticket_action(
+                ticket=ticket,
+                action_by=closed_by,
+                action=TicketLog.Action.CLOSED,
+                details={"reason": reason},
+                previous_values={"status": ticket.status}
+            )
+        
+        if tickets:
+            transaction.on_commit(TicketStatsCache.invalidate_all)
+        
+        logger.info(f"Bulk closed {len(tickets)} tickets by {closed_by.email}")
+        return TicketBulkService._summarize(results)
+
+
 class ExpirationService:
     """
     Service for handling ticket expiration checks and alerts.
@@ -479,29 +1142,71 @@ class ExpirationService:
         return len(expiring_tickets)
     
     @staticmethod
-    @transaction.atomic
-    def mark_expired_tickets():
+    def mark_expired_tickets(batch_size=None, progress_callback=None):
         """
-        Automatically mark expired tickets and log the action.
+        Automatically close expired tickets and log the action.
+        Works in chunks that each commit on their own, so a run interrupted
+        partway through can simply be restarted to close the remainder.
         """
-        expired_tickets = ExpirationService.get_expired_tickets()
+        batch_size = batch_size or getattr(settings, 'TICKET_EXPIRATION_BATCH_SIZE', 1000)
+        cutoff = timezone.now()
         updated_count = 0
         
-        for ticket in expired_tickets:
-            previous_status = ticket.status
+        while True:
+            closed_count = ExpirationService._close_expired_batch(cutoff, batch_size)
+            if not closed_count:
+                break
             
-            ticket.status = Ticket.Status.CLOSED
-            ticket.save()
+            updated_count += closed_count
+            transaction.on_commit(TicketStatsCache.invalidate_all)
             
-            LoggingService.log_ticket_action(
-                ticket=ticket,
+            logger.info(f"Expired tickets batch closed: {closed_count} ({updated_count} total)")
+            if progress_callback:
+                progress_callback(updated_count)
+            
+            if closed_count < batch_size:
+                break
+        
+        return updated_count
+    
+    @staticmethod
+    @LoggingService.atomic()
+    def _close_expired_batch(cutoff, batch_size):
+        """
+        Close one chunk of expired tickets and bulk insert their logs.
+        Rows already locked by another worker are skipped rather than waited on.
+        """
+        batch = list(
+            Ticket.objects.filter(
+                expiration_date__lt=cutoff,
+                status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
+            ).order_by(
+                'expiration_date'
+            ).select_for_update(
+                skip_locked=True
+            ).values_list('id', 'status')[:batch_size]
+        )
+        if not batch:
+            return 0
+        
+        ticket_ids = [ticket_id for ticket_id, _ in batch]
+        Ticket.objects.filter(id__in=ticket_ids).update(
+            status=Ticket.Status.CLOSED,
+            updated_at=timezone.now()
+        )
+        TicketVisibility.objects.filter(ticket_id__in=ticket_ids).update(
+            status=Ticket.Status.CLOSED
+        )
+        
+        TicketLog.objects.bulk_create([
+            TicketLog(
+                ticket_id=ticket_id,
                 action_by=None,
                 action=TicketLog.Action.CLOSED,
                 details={"reason": "Automatically closed due to expiration"},
                 previous_values={"status": previous_status}
             )
-            
-            logger.info(f"Ticket automatically expired: {ticket.ticket_number}")
-            updated_count += 1
+            for ticket_id, previous_status in batch
+        ])
         
-        return updated_count
+        return len(batch)
@@ -1,8 +1,11 @@
 from celery import shared_task
 from django.utils import timezone
+import json
 import logging
 
-from .services import ExpirationService
+from core.db_routers import use_replica
+
+from .services import ExpirationService, TicketBulkService
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +38,29 @@ def check_expiring_tickets():
         }
 
 
-@shared_task
-def mark_expired_tickets():
+@shared_task(bind=True)
+def mark_expired_tickets(self, batch_size=None):
     """
     Celery task to automatically mark expired tickets as closed.
-    Runs daily to clean up expired tickets.
+    Runs daily to clean up expired tickets in committed batches,
+    reporting progress through the task state.
     """
     try:
         logger.info("Starting expired tickets cleanup...")
         
+        def report_progress(closed_so_far):
+            if not self.request.id:
+                return
+            self.update_state(
+                state='PROGRESS',
+                meta={'tickets_expired': closed_so_far}
+            )
+        
         # Mark expired tickets
-        updated_count = ExpirationService.mark_expired_tickets()
+        updated_count = ExpirationService.mark_expired_tickets(
+            batch_size=batch_size,
+            progress_callback=report_progress
+        )
         
         logger.info(f"Expired tickets cleanup completed. {updated_count} tickets marked as expired.")
         return {
@@ -64,38 +79,103 @@ def mark_expired_tickets():
 
 
 @shared_task
-def cleanup_old_logs():
+def run_bulk_ticket_operation(operation, user_id, params, ip_address=None):
+    """
+    Celery task to run a large bulk ticket operation outside the request.
+    The per-item results are kept in the task result for the submitting user.
+    """
+    from django.contrib.auth import get_user_model
+    
+    try:
+        user = get_user_model().objects.get(id=user_id)
+        logger.info(f"Starting bulk {operation} for user {user.email}...")
+        
+        summary = TicketBulkService.run(operation, user, params, ip_address=ip_address)
+        
+        logger.info(f"Bulk {operation} completed. {summary['succeeded']} succeeded, {summary['failed']} failed.")
+        return {
+            'status': 'success',
+            'operation': operation,
+            'user_id': user_id,
+            **summary,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in run_bulk_ticket_operation task: {str(e)}")
+        return {
+            'status': 'error',
+            'operation': operation,
+            'user_id': user_id,
+            'error': str(e),
+            'timestamp': timezone.now().isoformat()
+        }
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=30)
+def write_audit_logs(self, payload):
+    """
+    Celery task to bulk write buffered audit log entries.
+    Receives entries whose in-request flush failed (or every flush when
+    AUDIT_LOG_ASYNC is enabled) and retries until they are stored.
+    """
+    from .services import AuditLogBuffer
+    
+    try:
+        AuditLogBuffer.write(payload['user_logs'], payload['ticket_logs'])
+        return {
+            'status': 'success',
+            'user_logs_written': len(payload['user_logs']),
+            'ticket_logs_written': len(payload['ticket_logs']),
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        if self.request.retries >= self.max_retries:
+            logger.critical(f"Giving up on audit logs ({str(e)}): {json.dumps(payload)}")
+        else:
+            logger.error(f"Error in write_audit_logs task, retrying: {str(e)}")
+        raise self.retry(exc=e)
+
+
+@shared_task
+def cleanup_old_logs(batch_size=None, sleep_seconds=None):
     """
     Celery task to clean up old log entries.
-    Runs weekly to remove logs older than 90 days.
+    Runs weekly to remove logs older than each log type's retention window
+    (LOG_RETENTION_DAYS, 90 days by default). Expired monthly partitions are
+    dropped, the remaining rows are deleted in bounded batches.
     """
     try:
-        from datetime import timedelta
-        from .models import UserLog, TicketLog
+        from .services import LogRetentionService
         
         logger.info("Starting old logs cleanup...")
         
-        # Calculate cutoff date (90 days ago)
-        cutoff_date = timezone.now() - timedelta(days=90)
-        
         # Delete old user logs
-        user_logs_deleted = UserLog.objects.filter(
-            timestamp__lt=cutoff_date
-        ).delete()[0]
+        user_logs = LogRetentionService.purge_logs(
+            'user_logs',
+            batch_size=batch_size,
+            sleep_seconds=sleep_seconds
+        )
         
         # Delete old ticket logs
-        ticket_logs_deleted = TicketLog.objects.filter(
-            timestamp__lt=cutoff_date
-        ).delete()[0]
+        ticket_logs = LogRetentionService.purge_logs(
+            'ticket_logs',
+            batch_size=batch_size,
+            sleep_seconds=sleep_seconds
+        )
         
-        total_deleted = user_logs_deleted + ticket_logs_deleted
+        total_deleted = user_logs['deleted'] + ticket_logs['deleted']
         
         logger.info(f"Old logs cleanup completed. {total_deleted} log entries deleted.")
         return {
             'status': 'success',
-            'user_logs_deleted': user_logs_deleted,
-            'ticket_logs_deleted': ticket_logs_deleted,
+            'user_logs_deleted': user_logs['deleted'],
+            'ticket_logs_deleted': ticket_logs['deleted'],
             'total_deleted': total_deleted,
+            'partitions_dropped': user_logs['partitions_dropped'] + ticket_logs['partitions_dropped'],
+            'user_logs': user_logs,
+            'ticket_logs': ticket_logs,
             'timestamp': timezone.now().isoformat()
         }
         
@@ -108,6 +188,35 @@ def cleanup_old_logs():
         }
 
 
+@shared_task
+def create_log_partitions(months_ahead=None):
+    """
+    Celery task to create upcoming monthly partitions for the log tables.
+    Runs daily so partitions always exist ahead of incoming log rows.
+    """
+    try:
+        from .services import LogPartitionService
+        
+        logger.info("Starting log partition maintenance...")
+        
+        created = LogPartitionService.ensure_partitions(months_ahead=months_ahead)
+        
+        logger.info(f"Log partition maintenance completed. {len(created)} partitions created.")
+        return {
+            'status': 'success',
+            'partitions_created': created,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in create_log_partitions task: {str(e)}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'timestamp': timezone.now().isoformat()
+        }
+
+
 @shared_task
 def generate_ticket_reports():
     """
@@ -122,9 +231,10 @@ def generate_ticket_reports():
         
         logger.info("Starting ticket reports generation...")
         
-        # Get summary statistics
-        status_summary = list(DashboardSelector.get_ticket_summary_by_status())
-        contractor_summary = list(DashboardSelector.get_ticket_summary_by_contractor())
+        # Get summary statistics, never loading the primary
+        with use_replica():
+            status_summary = list(DashboardSelector.get_ticket_summary_by_status())
+            contractor_summary = list(DashboardSelector.get_ticket_summary_by_contractor())
         
         # Log summary to console (can be extended to email/database)
         logger.info("=== DAILY TICKET REPORT ===")
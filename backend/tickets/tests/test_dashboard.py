@@ -0,0 +1,133 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+
+from tickets.dashboard import DashboardEngine
+from tickets.models import Ticket
+from tickets.services import TicketService
+
+User = get_user_model()
+
+
+def create_dashboard_data():
+    admin_user = User.objects.create_user(
+        email='admin@test.com',
+        password='testpass123',
+        first_name='Admin',
+        last_name='User',
+        role=User.Role.ADMIN
+    )
+    contractor = User.objects.create_user(
+        email='contractor@test.com',
+        password='testpass123',
+        first_name='John',
+        last_name='Contractor',
+        role=User.Role.CONTRACTOR
+    )
+    tickets = [
+        Ticket.objects.create(
+            organization=f'Test Org {index}',
+            location='Test Location',
+            assigned_contractor=contractor,
+            created_by=admin_user,
+            updated_by=admin_user,
+            expiration_date=timezone.now() + expires_in
+        )
+        for index, expires_in in enumerate([
+            timedelta(hours=30), timedelta(days=10), timedelta(hours=6), -timedelta(hours=1)
+        ])
+    ]
+    return admin_user, contractor, tickets
+
+
+@pytest.mark.django_db
+class TestDashboardEngine:
+    """Test cases for cached dashboard assembly."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user, self.contractor, self.tickets = create_dashboard_data()
+
+    def test_dashboard_sections(self):
+        """Test every section is present with the expected content."""
+        data = DashboardEngine.get_dashboard_data_for_user(self.admin_user)
+        
+        assert list(data) == [
+            'ticket_stats', 'recent_tickets', 'expiring_tickets', 'recent_activity',
+            'all_contractors', 'system_stats'
+        ]
+        assert data['ticket_stats']['total'] == 4
+        assert [ticket['id'] for ticket in data['recent_tickets']] == [
+            str(ticket.id) for ticket in reversed(self.tickets)
+        ]
+        assert [ticket['id'] for ticket in data['expiring_tickets']] == [
+            str(self.tickets[2].id), str(self.tickets[0].id)
+        ]
+        assert [contractor['email'] for contractor in data['all_contractors']] == ['contractor@test.com']
+        assert data['system_stats'] == {
+            'total_users': 2, 'active_contractors': 1, 'total_tickets_today': 4
+        }
+
+    def test_contractor_dashboard_omits_admin_sections(self):
+        """Test contractors only get their own sections."""
+        data = DashboardEngine.get_dashboard_data_for_user(self.contractor)
+        
+        assert 'all_contractors' not in data
+        assert 'system_stats' not in data
+        assert data['ticket_stats']['total'] == 4
+
+    def test_contractors_keep_database_name_order(self):
+        """Test the contractor section follows the database's collation, not Python's."""
+        for index, first_name in enumerate(['bob', 'Alice', 'alice', 'Carol']):
+            User.objects.create_user(
+                email=f'contractor{index}@test.com',
+                password='testpass123',
+                first_name=first_name,
+                last_name='Contractor',
+                role=User.Role.CONTRACTOR
+            )
+
+        data = DashboardEngine.get_dashboard_data_for_user(self.admin_user)
+
+        assert [contractor['email'] for contractor in data['all_contractors']] == list(
+            User.objects.filter(role=User.Role.CONTRACTOR, is_active=True)
+            .order_by('first_name', 'last_name')
+            .values_list('email', flat=True)
+        )
+
+    def test_warm_dashboard_runs_no_queries(self, django_assert_max_num_queries, django_assert_num_queries):
+        """Test a cold dashboard runs a handful of queries and a warm one none."""
+        with django_assert_max_num_queries(8):
+            cold = DashboardEngine.get_dashboard_data_for_user(self.admin_user)
+        
+        with django_assert_num_queries(0):
+            warm = DashboardEngine.get_dashboard_data_for_user(self.admin_user)
+        
+        assert warm == cold
+
+    def test_ticket_changes_retire_sections(self, django_capture_on_commit_callbacks):
+        """Test that a ticket write visible to the user rebuilds ticket sections."""
+        DashboardEngine.get_dashboard_data_for_user(self.contractor)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            TicketService.close_ticket(self.tickets[0].id, self.admin_user)
+        
+        data = DashboardEngine.get_dashboard_data_for_user(self.contractor)
+        assert data['ticket_stats']['closed'] == 1
+        assert str(self.tickets[0].id) not in [ticket['id'] for ticket in data['expiring_tickets']]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_sections_match_sequential(settings):
+    """Test that building sections on threads gives the same dashboard."""
+    admin_user, _, _ = create_dashboard_data()
+    sequential = DashboardEngine.get_dashboard_data_for_user(admin_user)
+    
+    settings.DASHBOARD_CONCURRENT_SECTIONS = True
+    settings.DASHBOARD_CACHE_TIMEOUT = 0
+    settings.DASHBOARD_ACTIVITY_CACHE_TIMEOUT = 0
+    settings.DASHBOARD_SYSTEM_STATS_CACHE_TIMEOUT = 0
+    
+    assert DashboardEngine.get_dashboard_data_for_user(admin_user) == sequential
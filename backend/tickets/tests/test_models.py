@@ -3,8 +3,10 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection
 
-from ..models import Ticket, UserLog, TicketLog
+from ..models import Ticket, UserLog, TicketLog, TicketNumberSequence, TicketVisibility
 
 User = get_user_model()
 
@@ -209,6 +211,111 @@ class TestTicketModel:
         assert str(ticket) == expected
 
 
+@pytest.mark.django_db
+class TestTicketNumberSequence:
+    """Test cases for the per-day ticket number allocator."""
+
+    def test_allocate_starts_at_one_and_increments(self):
+        """Test that the first allocation of a day starts the sequence."""
+        day = timezone.now().date() + timedelta(days=1)
+        
+        assert TicketNumberSequence.allocate(day) == 1
+        assert TicketNumberSequence.allocate(day) == 2
+        assert TicketNumberSequence.objects.get(date=day).last_value == 2
+
+    def test_generate_ticket_numbers_allocates_block(self):
+        """Test that a block of ticket numbers is sequential and unique."""
+        numbers = Ticket.generate_ticket_numbers(3)
+        
+        sequences = [int(number.split('-')[-1]) for number in numbers]
+        assert len(set(numbers)) == 3
+        assert sequences == [sequences[0], sequences[0] + 1, sequences[0] + 2]
+        
+        next_number = Ticket.generate_ticket_numbers(1)[0]
+        assert int(next_number.split('-')[-1]) == sequences[-1] + 1
+
+
+@pytest.mark.django_db
+class TestTicketVisibility:
+    """Test cases for the materialized ticket visibility rows."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="testpass123",
+            role=User.Role.ADMIN
+        )
+        self.contractor = User.objects.create_user(
+            email="contractor@example.com",
+            password="testpass123",
+            role=User.Role.CONTRACTOR
+        )
+        self.other_contractor = User.objects.create_user(
+            email="other@example.com",
+            password="testpass123",
+            role=User.Role.CONTRACTOR
+        )
+
+    def get_rows(self, ticket):
+        return dict(TicketVisibility.objects.filter(ticket=ticket).values_list('user_id', 'status'))
+
+    def test_save_tracks_creator_assignee_and_status(self):
+        """Test that saves keep one row per user who can see the ticket."""
+        ticket = Ticket.objects.create(
+            organization="Test Org",
+            location="Location",
+            expiration_date=timezone.now() + timedelta(days=30),
+            assigned_contractor=self.contractor,
+            created_by=self.admin,
+            updated_by=self.admin
+        )
+        assert self.get_rows(ticket) == {self.admin.id: "open", self.contractor.id: "open"}
+        assert TicketVisibility.objects.get(ticket=ticket, user=self.admin).created_date == ticket.created_date
+        
+        ticket.assigned_contractor = self.other_contractor
+        ticket.status = Ticket.Status.CLOSED
+        ticket.save()
+        assert self.get_rows(ticket) == {self.admin.id: "closed", self.other_contractor.id: "closed"}
+        
+        ticket.assigned_contractor = self.admin
+        ticket.save(update_fields=['assigned_contractor'])
+        assert self.get_rows(ticket) == {self.admin.id: "closed"}
+
+    def test_deleting_ticket_removes_rows(self):
+        """Test that visibility rows go away with their ticket."""
+        ticket = Ticket.objects.create(
+            organization="Test Org",
+            location="Location",
+            expiration_date=timezone.now() + timedelta(days=30),
+            assigned_contractor=self.contractor,
+            created_by=self.contractor,
+            updated_by=self.contractor
+        )
+        assert self.get_rows(ticket) == {self.contractor.id: "open"}
+        
+        ticket.delete()
+        assert not TicketVisibility.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_ticket_number_allocation_is_unique():
+    """Test that concurrent allocations never hand out the same number."""
+    def allocate():
+        try:
+            return Ticket.generate_ticket_numbers(5)
+        finally:
+            connection.close()
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        blocks = list(executor.map(lambda _: allocate(), range(8)))
+    
+    numbers = [number for block in blocks for number in block]
+    assert len(numbers) == 40
+    assert len(set(numbers)) == 40
+
+
 @pytest.mark.django_db
 class TestUserLogModel:
     """Test cases for the UserLog model."""
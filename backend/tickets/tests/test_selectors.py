@@ -1,10 +1,12 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.utils import timezone
 from datetime import timedelta
 
-from tickets.models import Ticket
-from tickets.selectors import TicketSelector
+from tickets.models import Ticket, TicketLog, TicketVisibility, UserLog
+from tickets.selectors import TicketSelector, LogSelector
+from tickets.services import TicketService
 
 User = get_user_model()
 
@@ -145,6 +147,49 @@ class TestTicketSelector:
         assert stats['in_progress'] == 0
         assert stats['closed'] == 1
 
+    def test_get_ticket_stats_uses_single_query(self, django_assert_num_queries):
+        """Test that ticket stats are computed with one aggregate query."""
+        self.ticket2.expiration_date = timezone.now() + timedelta(hours=12)
+        self.ticket2.save()
+        
+        with django_assert_num_queries(1):
+            stats = TicketSelector.compute_ticket_stats_for_user(self.admin_user)
+        
+        with django_assert_num_queries(1):
+            TicketSelector.compute_ticket_stats_for_user(self.contractor1)
+        
+        assert stats == {
+            'total': 3,
+            'open': 1,
+            'in_progress': 1,
+            'closed': 1,
+            'expiring_soon': 1,
+            'expired': 0,
+        }
+
+    def test_get_ticket_stats_served_from_cache(self, django_assert_num_queries):
+        """Test that repeated stats reads skip the database."""
+        with django_assert_num_queries(1):
+            TicketSelector.get_ticket_stats_for_user(self.contractor1)
+        
+        with django_assert_num_queries(0):
+            stats = TicketSelector.get_ticket_stats_for_user(self.contractor1)
+        
+        assert stats['total'] == 2
+
+    def test_get_ticket_stats_invalidated_by_service(self, django_capture_on_commit_callbacks):
+        """Test that ticket mutations refresh cached stats for affected scopes."""
+        assert TicketSelector.get_ticket_stats_for_user(self.admin_user)['closed'] == 1
+        assert TicketSelector.get_ticket_stats_for_user(self.contractor2)['in_progress'] == 1
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            TicketService.close_ticket(self.ticket2.id, self.admin_user)
+        
+        assert TicketSelector.get_ticket_stats_for_user(self.admin_user)['closed'] == 2
+        contractor_stats = TicketSelector.get_ticket_stats_for_user(self.contractor2)
+        assert contractor_stats['in_progress'] == 0
+        assert contractor_stats['closed'] == 1
+
     def test_tickets_with_status_filter(self):
         """Test filtering tickets by status."""
         open_tickets = TicketSelector.get_tickets_for_user(
@@ -167,3 +212,269 @@ class TestTicketSelector:
         )
         assert search_tickets.count() == 1
         assert search_tickets.first().id == self.ticket1.id
+
+    def test_tickets_search_matches_word_prefixes(self):
+        """Test that search matches partial words across ticket fields."""
+        self.ticket2.location = 'Riverside Yard'
+        self.ticket2.save()
+        
+        search_tickets = TicketSelector.get_tickets_for_user(
+            self.admin_user, 
+            search='river ya'
+        )
+        assert search_tickets.count() == 1
+        assert search_tickets.first().id == self.ticket2.id
+        
+        search_tickets = TicketSelector.get_tickets_for_user(
+            self.admin_user, 
+            search=self.ticket3.ticket_number
+        )
+        assert search_tickets.count() == 1
+        assert search_tickets.first().id == self.ticket3.id
+
+    def test_tickets_search_ranks_weighted_fields_first(self):
+        """Test that organization matches rank above notes matches."""
+        self.ticket1.notes = 'Meet the Pipeline crew on site'
+        self.ticket1.save()
+        self.ticket3.organization = 'Pipeline Services'
+        self.ticket3.save()
+        
+        search_tickets = TicketSelector.get_tickets_for_user(
+            self.admin_user, 
+            search='pipe'
+        )
+        assert list(search_tickets) == [self.ticket3, self.ticket1]
+
+    def test_tickets_search_respects_role_filtering(self):
+        """Test that search never widens a contractor's visible tickets."""
+        search_tickets = TicketSelector.get_tickets_for_user(
+            self.contractor1, 
+            search='Test Org'
+        )
+        assert search_tickets.count() == 2
+        assert self.ticket2 not in search_tickets
+
+    def test_tickets_search_ignores_punctuation_only_input(self):
+        """Test that search input without words does not filter."""
+        search_tickets = TicketSelector.get_tickets_for_user(
+            self.admin_user, 
+            search='&|!'
+        )
+        assert search_tickets.count() == 3
+
+
+@pytest.mark.django_db
+class TestLogSelector:
+    """Test cases for LogSelector activity feed."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@test.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        
+        self.contractor1 = User.objects.create_user(
+            email='contractor1@test.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        
+        self.contractor2 = User.objects.create_user(
+            email='contractor2@test.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        
+        self.ticket1 = Ticket.objects.create(
+            organization='Test Org 1',
+            location='Location 1',
+            assigned_contractor=self.contractor1,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + timedelta(days=7)
+        )
+        
+        self.ticket2 = Ticket.objects.create(
+            organization='Test Org 2',
+            location='Location 2',
+            assigned_contractor=self.contractor2,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + timedelta(days=5)
+        )
+        
+        # Interleave user and ticket logs one minute apart, oldest first
+        base = timezone.now() - timedelta(hours=1)
+        self.logs = []
+        for minute in range(6):
+            if minute % 2:
+                log = TicketLog.objects.create(
+                    ticket=self.ticket1 if minute < 4 else self.ticket2,
+                    action_by=self.admin_user,
+                    action=TicketLog.Action.UPDATED
+                )
+                TicketLog.objects.filter(id=log.id).update(timestamp=base + timedelta(minutes=minute))
+            else:
+                log = UserLog.objects.create(
+                    user=self.contractor1,
+                    action=UserLog.Action.LOGIN
+                )
+                UserLog.objects.filter(id=log.id).update(timestamp=base + timedelta(minutes=minute))
+            self.logs.append(log)
+
+    def test_activity_feed_merges_logs_newest_first(self, django_assert_num_queries):
+        """Test that both log types come back merged by timestamp in one page."""
+        # UNION query plus one batch load each for users and tickets
+        with django_assert_num_queries(3):
+            activities, next_cursor = LogSelector.get_activity_feed_for_user(self.admin_user, limit=10)
+        
+        assert [activity['id'] for activity in activities] == [log.id for log in reversed(self.logs)]
+        assert next_cursor is None
+        assert activities[0]['ticket'] == self.ticket2
+        assert activities[0]['action'] == TicketLog.Action.UPDATED.label
+        assert activities[1]['user'] == self.contractor1
+
+    def test_activity_feed_pages_with_cursor(self):
+        """Test that following the cursor walks the feed without gaps or repeats."""
+        seen = []
+        cursor = None
+        while True:
+            activities, cursor = LogSelector.get_activity_feed_for_user(
+                self.admin_user, limit=4, cursor=cursor
+            )
+            seen.extend(activity['id'] for activity in activities)
+            if not cursor:
+                break
+        
+        assert seen == [log.id for log in reversed(self.logs)]
+
+    def test_activity_feed_respects_role_filtering(self):
+        """Test that contractors only see activity on their own tickets."""
+        activities, _ = LogSelector.get_activity_feed_for_user(self.contractor1, limit=10)
+        
+        assert self.logs[5].id not in [activity['id'] for activity in activities]
+        assert len(activities) == 5
+
+    def test_ticket_audit_trail_pages_with_cursor(self):
+        """Test that the audit trail pages through ticket and related user logs."""
+        UserLog.objects.filter(id=self.logs[2].id).update(related_ticket=self.ticket1)
+        
+        entries, cursor = LogSelector.get_ticket_audit_trail(self.ticket1.id, self.admin_user, limit=2)
+        assert [entry['type'] for entry in entries] == ['ticket_action', 'user_action']
+        assert entries[1]['ip_address'] is None
+        
+        entries, cursor = LogSelector.get_ticket_audit_trail(
+            self.ticket1.id, self.admin_user, limit=2, cursor=cursor
+        )
+        assert [entry['type'] for entry in entries] == ['ticket_action']
+        assert cursor is None
+        
+        assert len(list(LogSelector.iter_audit_trail(self.ticket1.id, batch_size=1))) == 3
+
+    def test_ticket_audit_trail_respects_role_filtering(self):
+        """Test that contractors get no audit trail for other contractors' tickets."""
+        assert LogSelector.get_ticket_audit_trail(self.ticket2.id, self.contractor1) == (None, None)
+        assert not LogSelector.can_view_ticket_audit_trail(self.ticket2.id, self.contractor1)
+        assert LogSelector.can_view_ticket_audit_trail(self.ticket1.id, self.contractor1)
+
+    def test_activity_feed_rejects_invalid_cursor(self):
+        """Test that a tampered cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            LogSelector.get_activity_feed_for_user(self.admin_user, cursor='not-a-cursor')
+
+
+@pytest.mark.django_db
+class TestSelectorQueryPlans:
+    """
+    EXPLAIN regression tests for the hot selector queries.
+    Sequential scans are disabled for the transaction, so the planner only
+    falls back to one when no index can serve the query.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@test.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.contractor = User.objects.create_user(
+            email='contractor@test.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        self.ticket = Ticket.objects.create(
+            organization='Test Org',
+            location='Location',
+            assigned_contractor=self.contractor,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + timedelta(hours=12)
+        )
+        
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assert_no_seq_scan(self, queryset):
+        plan = queryset.explain()
+        assert 'Seq Scan' not in plan, plan
+
+    def test_contractor_ticket_list_uses_indexes(self):
+        """Test contractor visibility with and without a status filter."""
+        self.assert_no_seq_scan(TicketSelector.get_tickets_for_user(self.contractor))
+        self.assert_no_seq_scan(TicketSelector.get_tickets_for_user(self.contractor, status='open'))
+
+    def test_contractor_ticket_pages_read_visibility_index_in_order(self):
+        """Test contractor lists and recent tickets are served by the visibility index without a sort."""
+        # Like seq scans, sorts are only planned when no index can serve the order
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_sort = off")
+        
+        querysets = [
+            TicketSelector.get_tickets_for_user(self.contractor)[:20],
+            TicketSelector.get_tickets_for_user(self.contractor, status='open')[:20],
+            TicketSelector.get_recent_tickets_for_user(self.contractor),
+        ]
+        for queryset in querysets:
+            plan = queryset.explain()
+            assert any(index.name in plan for index in TicketVisibility._meta.indexes), plan
+            assert 'Sort' not in plan, plan
+            # Tickets are only fetched by primary key for the visibility rows read in order
+            ticket_scans = [line for line in plan.splitlines() if ' on tickets_ticket ' in line]
+            assert ticket_scans and all('tickets_ticket_pkey' in line for line in ticket_scans), plan
+
+    def test_expiring_tickets_use_partial_index(self):
+        """Test expiring and expired ticket scans use the active-tickets index."""
+        plan = TicketSelector.get_expiring_tickets_for_user(self.admin_user).explain()
+        assert 'Seq Scan' not in plan, plan
+        assert 'ticket_active_expiration_idx' in plan, plan
+        
+        self.assert_no_seq_scan(Ticket.objects.filter(
+            expiration_date__lt=timezone.now(),
+            status__in=[Ticket.Status.OPEN, Ticket.Status.IN_PROGRESS]
+        ))
+
+    def assert_partitions_use_index(self, queryset, table, columns):
+        # Partitions carry Postgres-named children of the parent index, <partition>_<columns>_idx
+        plan = queryset.explain()
+        scans = [line for line in plan.splitlines() if f' on {table}_' in line]
+        assert scans and all(f'_{columns}_idx on {table}_' in line for line in scans), plan
+
+    def test_ticket_history_uses_indexes(self):
+        """Test a ticket's newest logs are read by the (ticket, -timestamp) indexes on every partition."""
+        self.assert_partitions_use_index(
+            LogSelector.get_visible_ticket_logs(self.contractor).filter(
+                ticket_id=self.ticket.id
+            ).order_by('-timestamp')[:5],
+            'tickets_ticketlog', 'ticket_id_timestamp'
+        )
+        self.assert_partitions_use_index(
+            LogSelector.get_visible_user_logs(self.admin_user).filter(
+                related_ticket_id=self.ticket.id
+            ).order_by('-timestamp')[:5],
+            'tickets_userlog', 'related_ticket_id_timestamp'
+        )
@@ -4,7 +4,11 @@ from django.utils import timezone
 from datetime import timedelta
 
 from ..models import Ticket, UserLog, TicketLog
+from ..selectors import TicketSelector
 from ..serializers import (
+    TicketDetailOutputSerializer,
+    TicketListOutputSerializer,
+    TicketListRowSerializer,
     TicketLogOutputSerializer,
     UserLogOutputSerializer,
     TicketBasicOutputSerializer,
@@ -143,6 +147,50 @@ class TestTicketSerializers:
         assert data['action_display'] == 'Updated'
         assert data['action_by'] is None
         assert data['ticket']['ticket_number'] == self.ticket.ticket_number
+    
+    def test_ticket_detail_output_serializer_bounds_history(self, settings):
+        """Test TicketDetailOutputSerializer embeds only the latest logs plus a count."""
+        settings.TICKET_DETAIL_RECENT_LOGS = 2
+        logs = TicketLog.objects.bulk_create([
+            TicketLog(ticket=self.ticket, action_by=self.admin_user, action=TicketLog.Action.UPDATED)
+            for _ in range(4)
+        ])
+        for minutes, log in enumerate(logs):
+            TicketLog.objects.filter(id=log.id).update(timestamp=timezone.now() + timedelta(minutes=minutes))
+        
+        ticket = TicketSelector.get_ticket_detail(self.ticket.id)
+        data = TicketDetailOutputSerializer(ticket).data
+        
+        assert 'ticket_logs' not in data
+        assert data['log_count'] == 4
+        assert [log['id'] for log in data['recent_logs']] == [str(logs[3].id), str(logs[2].id)]
+        assert data['history_url'] == f"/api/tickets/{self.ticket.id}/audit/"
+
+    
+    def test_ticket_list_row_serializer_matches_list_serializer(self):
+        """Test flat list rows produce the same output as TicketListOutputSerializer."""
+        for status, expires_in in [
+            (Ticket.Status.IN_PROGRESS, timedelta(hours=12)),
+            (Ticket.Status.OPEN, -timedelta(days=2)),
+            (Ticket.Status.CLOSED, timedelta(days=5)),
+        ]:
+            Ticket.objects.create(
+                organization='Ünïcode Org',
+                location='Elsewhere',
+                status=status,
+                expiration_date=timezone.now() + expires_in,
+                assigned_contractor=self.contractor_user,
+                created_by=self.admin_user,
+                updated_by=self.admin_user
+            )
+        tickets = Ticket.objects.select_related('assigned_contractor', 'created_by').order_by('-created_date')
+        
+        expected = TicketListOutputSerializer(tickets, many=True).data
+        data = TicketListRowSerializer(TicketListRowSerializer.get_queryset(tickets)).data
+        
+        assert [list(row.items()) for row in data] == [list(row.items()) for row in expected]
+        assert [row['is_expired'] for row in data] == [False, True, False, False]
+        assert [row['is_expiring_soon'] for row in data] == [False, True, True, False]
 
 
 @pytest.mark.django_db
@@ -0,0 +1,550 @@
+"""
+Tests business logic in the tickets services layer.
+"""
+
+import logging
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth import get_user_model
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.exceptions import PermissionDenied
+from django.db import connection, transaction
+
+from tickets.models import Ticket, TicketLog, TicketVisibility, UserLog
+from tickets.services import (
+    ExpirationService,
+    LogRetentionService,
+    LogPartitionService,
+    LoggingService,
+    AuditLogBuffer,
+    TicketService,
+    TicketBulkService,
+)
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestExpirationService:
+    """Test ExpirationService business logic."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.contractor_user = User.objects.create_user(
+            email='contractor@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+
+    def create_ticket(self, expires_in, status=Ticket.Status.OPEN):
+        return Ticket.objects.create(
+            organization='Test Org',
+            location='Test Location',
+            assigned_contractor=self.contractor_user,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + expires_in,
+            status=status
+        )
+
+    def test_mark_expired_tickets_in_batches(self):
+        """Test that expired tickets are closed chunk by chunk with logs."""
+        expired = [
+            self.create_ticket(-timedelta(days=1)),
+            self.create_ticket(-timedelta(days=2)),
+            self.create_ticket(-timedelta(hours=1), status=Ticket.Status.IN_PROGRESS),
+            self.create_ticket(-timedelta(hours=2)),
+            self.create_ticket(-timedelta(hours=3)),
+        ]
+        active = self.create_ticket(timedelta(days=1))
+        progress = []
+
+        updated_count = ExpirationService.mark_expired_tickets(
+            batch_size=2,
+            progress_callback=progress.append
+        )
+
+        assert updated_count == 5
+        assert progress == [2, 4, 5]
+
+        for ticket in expired:
+            ticket.refresh_from_db()
+            assert ticket.status == Ticket.Status.CLOSED
+
+        active.refresh_from_db()
+        assert active.status == Ticket.Status.OPEN
+
+        logs = TicketLog.objects.filter(action=TicketLog.Action.CLOSED, action_by=None)
+        assert logs.count() == 5
+        assert not TicketVisibility.objects.filter(
+            ticket__in=expired
+        ).exclude(status=Ticket.Status.CLOSED).exists()
+        assert logs.get(ticket=expired[2]).previous_values == {"status": Ticket.Status.IN_PROGRESS}
+
+    def test_mark_expired_tickets_is_resumable(self):
+        """Test that a rerun only closes what a previous run left behind."""
+        self.create_ticket(-timedelta(days=1))
+
+        assert ExpirationService.mark_expired_tickets() == 1
+
+        self.create_ticket(-timedelta(hours=1))
+
+        assert ExpirationService.mark_expired_tickets() == 1
+        assert ExpirationService.mark_expired_tickets() == 0
+        assert TicketLog.objects.filter(action=TicketLog.Action.CLOSED).count() == 2
+
+
+@pytest.mark.django_db
+class TestLogRetentionService:
+    """Test LogRetentionService business logic."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.ticket = Ticket.objects.create(
+            organization='Test Org',
+            location='Test Location',
+            assigned_contractor=self.admin_user,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + timedelta(days=1)
+        )
+
+    def create_logs(self, count, age):
+        logs = TicketLog.objects.bulk_create([
+            TicketLog(ticket=self.ticket, action_by=self.admin_user, action=TicketLog.Action.UPDATED)
+            for _ in range(count)
+        ])
+        TicketLog.objects.filter(
+            id__in=[log.id for log in logs]
+        ).update(timestamp=timezone.now() - age)
+
+    def test_purge_logs_deletes_in_batches(self, settings):
+        """Test that only logs past the retention window are deleted, in batches."""
+        settings.LOG_RETENTION_DAYS = {'ticket_logs': 30}
+        self.create_logs(5, timedelta(days=31))
+        self.create_logs(2, timedelta(days=29))
+
+        result = LogRetentionService.purge_logs('ticket_logs', batch_size=2, sleep_seconds=0)
+
+        assert result['deleted'] == 5
+        assert result['batches'] == 3
+        assert TicketLog.objects.count() == 2
+
+    def test_purge_logs_uses_per_type_retention(self, settings):
+        """Test that each log type has its own retention window."""
+        settings.LOG_RETENTION_DAYS = {'ticket_logs': 400, 'user_logs': 30}
+        self.create_logs(3, timedelta(days=31))
+
+        result = LogRetentionService.purge_logs('ticket_logs', sleep_seconds=0)
+
+        assert result['deleted'] == 0
+        assert TicketLog.objects.count() == 3
+
+    def test_purge_logs_drops_expired_partitions(self, settings):
+        """Test that months entirely past retention are dropped as partitions."""
+        settings.LOG_RETENTION_DAYS = {'ticket_logs': 30}
+        old_month = LogPartitionService.add_months(timezone.now().date().replace(day=1), -6)
+        partition = LogPartitionService.create_partition(TicketLog._meta.db_table, old_month)
+        start, _ = LogPartitionService.get_month_bounds(old_month)
+        self.create_logs(4, timezone.now() - start - timedelta(days=1))
+        self.create_logs(1, timedelta(days=1))
+
+        # Flush deferred FK checks from this test's transaction before the DROP
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+        result = LogRetentionService.purge_logs('ticket_logs', sleep_seconds=0)
+
+        assert result['partitions_dropped'] == [partition]
+        assert result['deleted'] == 0
+        assert TicketLog.objects.count() == 1
+        assert partition not in LogPartitionService.get_partitions(TicketLog._meta.db_table)
+
+
+@pytest.mark.django_db
+class TestLogPartitionService:
+    """Test LogPartitionService business logic."""
+
+    def test_ensure_partitions_creates_upcoming_months(self):
+        """Test that partitions exist from the current month up to months ahead."""
+        LogPartitionService.ensure_partitions(months_ahead=5)
+
+        current_month = timezone.now().date().replace(day=1)
+        for model in (UserLog, TicketLog):
+            months = set(LogPartitionService.get_partitions(model._meta.db_table).values())
+            for offset in range(6):
+                assert LogPartitionService.add_months(current_month, offset) in months
+
+        assert LogPartitionService.ensure_partitions(months_ahead=5) == []
+
+    def test_create_partition_moves_rows_from_default(self):
+        """Test that rows parked in the default partition move into a new month."""
+        user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        old_month = LogPartitionService.add_months(timezone.now().date().replace(day=1), -12)
+        start, _ = LogPartitionService.get_month_bounds(old_month)
+        log = UserLog.objects.create(user=user, action=UserLog.Action.LOGIN)
+        UserLog.objects.filter(id=log.id).update(timestamp=start + timedelta(days=3))
+
+        partition = LogPartitionService.create_partition(UserLog._meta.db_table, old_month)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {partition}")
+            assert cursor.fetchone()[0] == 1
+            cursor.execute(f"SELECT count(*) FROM {UserLog._meta.db_table}_default")
+            assert cursor.fetchone()[0] == 0
+        assert UserLog.objects.filter(id=log.id).exists()
+
+
+@pytest.mark.django_db
+class TestLoggingService:
+    """Test LoggingService buffered audit writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.contractor_user = User.objects.create_user(
+            email='contractor@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+
+    def create_ticket(self):
+        return TicketService.create_ticket(
+            created_by=self.admin_user,
+            assigned_contractor_id=self.contractor_user.id,
+            organization='Test Org',
+            location='Test Location',
+            expiration_date=timezone.now() + timedelta(days=5)
+        )
+
+    def test_logs_are_written_in_bulk_on_commit(self, django_capture_on_commit_callbacks, django_assert_num_queries):
+        """Test that audit entries of one audited block wait for commit and share one flush."""
+        with django_capture_on_commit_callbacks() as callbacks:
+            with LoggingService.atomic():
+                ticket = self.create_ticket()
+                TicketService.renew_ticket(ticket.id, self.admin_user, days=5)
+
+            assert UserLog.objects.count() == 0
+            assert TicketLog.objects.count() == 0
+
+        flushes = [callback for callback in callbacks if getattr(callback, '__func__', None) is AuditLogBuffer.flush]
+        assert len(flushes) == 1
+
+        # One INSERT per log table inside a savepoint
+        with django_assert_num_queries(4):
+            for callback in callbacks:
+                callback()
+
+        assert UserLog.objects.filter(related_ticket=ticket).count() == 2
+        assert list(
+            TicketLog.objects.filter(ticket=ticket).order_by('timestamp').values_list('action', flat=True)
+        ) == [TicketLog.Action.CREATED, TicketLog.Action.RENEWED]
+
+    def test_rolled_back_entries_are_discarded(self, django_capture_on_commit_callbacks, caplog):
+        """Test that entries queued in a rolled back transaction are never written or reported."""
+        caplog.set_level(logging.INFO, logger='tickets.services')
+        with django_capture_on_commit_callbacks(execute=True):
+            for atomic in (transaction.atomic, LoggingService.atomic):
+                try:
+                    with atomic():
+                        LoggingService.log_user_action(self.admin_user, UserLog.Action.PROFILE_UPDATE)
+                        raise RuntimeError("rollback")
+                except RuntimeError:
+                    pass
+
+            LoggingService.log_user_action(self.admin_user, UserLog.Action.LOGIN)
+
+        assert list(UserLog.objects.values_list('action', flat=True)) == [UserLog.Action.LOGIN]
+        assert [
+            record.getMessage() for record in caplog.records if 'User action logged' in record.getMessage()
+        ] == [f"User action logged: user {self.admin_user.id} - {UserLog.Action.LOGIN}"]
+
+    def test_entries_in_rolled_back_savepoint_are_discarded(self, django_capture_on_commit_callbacks):
+        """Test that a savepoint rollback drops its entries but keeps the outer ones."""
+        with django_capture_on_commit_callbacks(execute=True):
+            with LoggingService.atomic():
+                LoggingService.log_user_action(self.admin_user, UserLog.Action.LOGIN)
+                try:
+                    with LoggingService.atomic():
+                        LoggingService.log_user_action(self.admin_user, UserLog.Action.PROFILE_UPDATE)
+                        raise RuntimeError("rollback")
+                except RuntimeError:
+                    pass
+                LoggingService.log_user_action(self.admin_user, UserLog.Action.LOGOUT)
+
+        assert sorted(UserLog.objects.values_list('action', flat=True)) == [
+            UserLog.Action.LOGIN, UserLog.Action.LOGOUT
+        ]
+
+    def test_failed_flush_is_handed_to_worker(self, django_capture_on_commit_callbacks):
+        """Test that entries are queued for the Celery writer when the bulk write fails."""
+        with patch.object(AuditLogBuffer, 'write', side_effect=RuntimeError("db down")), \
+                patch('tickets.tasks.write_audit_logs.delay') as mock_delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                LoggingService.log_user_action(self.admin_user, UserLog.Action.LOGIN, details={'via': 'test'})
+
+        payload = mock_delay.call_args[0][0]
+        assert payload['ticket_logs'] == []
+        assert payload['user_logs'][0]['user_id'] == self.admin_user.id
+        assert payload['user_logs'][0]['details'] == {'via': 'test'}
+
+        AuditLogBuffer.write(payload['user_logs'], payload['ticket_logs'])
+        assert UserLog.objects.filter(user=self.admin_user, action=UserLog.Action.LOGIN).exists()
+
+
+@pytest.mark.django_db
+class TestTicketService:
+    """Test TicketService mutation paths."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.contractor_user = User.objects.create_user(
+            email='contractor@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        self.other_contractor = User.objects.create_user(
+            email='other@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        self.ticket = Ticket.objects.create(
+            organization='Test Org',
+            location='Test Location',
+            assigned_contractor=self.contractor_user,
+            created_by=self.admin_user,
+            updated_by=self.admin_user,
+            expiration_date=timezone.now() + timedelta(days=5)
+        )
+
+    def test_assign_ticket_fetches_ticket_once_with_lock(self):
+        """Test that a mutation reads the ticket in one locked query and reuses it."""
+        with CaptureQueriesContext(connection) as queries:
+            ticket = TicketService.assign_ticket(
+                self.ticket.id,
+                self.other_contractor.id,
+                self.admin_user
+            )
+            assert ticket.previous_assignee == self.contractor_user
+            assert ticket.created_by.email == 'admin@example.com'
+        
+        ticket_selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "tickets_ticket"' in query['sql']
+        ]
+        assert len(ticket_selects) == 1
+        assert 'FOR UPDATE OF "tickets_ticket"' in ticket_selects[0]
+
+    def test_missing_ticket_raises_does_not_exist(self):
+        """Test that mutating a missing ticket raises Ticket.DoesNotExist."""
+        with pytest.raises(Ticket.DoesNotExist):
+            TicketService.renew_ticket('00000000-0000-0000-0000-000000000000', self.admin_user)
+
+
+
+@pytest.mark.django_db
+class TestTicketBulkService:
+    """Test TicketBulkService set-based operations."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            email='admin@example.com',
+            password='testpass123',
+            role=User.Role.ADMIN
+        )
+        self.contractor_user = User.objects.create_user(
+            email='contractor@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        self.other_contractor = User.objects.create_user(
+            email='other@example.com',
+            password='testpass123',
+            role=User.Role.CONTRACTOR
+        )
+        self.tickets = [
+            Ticket.objects.create(
+                organization=f'Test Org {index}',
+                location='Test Location',
+                assigned_contractor=self.contractor_user if index < 3 else self.other_contractor,
+                created_by=self.admin_user,
+                updated_by=self.admin_user,
+                expiration_date=timezone.now() + timedelta(days=5)
+            )
+            for index in range(4)
+        ]
+
+    def test_bulk_renew_reports_per_item_results(self, django_capture_on_commit_callbacks):
+        """Test that permitted tickets are renewed and the rest are reported."""
+        missing_id = '00000000-0000-0000-0000-000000000000'
+        ticket_ids = [ticket.id for ticket in self.tickets] + [missing_id]
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            summary = TicketBulkService.bulk_renew_tickets(ticket_ids, self.contractor_user, days=3)
+        
+        assert summary['succeeded'] == 3
+        assert summary['failed'] == 2
+        assert [result['success'] for result in summary['results']] == [True, True, True, False, False]
+        assert summary['results'][4]['error'] == "Ticket not found"
+        
+        for ticket in self.tickets:
+            original_expiration = ticket.expiration_date
+            ticket.refresh_from_db()
+            expected_days = 3 if ticket.assigned_contractor == self.contractor_user else 0
+            assert ticket.expiration_date == original_expiration + timedelta(days=expected_days)
+        
+        assert TicketLog.objects.filter(action=TicketLog.Action.RENEWED).count() == 3
+        assert UserLog.objects.filter(action=UserLog.Action.TICKET_RENEWED).count() == 3
+
+    def test_bulk_close_uses_one_update(self, django_assert_num_queries):
+        """Test that closing a set costs one lock query and one UPDATE."""
+        self.tickets[0].status = Ticket.Status.CLOSED
+        self.tickets[0].save()
+        
+        # Savepoint, locked SELECT, ticket and visibility UPDATEs, release
+        with django_assert_num_queries(5):
+            summary = TicketBulkService.bulk_close_tickets(
+                [ticket.id for ticket in self.tickets], self.admin_user, reason='Done'
+            )
+        
+        assert summary['succeeded'] == 3
+        assert summary['results'][0]['error'] == "Ticket is already closed"
+        assert Ticket.objects.filter(status=Ticket.Status.CLOSED).count() == 4
+
+    def test_bulk_assign_skips_tickets_already_assigned(self):
+        """Test that bulk assignment moves only tickets not already with the contractor."""
+        summary = TicketBulkService.bulk_assign_tickets(
+            [ticket.id for ticket in self.tickets], self.other_contractor.id, self.admin_user
+        )
+        
+        assert summary['succeeded'] == 3
+        assert summary['results'][3]['error'] == "Ticket is already assigned to this contractor"
+        assert Ticket.objects.filter(assigned_contractor=self.other_contractor).count() == 4
+        
+        with pytest.raises(PermissionDenied):
+            TicketBulkService.bulk_assign_tickets(
+                [self.tickets[0].id], self.other_contractor.id, self.contractor_user
+            )
+
+    def test_bulk_operations_keep_visibility_in_sync(self):
+        """Test that set-based writes maintain the visibility rows."""
+        TicketBulkService.bulk_assign_tickets(
+            [ticket.id for ticket in self.tickets], self.other_contractor.id, self.admin_user
+        )
+        assert not TicketVisibility.objects.filter(user=self.contractor_user).exists()
+        assert TicketVisibility.objects.filter(user=self.other_contractor).count() == 4
+        
+        TicketBulkService.bulk_close_tickets([self.tickets[0].id], self.admin_user)
+        assert set(
+            TicketVisibility.objects.filter(ticket=self.tickets[0]).values_list('status', flat=True)
+        ) == {Ticket.Status.CLOSED}
+        
+        summary = TicketBulkService.bulk_create_tickets(self.admin_user, [{
+            'organization': 'Bulk Org',
+            'location': 'Bulk Location',
+            'expiration_date': timezone.now() + timedelta(days=5),
+            'assigned_contractor_id': self.contractor_user.id
+        }])
+        assert set(TicketVisibility.objects.filter(
+            ticket_id=summary['results'][0]['ticket_id']
+        ).values_list('user_id', flat=True)) == {self.admin_user.id, self.contractor_user.id}
+
+    def test_bulk_create_allocates_numbers_in_one_block(self):
+        """Test that valid items are created together and invalid ones reported."""
+        expiration_date = timezone.now() + timedelta(days=5)
+        items = [
+            {
+                'organization': 'Bulk Org 1',
+                'location': 'Bulk Location',
+                'expiration_date': expiration_date,
+                'assigned_contractor_id': self.contractor_user.id
+            },
+            {
+                'organization': 'Bulk Org 2',
+                'location': 'Bulk Location',
+                'expiration_date': expiration_date,
+                'assigned_contractor_id': self.admin_user.id
+            },
+            {
+                'organization': 'Bulk Org 3',
+                'location': 'Bulk Location',
+                'expiration_date': expiration_date.isoformat(),
+                'assigned_contractor_id': self.other_contractor.id
+            },
+        ]
+        
+        summary = TicketBulkService.bulk_create_tickets(self.admin_user, items)
+        
+        assert summary['succeeded'] == 2
+        assert summary['results'][1]['error'] == "Invalid contractor assignment"
+        numbers = [summary['results'][0]['ticket_number'], summary['results'][2]['ticket_number']]
+        assert int(numbers[1][-4:]) == int(numbers[0][-4:]) + 1
+        assert Ticket.objects.filter(organization__startswith='Bulk Org').count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_renewals_are_not_lost():
+    """Test that concurrent renewals of one ticket all apply."""
+    admin_user = User.objects.create_user(
+        email='admin@example.com',
+        password='testpass123',
+        role=User.Role.ADMIN
+    )
+    contractor_user = User.objects.create_user(
+        email='contractor@example.com',
+        password='testpass123',
+        role=User.Role.CONTRACTOR
+    )
+    ticket = Ticket.objects.create(
+        organization='Test Org',
+        location='Test Location',
+        assigned_contractor=contractor_user,
+        created_by=admin_user,
+        updated_by=admin_user,
+        expiration_date=timezone.now() + timedelta(days=5)
+    )
+    original_expiration = ticket.expiration_date
+    
+    def renew():
+        try:
+            TicketService.renew_ticket(ticket.id, admin_user, days=1)
+        finally:
+            connection.close()
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: renew(), range(8)))
+    
+    ticket.refresh_from_db()
+    assert ticket.expiration_date == original_expiration + timedelta(days=8)
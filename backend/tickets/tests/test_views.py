@@ -1,13 +1,17 @@
 import pytest
 import json
+from unittest.mock import patch
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from tickets.models import Ticket
+from tickets.models import Ticket, UserLog
+from tickets.services import AuditLogBuffer, TicketService
 from users.models import User
 
 User = get_user_model()
@@ -276,6 +280,73 @@ class TestTicketAPI:
         assert len(data['results']) == 1
         assert data['results'][0]['organization'] == 'Test Org 1'
 
+    def test_tickets_with_cursor_pagination(self):
+        """Test keyset pagination walks all tickets without a count."""
+        self.client.force_authenticate(user=self.admin_user)
+        
+        url = reverse('tickets:ticket-list-create')
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 2})
+        
+        assert response.status_code == status.HTTP_200_OK
+        
+        data = response.json()
+        assert 'count' not in data
+        assert data['previous'] is None
+        assert data['next'] is not None
+        assert len(data['results']) == 2
+        
+        # Follow the opaque cursor to the second page
+        response = self.client.get(data['next'])
+        
+        assert response.status_code == status.HTTP_200_OK
+        
+        next_data = response.json()
+        assert next_data['next'] is None
+        assert next_data['previous'] is not None
+        assert len(next_data['results']) == 1
+        
+        ticket_numbers = [
+            ticket['ticket_number'] for ticket in data['results'] + next_data['results']
+        ]
+        assert len(set(ticket_numbers)) == 3
+
+    def test_contractor_cursor_pagination(self):
+        """Test contractor keyset pages follow their visibility rows, newest first."""
+        for index in range(3):
+            Ticket.objects.create(
+                organization=f'Contractor Org {index}',
+                location='Location',
+                assigned_contractor=self.contractor1,
+                created_by=self.admin_user,
+                updated_by=self.admin_user,
+                expiration_date=timezone.now() + timedelta(days=1)
+            )
+        self.client.force_authenticate(user=self.contractor1)
+        
+        url = reverse('tickets:ticket-list-create')
+        results = []
+        params = {'pagination': 'cursor', 'page_size': 1}
+        while url:
+            data = self.client.get(url, params).json()
+            results += data['results']
+            url, params = data['next'], None
+        
+        expected = Ticket.objects.filter(
+            assigned_contractor=self.contractor1
+        ).order_by('-created_date', '-id').values_list('ticket_number', flat=True)
+        assert [ticket['ticket_number'] for ticket in results] == list(expected)
+
+    def test_tickets_search_rejects_cursor_pagination(self):
+        """Test that ranked search results cannot be keyset paginated."""
+        self.client.force_authenticate(user=self.admin_user)
+        
+        url = reverse('tickets:ticket-list-create')
+        response = self.client.get(url, {'pagination': 'cursor', 'search': 'Test'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        
+        response = self.client.get(url, {'cursor': 'abc', 'search': 'Test'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_contractor_with_status_filter(self):
         """Test contractor filtering their tickets by status."""
         self.client.force_authenticate(user=self.contractor1)
@@ -376,6 +447,181 @@ class TestTicketAPI:
         assert 'count' in data
         assert 'results' in data
 
+    def test_activity_feed_pagination(self):
+        """Test that the activity feed links to its next page."""
+        self.client.force_authenticate(user=self.admin_user)
+        for _ in range(3):
+            UserLog.objects.create(user=self.admin_user, action=UserLog.Action.LOGIN)
+        
+        url = reverse('tickets:activity-feed')
+        response = self.client.get(url, {'limit': 2})
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data['results']) == 2
+        assert 'cursor=' in data['next']
+        
+        response = self.client.get(url, {'cursor': 'garbage'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_ticket_audit_trail_stream(self):
+        """Test that the audit trail can be streamed as NDJSON."""
+        self.client.force_authenticate(user=self.admin_user)
+        for _ in range(3):
+            UserLog.objects.create(
+                user=self.admin_user,
+                action=UserLog.Action.TICKET_UPDATED,
+                related_ticket=self.ticket1
+            )
+        
+        url = reverse('tickets:ticket-audit', kwargs={'ticket_id': self.ticket1.id})
+        response = self.client.get(url, {'limit': 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['count'] == 3
+        assert len(response.json()['results']) == 2
+        assert response.json()['next']
+        
+        # The access check is not a throwaway page query
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'stream': 'true'})
+            lines = b''.join(response.streaming_content).decode().splitlines()
+        assert sum('UNION' in query['sql'] for query in queries) == 1
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert len(lines) == 3
+        assert json.loads(lines[0])['type'] == 'user_action'
+        
+        self.client.force_authenticate(user=self.contractor2)
+        response = self.client.get(url, {'stream': 'true'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_bulk_renew(self):
+        """Test that the bulk renew endpoint reports per-item results."""
+        self.client.force_authenticate(user=self.contractor1)
+        
+        url = reverse('tickets:ticket-bulk-renew')
+        data = {'ticket_ids': [str(self.ticket1.id), str(self.ticket2.id)], 'days': 5}
+        response = self.client.post(url, data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data['succeeded'] == 1
+        assert data['results'][0]['ticket_number'] == self.ticket1.ticket_number
+        assert data['results'][1]['success'] is False
+
+    def test_bulk_operation_runs_in_background(self):
+        """Test that background bulk operations are queued as a Celery job."""
+        self.client.force_authenticate(user=self.admin_user)
+        
+        url = reverse('tickets:ticket-bulk-close')
+        data = {'ticket_ids': [str(self.ticket1.id)], 'background': True}
+        with patch('tickets.views.run_bulk_ticket_operation.delay') as mock_delay:
+            mock_delay.return_value.id = 'job-1'
+            response = self.client.post(url, data, format='json')
+        
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()['status_url'].endswith('/api/tickets/bulk/jobs/job-1/')
+        operation, user_id, params = mock_delay.call_args[0]
+        assert (operation, user_id, params) == ('close', self.admin_user.id, {'ticket_ids': [str(self.ticket1.id)]})
+
+    def test_bulk_job_status_is_owner_only(self):
+        """Test that job state is hidden from other users and failures are reported."""
+        self.client.force_authenticate(user=self.admin_user)
+        with patch('tickets.views.run_bulk_ticket_operation.delay') as mock_delay:
+            mock_delay.return_value.id = 'job-2'
+            self.client.post(
+                reverse('tickets:ticket-bulk-close'),
+                {'ticket_ids': [str(self.ticket1.id)], 'background': True},
+                format='json'
+            )
+        
+        url = reverse('tickets:ticket-bulk-job', kwargs={'job_id': 'job-2'})
+        with patch('tickets.views.AsyncResult') as mock_result:
+            mock_result.return_value.failed.return_value = False
+            mock_result.return_value.ready.return_value = False
+            mock_result.return_value.state = 'STARTED'
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()['status'] == 'started'
+            
+            mock_result.return_value.failed.return_value = True
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()['status'] == 'failed'
+            
+            self.client.force_authenticate(user=self.contractor1)
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            
+            response = self.client.get(reverse('tickets:ticket-bulk-job', kwargs={'job_id': 'unknown'}))
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_ticket_detail_conditional_get(self, settings, django_capture_on_commit_callbacks):
+        """Test that an unchanged ticket returns 304 until it is modified."""
+        settings.TICKET_ETAG_WINDOW = 0
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse('tickets:ticket-detail', kwargs={'ticket_id': self.ticket1.id})
+        
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response['ETag']
+        assert response['Last-Modified']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response['Cache-Control'] == 'private, no-cache'
+        
+        # Logs written after the ticket commit (AUDIT_LOG_ASYNC) change it too
+        with django_capture_on_commit_callbacks(execute=True):
+            AuditLogBuffer.write([], [{
+                'ticket_id': str(self.ticket1.id),
+                'action_by_id': self.admin_user.id,
+                'action': 'updated',
+            }])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        etag = response['ETag']
+        
+        self.client.post(
+            reverse('tickets:ticket-renew', kwargs={'ticket_id': self.ticket1.id}),
+            {'days': 5},
+            format='json'
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_ticket_list_and_stats_conditional_get(self, settings, django_capture_on_commit_callbacks):
+        """Test that list and stats validators change when the scope changes."""
+        settings.TICKET_ETAG_WINDOW = 0
+        self.client.force_authenticate(user=self.contractor1)
+        list_url = reverse('tickets:ticket-list-create')
+        stats_url = reverse('tickets:ticket-stats')
+        
+        list_etag = self.client.get(list_url).headers['ETag']
+        stats_etag = self.client.get(stats_url).headers['ETag']
+        
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == list_etag
+        assert response['Cache-Control'] == 'private, no-cache'
+        assert self.client.get(stats_url, HTTP_IF_NONE_MATCH=stats_etag).status_code == status.HTTP_304_NOT_MODIFIED
+        assert self.client.get(
+            list_url, {'status': 'open'}, HTTP_IF_NONE_MATCH=list_etag
+        ).status_code == status.HTTP_200_OK
+        
+        # A change to another contractor's ticket leaves this scope untouched
+        with django_capture_on_commit_callbacks(execute=True):
+            TicketService.renew_ticket(self.ticket2.id, self.admin_user, days=5)
+        assert self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code == status.HTTP_304_NOT_MODIFIED
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            TicketService.renew_ticket(self.ticket1.id, self.admin_user, days=5)
+        assert self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code == status.HTTP_200_OK
+        assert self.client.get(stats_url, HTTP_IF_NONE_MATCH=stats_etag).status_code == status.HTTP_200_OK
+
     def test_api_endpoints_return_json(self):
         """Test that all API endpoints return valid JSON."""
         self.client.force_authenticate(user=self.admin_user)
@@ -416,6 +662,8 @@ class TestTicketAPI:
         assert 'message' in response_data
         assert 'ticket' in response_data
         assert response_data['ticket']['assigned_contractor']['id'] == self.contractor2.id
+        assert 'ticket_logs' not in response_data['ticket']
+        assert response_data['ticket']['history_url'].endswith(f"/api/tickets/{self.ticket1.id}/audit/")
         
         # Verify in database
         self.ticket1.refresh_from_db()
@@ -5,11 +5,17 @@ from .views import (
     TicketRenewApi,
     TicketAssignApi,
     TicketCloseApi,
+    TicketBulkCreateApi,
+    TicketBulkAssignApi,
+    TicketBulkRenewApi,
+    TicketBulkCloseApi,
+    TicketBulkJobApi,
     TicketStatsApi,
     ContractorListApi,
     UserLogsApi,
     TicketLogsApi,
     TicketAuditTrailApi,
+    ActivityFeedApi,
     DashboardApi,
 )
 
@@ -25,6 +31,13 @@ urlpatterns = [
     path('<uuid:ticket_id>/assign/', TicketAssignApi.as_view(), name='ticket-assign'),
     path('<uuid:ticket_id>/close/', TicketCloseApi.as_view(), name='ticket-close'),
     
+    # Bulk ticket actions
+    path('bulk/create/', TicketBulkCreateApi.as_view(), name='ticket-bulk-create'),
+    path('bulk/assign/', TicketBulkAssignApi.as_view(), name='ticket-bulk-assign'),
+    path('bulk/renew/', TicketBulkRenewApi.as_view(), name='ticket-bulk-renew'),
+    path('bulk/close/', TicketBulkCloseApi.as_view(), name='ticket-bulk-close'),
+    path('bulk/jobs/<str:job_id>/', TicketBulkJobApi.as_view(), name='ticket-bulk-job'),
+    
     # Statistics and data
     path('stats/', TicketStatsApi.as_view(), name='ticket-stats'),
     path('contractors/', ContractorListApi.as_view(), name='contractor-list'),
@@ -33,6 +46,7 @@ urlpatterns = [
     # Logging and audit
     path('logs/users/', UserLogsApi.as_view(), name='user-logs'),
     path('logs/tickets/', TicketLogsApi.as_view(), name='ticket-logs'),
+    path('activity/', ActivityFeedApi.as_view(), name='activity-feed'),
     path('<uuid:ticket_id>/logs/', TicketLogsApi.as_view(), name='ticket-logs-detail'),
     path('<uuid:ticket_id>/audit/', TicketAuditTrailApi.as_view(), name='ticket-audit'),
 ]
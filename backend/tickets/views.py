@@ -1,38 +1,63 @@
+import hashlib
+import json
 import logging
+import time
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.utils.urls import replace_query_param
+from celery.result import AsyncResult
+from django.conf import settings
 from django.core.exceptions import ValidationError, PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 from django.utils import timezone
 
-from .services import TicketService, TicketPermissionService, LoggingService, ExpirationService
-from .selectors import TicketSelector, LogSelector, DashboardSelector
+from .cache import BulkJobCache, TicketChangeVersion, TicketStatsCache
+from .models import Ticket
+from .services import TicketService, TicketBulkService, TicketPermissionService, LoggingService, ExpirationService
+from .tasks import run_bulk_ticket_operation
+from .dashboard import DashboardEngine
+from .selectors import TicketSelector, LogSelector
 from .serializers import (
     TicketCreateInputSerializer,
     TicketUpdateInputSerializer,
     TicketRenewInputSerializer,
     TicketAssignInputSerializer,
     TicketCloseInputSerializer,
+    TicketBulkCreateInputSerializer,
+    TicketBulkAssignInputSerializer,
+    TicketBulkRenewInputSerializer,
+    TicketBulkCloseInputSerializer,
     TicketFilterInputSerializer,
     LogFilterInputSerializer,
+    ActivityFeedInputSerializer,
+    AuditTrailInputSerializer,
     TicketOutputSerializer,
-    TicketListOutputSerializer,
+    TicketListRowSerializer,
     TicketCreateOutputSerializer,
     TicketUpdateOutputSerializer,
     TicketRenewOutputSerializer,
     TicketAssignOutputSerializer,
+    TicketBulkOutputSerializer,
+    TicketBulkJobOutputSerializer,
     TicketStatsOutputSerializer,
     ContractorOutputSerializer,
     UserLogOutputSerializer,
     TicketLogOutputSerializer,
     AuditTrailOutputSerializer,
-    DashboardDataOutputSerializer,
+    ActivityOutputSerializer,
     MessageOutputSerializer,
     ErrorOutputSerializer,
     TicketListResponseSerializer,
     LogListResponseSerializer,
+    ActivityFeedResponseSerializer,
+    AuditTrailResponseSerializer,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +73,64 @@ def get_client_ip(request):
     return ip
 
 
+def get_validator_window():
+    """
+    Get the current ETag window index and its start timestamp.
+    Responses depending on the clock are only reused within one window.
+    """
+    window = settings.TICKET_ETAG_WINDOW
+    if not window:
+        return 0, 0
+    index = int(time.time() // window)
+    return index, index * window
+
+
+def make_etag(*parts):
+    """Build a quoted ETag from the values a response depends on."""
+    return quote_etag(hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest())
+
+
+def get_scope_etag(request, resource):
+    """
+    Build an ETag for a per-scope ticket read from the scope's change version.
+    Returns None if the version is unavailable.
+    """
+    version = TicketChangeVersion.get(request.user)
+    if version is None:
+        return None
+    query_params = getattr(request, 'query_params', request.GET)
+    return make_etag(
+        resource,
+        TicketStatsCache.get_scope(request.user),
+        version,
+        sorted(query_params.lists()),
+        get_validator_window()[0]
+    )
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach validators so clients revalidate with If-None-Match / If-Modified-Since."""
+    if etag:
+        response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def get_not_modified_response(request, etag, last_modified=None):
+    """
+    Get a 304 response if the request's validators still match, otherwise None.
+    The 304 carries the same validators as the full response would.
+    """
+    if not etag:
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return set_validators(response, etag, last_modified)
+
+
 class TicketPagination(PageNumberPagination):
     """Custom pagination for tickets."""
     page_size = 20
@@ -55,19 +138,51 @@ class TicketPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class TicketCursorPagination(CursorPagination):
+    """
+    Keyset pagination for tickets on (created_date, id).
+    Skips the COUNT query so deep pages cost the same as the first one.
+    Not offered for search, whose results are ordered by rank.
+    Contractor lists page on their visibility rows' created_date instead,
+    which is what their index is ordered by.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_date', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        if 'visible_created_date' in queryset.query.annotations:
+            return ('-visible_created_date', '-id')
+        return super().get_ordering(request, queryset, view)
+
+
 class TicketListCreateApi(APIView):
     """
     API for listing and creating tickets with role-based access.
     
     GET /api/tickets/ - List tickets (filtered by user role)
+    GET /api/tickets/?pagination=cursor - List tickets with keyset pagination
     POST /api/tickets/ - Create ticket (admin only)
     """
     permission_classes = [IsAuthenticated]
     pagination_class = TicketPagination
+    cursor_pagination_class = TicketCursorPagination
+
+    def get_paginator(self, filters):
+        """Use keyset pagination when requested or when following a cursor link."""
+        if filters.get('pagination') == 'cursor' or filters.get('cursor'):
+            return self.cursor_pagination_class()
+        return self.pagination_class()
 
     def get(self, request):
         """List tickets based on user role with filtering and pagination."""
         try:
+            etag = get_scope_etag(request, 'tickets')
+            not_modified = get_not_modified_response(request, etag)
+            if not_modified:
+                return not_modified
+            
             # Parse filter parameters - handle both DRF Request and Django WSGIRequest
             query_params = getattr(request, 'query_params', request.GET)
             filter_serializer = TicketFilterInputSerializer(data=query_params)
@@ -86,7 +201,8 @@ class TicketListCreateApi(APIView):
                 search=filters.get('search')
             )
             
-            # Apply additional filters
+            # Apply additional filters, against the same "now" the rows are built with
+            now = timezone.now()
             expiring_soon = filters.get('expiring_soon')
             expired = filters.get('expired')
             
@@ -95,38 +211,39 @@ class TicketListCreateApi(APIView):
                 from django.db.models import Q
                 tickets = tickets.filter(
                     Q(
-                        expiration_date__lte=timezone.now() + timezone.timedelta(hours=48),
-                        expiration_date__gt=timezone.now(),
+                        expiration_date__lte=now + timezone.timedelta(hours=48),
+                        expiration_date__gt=now,
                         status__in=['open', 'in_progress']
                     ) | Q(
-                        expiration_date__lt=timezone.now(),
+                        expiration_date__lt=now,
                         status__in=['open', 'in_progress']
                     )
                 )
             elif expiring_soon:
                 # Only expiring soon filter
                 tickets = tickets.filter(
-                    expiration_date__lte=timezone.now() + timezone.timedelta(hours=48),
-                    expiration_date__gt=timezone.now(),
+                    expiration_date__lte=now + timezone.timedelta(hours=48),
+                    expiration_date__gt=now,
                     status__in=['open', 'in_progress']
                 )
             elif expired:
                 # Only expired filter
                 tickets = tickets.filter(
-                    expiration_date__lt=timezone.now(),
+                    expiration_date__lt=now,
                     status__in=['open', 'in_progress']
                 )
             
-            # Paginate results
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(tickets, request)
+            # Paginate flat rows rather than model instances
+            rows = TicketListRowSerializer.get_queryset(tickets)
+            paginator = self.get_paginator(filters)
+            page = paginator.paginate_queryset(rows, request)
             
             if page is not None:
-                serializer = TicketListOutputSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
+                serializer = TicketListRowSerializer(page, now=now)
+                return set_validators(paginator.get_paginated_response(serializer.data), etag)
             
-            serializer = TicketListOutputSerializer(tickets, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            serializer = TicketListRowSerializer(rows, now=now)
+            return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag)
             
         except Exception as e:
             logger.error(f"Error listing tickets for user {request.user.id}: {str(e)}")
@@ -163,9 +280,9 @@ class TicketListCreateApi(APIView):
             
             response_data = {
                 "message": "Ticket created successfully",
-                "ticket": ticket
+                "ticket": TicketSelector.attach_recent_logs(ticket)
             }
-            response_serializer = TicketCreateOutputSerializer(response_data)
+            response_serializer = TicketCreateOutputSerializer(response_data, context={'request': request})
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
             
         except PermissionDenied as e:
@@ -201,6 +318,19 @@ class TicketDetailApi(APIView):
     def get(self, request, ticket_id):
         """Get ticket details with role-based access control."""
         try:
+            # Validate against updated_at and the log version before loading
+            # the ticket and its logs, which may be written after the commit
+            etag = last_modified = None
+            updated_at = TicketSelector.get_ticket_updated_at(ticket_id, request.user)
+            log_version = TicketChangeVersion.get_ticket(ticket_id) if updated_at else None
+            if log_version is not None:
+                window, window_start = get_validator_window()
+                etag = make_etag('ticket', ticket_id, updated_at.isoformat(), log_version, window)
+                last_modified = max(int(updated_at.timestamp()), window_start)
+                not_modified = get_not_modified_response(request, etag, last_modified)
+                if not_modified:
+                    return not_modified
+            
             ticket = TicketSelector.get_ticket_by_id(ticket_id, request.user)
             if not ticket:
                 return Response(
@@ -209,7 +339,7 @@ class TicketDetailApi(APIView):
                 )
             
             serializer = TicketOutputSerializer(ticket)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, last_modified)
             
         except Exception as e:
             logger.error(f"Error retrieving ticket {ticket_id}: {str(e)}")
@@ -242,9 +372,9 @@ class TicketDetailApi(APIView):
             
             response_data = {
                 "message": "Ticket updated successfully",
-                "ticket": ticket
+                "ticket": TicketSelector.attach_recent_logs(ticket)
             }
-            response_serializer = TicketUpdateOutputSerializer(response_data)
+            response_serializer = TicketUpdateOutputSerializer(response_data, context={'request': request})
             return Response(response_serializer.data, status=status.HTTP_200_OK)
             
         except PermissionDenied as e:
@@ -253,6 +383,11 @@ class TicketDetailApi(APIView):
                 ErrorOutputSerializer({"error": str(e)}).data,
                 status=status.HTTP_403_FORBIDDEN
             )
+        except Ticket.DoesNotExist:
+            return Response(
+                ErrorOutputSerializer({"error": "Ticket not found"}).data,
+                status=status.HTTP_404_NOT_FOUND
+            )
         except ValidationError as e:
             logger.warning(f"Validation error updating ticket {ticket_id}: {str(e)}")
             return Response(
@@ -300,11 +435,11 @@ class TicketRenewApi(APIView):
             
             response_data = {
                 "message": f"Ticket renewed successfully for {days} days",
-                "ticket": ticket,
+                "ticket": TicketSelector.attach_recent_logs(ticket),
                 "days_extended": days,
                 "new_expiration_date": ticket.expiration_date
             }
-            response_serializer = TicketRenewOutputSerializer(response_data)
+            response_serializer = TicketRenewOutputSerializer(response_data, context={'request': request})
             return Response(response_serializer.data, status=status.HTTP_200_OK)
             
         except PermissionDenied as e:
@@ -313,6 +448,11 @@ class TicketRenewApi(APIView):
                 ErrorOutputSerializer({"error": str(e)}).data,
                 status=status.HTTP_403_FORBIDDEN
             )
+        except Ticket.DoesNotExist:
+            return Response(
+                ErrorOutputSerializer({"error": "Ticket not found"}).data,
+                status=status.HTTP_404_NOT_FOUND
+            )
         except ValidationError as e:
             logger.warning(f"Validation error renewing ticket {ticket_id}: {str(e)}")
             return Response(
@@ -348,16 +488,6 @@ class TicketAssignApi(APIView):
             
             assigned_contractor_id = serializer.validated_data['assigned_contractor_id']
             
-            # Get previous assignee for response
-            ticket = TicketSelector.get_ticket_by_id(ticket_id, request.user)
-            if not ticket:
-                return Response(
-                    ErrorOutputSerializer({"error": "Ticket not found or access denied"}).data,
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            previous_assignee = ticket.assigned_contractor
-            
             # Assign ticket using service
             ticket = TicketService.assign_ticket(
                 ticket_id=ticket_id,
@@ -370,11 +500,11 @@ class TicketAssignApi(APIView):
             
             response_data = {
                 "message": "Ticket assigned successfully",
-                "ticket": ticket,
-                "previous_assignee": previous_assignee,
+                "ticket": TicketSelector.attach_recent_logs(ticket),
+                "previous_assignee": ticket.previous_assignee,
                 "new_assignee": ticket.assigned_contractor
             }
-            response_serializer = TicketAssignOutputSerializer(response_data)
+            response_serializer = TicketAssignOutputSerializer(response_data, context={'request': request})
             return Response(response_serializer.data, status=status.HTTP_200_OK)
             
         except PermissionDenied as e:
@@ -383,6 +513,11 @@ class TicketAssignApi(APIView):
                 ErrorOutputSerializer({"error": str(e)}).data,
                 status=status.HTTP_403_FORBIDDEN
             )
+        except Ticket.DoesNotExist:
+            return Response(
+                ErrorOutputSerializer({"error": "Ticket not found"}).data,
+                status=status.HTTP_404_NOT_FOUND
+            )
         except ValidationError as e:
             logger.warning(f"Validation error assigning ticket {ticket_id}: {str(e)}")
             return Response(
@@ -430,9 +565,9 @@ class TicketCloseApi(APIView):
             
             response_data = {
                 "message": "Ticket closed successfully",
-                "ticket": ticket
+                "ticket": TicketSelector.attach_recent_logs(ticket)
             }
-            response_serializer = TicketUpdateOutputSerializer(response_data)
+            response_serializer = TicketUpdateOutputSerializer(response_data, context={'request': request})
             return Response(response_serializer.data, status=status.HTTP_200_OK)
             
         except PermissionDenied as e:
@@ -441,6 +576,11 @@ class TicketCloseApi(APIView):
                 ErrorOutputSerializer({"error": str(e)}).data,
                 status=status.HTTP_403_FORBIDDEN
             )
+        except Ticket.DoesNotExist:
+            return Response(
+                ErrorOutputSerializer({"error": "Ticket not found"}).data,
+                status=status.HTTP_404_NOT_FOUND
+            )
         except ValidationError as e:
             logger.warning(f"Validation error closing ticket {ticket_id}: {str(e)}")
             return Response(
@@ -455,6 +595,154 @@ class TicketCloseApi(APIView):
             )
 
 
+class TicketBulkApi(APIView):
+    """
+    Base API for bulk ticket operations with per-item results.
+    Batches above TICKET_BULK_ASYNC_THRESHOLD (or with background=true) run as a
+    Celery job and return 202 with a status URL.
+    """
+    permission_classes = [IsAuthenticated]
+    operation = None
+    input_serializer_class = None
+
+    def post(self, request):
+        """Run a bulk operation now, or queue it as a job."""
+        try:
+            serializer = self.input_serializer_class(data=request.data)
+            if not serializer.is_valid():
+                return Response(
+                    ErrorOutputSerializer({"error": "Invalid input data"}).data,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            params = dict(serializer.validated_data)
+            background = params.pop('background')
+            item_count = len(params.get('tickets') or params.get('ticket_ids'))
+            
+            if background or item_count > settings.TICKET_BULK_ASYNC_THRESHOLD:
+                job = run_bulk_ticket_operation.delay(
+                    self.operation,
+                    request.user.id,
+                    json.loads(json.dumps(params, cls=DjangoJSONEncoder)),
+                    ip_address=get_client_ip(request)
+                )
+                BulkJobCache.set_owner(job.id, request.user.id)
+                logger.info(f"Bulk {self.operation} of {item_count} items queued as job {job.id} by {request.user.email}")
+                response_data = {
+                    "job_id": job.id,
+                    "status": "queued",
+                    "status_url": request.build_absolute_uri(
+                        reverse('tickets:ticket-bulk-job', kwargs={'job_id': job.id})
+                    )
+                }
+                return Response(TicketBulkJobOutputSerializer(response_data).data, status=status.HTTP_202_ACCEPTED)
+            
+            summary = TicketBulkService.run(
+                self.operation,
+                request.user,
+                params,
+                ip_address=get_client_ip(request)
+            )
+            return Response(TicketBulkOutputSerializer(summary).data, status=status.HTTP_200_OK)
+            
+        except PermissionDenied as e:
+            logger.warning(f"Permission denied for bulk {self.operation} by user {request.user.id}: {str(e)}")
+            return Response(
+                ErrorOutputSerializer({"error": str(e)}).data,
+                status=status.HTTP_403_FORBIDDEN
+            )
+        except ValidationError as e:
+            logger.warning(f"Validation error in bulk {self.operation}: {str(e)}")
+            return Response(
+                ErrorOutputSerializer({"error": str(e)}).data,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error in bulk {self.operation} for user {request.user.id}: {str(e)}")
+            return Response(
+                ErrorOutputSerializer({"error": "Internal server error"}).data,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class TicketBulkCreateApi(TicketBulkApi):
+    """
+    API for creating many tickets at once.
+    
+    POST /api/tickets/bulk/create/
+    """
+    operation = 'create'
+    input_serializer_class = TicketBulkCreateInputSerializer
+
+
+class TicketBulkAssignApi(TicketBulkApi):
+    """
+    API for assigning many tickets to one contractor.
+    
+    POST /api/tickets/bulk/assign/
+    """
+    operation = 'assign'
+    input_serializer_class = TicketBulkAssignInputSerializer
+
+
+class TicketBulkRenewApi(TicketBulkApi):
+    """
+    API for renewing many tickets.
+    
+    POST /api/tickets/bulk/renew/
+    """
+    operation = 'renew'
+    input_serializer_class = TicketBulkRenewInputSerializer
+
+
+class TicketBulkCloseApi(TicketBulkApi):
+    """
+    API for closing many tickets.
+    
+    POST /api/tickets/bulk/close/
+    """
+    operation = 'close'
+    input_serializer_class = TicketBulkCloseInputSerializer
+
+
+class TicketBulkJobApi(APIView):
+    """
+    API for the status and results of a queued bulk operation.
+    
+    GET /api/tickets/bulk/jobs/{job_id}/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        """Get bulk job status, with per-item results once finished."""
+        try:
+            # Unknown, expired and other users' jobs all look the same
+            if BulkJobCache.get_owner(job_id) != request.user.id:
+                return Response(
+                    ErrorOutputSerializer({"error": "Job not found"}).data,
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            job = AsyncResult(job_id)
+            if job.failed():
+                response_data = {"job_id": job_id, "status": "failed", "error": "Bulk operation failed"}
+                return Response(TicketBulkJobOutputSerializer(response_data).data, status=status.HTTP_200_OK)
+            
+            if not job.ready():
+                response_data = {"job_id": job_id, "status": job.state.lower()}
+                return Response(TicketBulkJobOutputSerializer(response_data).data, status=status.HTTP_200_OK)
+            
+            response_data = {**job.result, "job_id": job_id}
+            return Response(TicketBulkJobOutputSerializer(response_data).data, status=status.HTTP_200_OK)
+            
+        except Exception as e:
+            logger.error(f"Error retrieving bulk job {job_id}: {str(e)}")
+            return Response(
+                ErrorOutputSerializer({"error": "Internal server error"}).data,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class TicketStatsApi(APIView):
     """
     API for ticket statistics based on user role.
@@ -466,9 +754,14 @@ class TicketStatsApi(APIView):
     def get(self, request):
         """Get ticket statistics for the user."""
         try:
+            etag = get_scope_etag(request, 'stats')
+            not_modified = get_not_modified_response(request, etag)
+            if not_modified:
+                return not_modified
+            
             stats = TicketSelector.get_ticket_stats_for_user(request.user)
             serializer = TicketStatsOutputSerializer(stats)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag)
             
         except Exception as e:
             logger.error(f"Error retrieving ticket stats for user {request.user.id}: {str(e)}")
@@ -574,32 +867,112 @@ class TicketLogsApi(APIView):
             )
 
 
+class ActivityFeedApi(APIView):
+    """
+    API for the merged user and ticket activity feed, newest first.
+    
+    GET /api/tickets/activity/?limit=20&cursor=...
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Get a page of activity visible to the user."""
+        try:
+            query_params = getattr(request, 'query_params', request.GET)
+            input_serializer = ActivityFeedInputSerializer(data=query_params)
+            if not input_serializer.is_valid():
+                return Response(
+                    ErrorOutputSerializer({"error": "Invalid pagination parameters"}).data,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            try:
+                activities, next_cursor = LogSelector.get_activity_feed_for_user(
+                    request.user,
+                    limit=input_serializer.validated_data['limit'],
+                    cursor=input_serializer.validated_data.get('cursor')
+                )
+            except ValueError as e:
+                return Response(
+                    ErrorOutputSerializer({"error": str(e)}).data,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            next_url = None
+            if next_cursor:
+                next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+            
+            response_data = {
+                "next": next_url,
+                "results": ActivityOutputSerializer(activities, many=True).data
+            }
+            return Response(ActivityFeedResponseSerializer(response_data).data, status=status.HTTP_200_OK)
+            
+        except Exception as e:
+            logger.error(f"Error retrieving activity feed for user {request.user.id}: {str(e)}")
+            return Response(
+                ErrorOutputSerializer({"error": "Internal server error"}).data,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class TicketAuditTrailApi(APIView):
     """
-    API for complete ticket audit trail.
+    API for complete ticket audit trail, newest first.
     
-    GET /api/tickets/{id}/audit/
+    GET /api/tickets/{id}/audit/?limit=50&cursor=...
+    GET /api/tickets/{id}/audit/?stream=true (full history as NDJSON)
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, ticket_id):
-        """Get complete audit trail for a ticket."""
+        """Get a page of the audit trail for a ticket, or stream all of it."""
         try:
-            audit_trail = LogSelector.get_ticket_audit_trail(ticket_id, request.user)
+            query_params = getattr(request, 'query_params', request.GET)
+            input_serializer = AuditTrailInputSerializer(data=query_params)
+            if not input_serializer.is_valid():
+                return Response(
+                    ErrorOutputSerializer({"error": "Invalid pagination parameters"}).data,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
-            if not audit_trail:
+            params = input_serializer.validated_data
+            if not LogSelector.can_view_ticket_audit_trail(ticket_id, request.user):
                 return Response(
                     ErrorOutputSerializer({"error": "Ticket not found or access denied"}).data,
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            serializer = AuditTrailOutputSerializer(audit_trail, many=True)
+            if params['stream']:
+                # Access is checked above, the stream only walks the pages
+                return StreamingHttpResponse(
+                    self.stream_audit_trail(ticket_id),
+                    content_type='application/x-ndjson'
+                )
+            
+            try:
+                audit_trail, next_cursor = LogSelector.get_audit_trail_page(
+                    ticket_id,
+                    params['limit'],
+                    params.get('cursor')
+                )
+            except ValueError as e:
+                return Response(
+                    ErrorOutputSerializer({"error": str(e)}).data,
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            next_url = None
+            if next_cursor:
+                next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+            
             response_data = {
-                "count": len(serializer.data),
-                "results": serializer.data
+                # Total entries, as before pagination; the page size is len(results)
+                "count": LogSelector.count_ticket_audit_trail(ticket_id),
+                "next": next_url,
+                "results": AuditTrailOutputSerializer(audit_trail, many=True).data
             }
-            response_serializer = LogListResponseSerializer(response_data)
-            return Response(response_serializer.data, status=status.HTTP_200_OK)
+            return Response(AuditTrailResponseSerializer(response_data).data, status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error retrieving audit trail for ticket {ticket_id}: {str(e)}")
@@ -608,6 +981,12 @@ class TicketAuditTrailApi(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def stream_audit_trail(ticket_id):
+        """Yield the audit trail one JSON line per entry."""
+        for entry in LogSelector.iter_audit_trail(ticket_id):
+            yield json.dumps(AuditTrailOutputSerializer(entry).data, cls=DjangoJSONEncoder) + "\n"
+
 
 class DashboardApi(APIView):
     """
@@ -620,9 +999,9 @@ class DashboardApi(APIView):
     def get(self, request):
         """Get dashboard data based on user role."""
         try:
-            dashboard_data = DashboardSelector.get_dashboard_data_for_user(request.user)
-            serializer = DashboardDataOutputSerializer(dashboard_data)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Sections are cached already serialized
+            dashboard_data = DashboardEngine.get_dashboard_data_for_user(request.user)
+            return Response(dashboard_data, status=status.HTTP_200_OK)
             
         except Exception as e:
             logger.error(f"Error retrieving dashboard data for user {request.user.id}: {str(e)}")
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        from django.core.signals import request_started, request_finished
+        from .cache import ContractorCache
+
+        request_started.connect(ContractorCache.start_request, dispatch_uid="contractor_cache_start")
+        request_finished.connect(ContractorCache.end_request, dispatch_uid="contractor_cache_end")
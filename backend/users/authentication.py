@@ -0,0 +1,60 @@
+"""
+Request authentication backed by the user cache.
+"""
+
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.db_routers import ReplicaPin
+
+from .cache import UserAuthCache
+
+User = get_user_model()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user through UserAuthCache,
+    so authenticating a request costs no queries while the entry is cached.
+    Performs the same active and revoked-token checks as JWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        """
+        Attempts to find and return a user using the given validated token.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        # UserAuthCache is keyed by primary key
+        if api_settings.USER_ID_FIELD != User._meta.pk.name:
+            return super().get_user(validated_token)
+
+        try:
+            user = UserAuthCache.get_user(user_id)
+        except User.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != user.token_password_hash:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        # Keep this user's reads on the primary right after their own writes
+        ReplicaPin.set_user(user.id)
+        return user
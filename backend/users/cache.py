@@ -0,0 +1,292 @@
+"""
+Cache helpers for user lookups.
+Validation and services resolve ids through these, User.save invalidates them.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from rest_framework_simplejwt.utils import get_md5_hash_password
+import logging
+import secrets
+import threading
+
+from core.db_routers import PRIMARY_DATABASE
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# Per-request memo, only populated between request_started and request_finished
+_request_state = threading.local()
+
+
+class ContractorCache:
+    """
+    Cache of active contractors, holding only the fields tickets read.
+    Each id has its own entry (False when it is not an active contractor) and
+    the dashboard's name-ordered list has another. Entries live in the shared
+    cache for a short TTL and are memoized for the rest of the request, so
+    validating and then assigning a contractor costs at most one query.
+    """
+
+    KEY_PREFIX = "users:contractors:fields"
+    LIST_KEY = "users:contractors:fields:list"
+
+    # Columns of UserBasicOutputSerializer and ContractorOutputSerializer
+    FIELDS = ('id', 'email', 'first_name', 'last_name', 'role')
+
+    @staticmethod
+    def get_timeout():
+        """Get the contractor cache TTL in seconds."""
+        return getattr(settings, 'USER_LOOKUP_CACHE_TIMEOUT', 60)
+
+    @staticmethod
+    def start_request(**kwargs):
+        """Start a per-request memo (connected to request_started)."""
+        _request_state.contractors = {}
+        _request_state.contractor_list = None
+        _request_state.active = True
+
+    @staticmethod
+    def end_request(**kwargs):
+        """Drop the per-request memo (connected to request_finished)."""
+        _request_state.contractors = {}
+        _request_state.contractor_list = None
+        _request_state.active = False
+
+    @staticmethod
+    def _make_key(user_id):
+        return f"{ContractorCache.KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def _get_queryset():
+        # Refills read the primary, a lagging replica would cache a stale row for the whole TTL
+        return User.objects.db_manager(PRIMARY_DATABASE).filter(role=User.Role.CONTRACTOR, is_active=True)
+
+    @staticmethod
+    def _from_entry(entry):
+        # from_db takes values in column order; other columns stay deferred
+        field_names = [
+            field.attname for field in User._meta.concrete_fields
+            if field.attname in ContractorCache.FIELDS
+        ]
+        return User.from_db(PRIMARY_DATABASE, field_names, [entry[name] for name in field_names])
+
+    @staticmethod
+    def get_active_contractors():
+        """Get a list of active contractors in name order."""
+        in_request = getattr(_request_state, 'active', False)
+        if in_request and _request_state.contractor_list is not None:
+            return _request_state.contractor_list
+
+        entries = None
+        try:
+            entries = cache.get(ContractorCache.LIST_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to read contractor cache: {str(e)}")
+
+        if entries is None:
+            entries = list(
+                ContractorCache._get_queryset().order_by(
+                    'first_name', 'last_name'
+                ).values(*ContractorCache.FIELDS)
+            )
+            try:
+                cache.set(ContractorCache.LIST_KEY, entries, timeout=ContractorCache.get_timeout())
+            except Exception as e:
+                logger.warning(f"Failed to write contractor cache: {str(e)}")
+
+        contractors = [ContractorCache._from_entry(entry) for entry in entries]
+        if in_request:
+            _request_state.contractor_list = contractors
+        return contractors
+
+    @staticmethod
+    def get_contractor(user_id):
+        """
+        Get an active contractor by id.
+        Returns None if the id is malformed or not an active contractor.
+        """
+        try:
+            user_id = User._meta.pk.to_python(user_id)
+        except ValidationError:
+            return None
+
+        in_request = getattr(_request_state, 'active', False)
+        if in_request and user_id in _request_state.contractors:
+            return _request_state.contractors[user_id]
+
+        key = ContractorCache._make_key(user_id)
+        entry = None
+        try:
+            entry = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read contractor cache: {str(e)}")
+
+        if entry is None:
+            entry = ContractorCache._get_queryset().filter(
+                pk=user_id
+            ).values(*ContractorCache.FIELDS).first() or False
+            try:
+                cache.set(key, entry, timeout=ContractorCache.get_timeout())
+            except Exception as e:
+                logger.warning(f"Failed to write contractor cache: {str(e)}")
+
+        contractor = ContractorCache._from_entry(entry) if entry else None
+        if in_request:
+            _request_state.contractors[user_id] = contractor
+        return contractor
+
+    @staticmethod
+    def invalidate(*user_ids):
+        """Invalidate the list and the given users' entries, here and in this request's memo."""
+        _request_state.contractors = {}
+        _request_state.contractor_list = None
+        try:
+            cache.delete_many(
+                [ContractorCache.LIST_KEY] + [ContractorCache._make_key(user_id) for user_id in user_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to invalidate contractor cache: {str(e)}")
+
+
+class UserAuthCache:
+    """
+    Cache of users by id for request authentication.
+    Each API call resolves its user here instead of a primary-key SELECT.
+    User.save and User.delete invalidate the entry, so role, is_active and
+    password changes apply to the next request.
+    Entries hold plain field values without the password hash, only the
+    token revoke claim derived from it; cached users load password on access.
+    """
+
+    KEY_PREFIX = "users:auth:fields"
+
+    @staticmethod
+    def get_timeout():
+        """Get the authenticated user cache TTL in seconds."""
+        return getattr(settings, 'USER_AUTH_CACHE_TIMEOUT', 60)
+
+    @staticmethod
+    def _make_key(user_id):
+        return f"{UserAuthCache.KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def _get_field_names():
+        return [
+            field.attname for field in User._meta.concrete_fields
+            if field.attname != 'password'
+        ]
+
+    @staticmethod
+    def _to_entry(user):
+        return {
+            'fields': {name: getattr(user, name) for name in UserAuthCache._get_field_names()},
+            'password_hash': get_md5_hash_password(user.password),
+        }
+
+    @staticmethod
+    def _from_entry(entry):
+        # Built like a queryset row with password deferred, so save() never overwrites it
+        field_names = UserAuthCache._get_field_names()
+        user = User.from_db(
+            PRIMARY_DATABASE, field_names, [entry['fields'][name] for name in field_names]
+        )
+        user.token_password_hash = entry['password_hash']
+        return user
+
+    @staticmethod
+    def get_user(user_id):
+        """
+        Get a user by id, from the cache or the database.
+        The user has token_password_hash set to the md5 revoke claim of its password.
+        Raises User.DoesNotExist if there is no such user.
+        """
+        try:
+            key = UserAuthCache._make_key(User._meta.pk.to_python(user_id))
+        except ValidationError:
+            raise User.DoesNotExist(f"Invalid user id {user_id!r}")
+
+        try:
+            entry = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read user auth cache: {str(e)}")
+            entry = None
+
+        if entry is None:
+            # Refill from the primary, like ContractorCache
+            entry = UserAuthCache._to_entry(User.objects.db_manager(PRIMARY_DATABASE).get(pk=user_id))
+            try:
+                cache.set(key, entry, timeout=UserAuthCache.get_timeout())
+            except Exception as e:
+                logger.warning(f"Failed to write user auth cache: {str(e)}")
+        return UserAuthCache._from_entry(entry)
+
+    @staticmethod
+    def invalidate(user_id):
+        """Drop a user's cached entry."""
+        try:
+            cache.delete(UserAuthCache._make_key(user_id))
+        except Exception as e:
+            logger.warning(f"Failed to invalidate user auth cache: {str(e)}")
+
+
+class LoginSessionCache:
+    """
+    Short-lived handshake between SmartLogin and 2FA verification.
+    Entries live only in the shared cache and expire through its native TTL,
+    so the login flow never touches the database session table.
+    """
+
+    KEY_PREFIX = "users:login:temp"
+
+    @staticmethod
+    def get_timeout():
+        """Get the temporary login session TTL in seconds."""
+        return getattr(settings, 'LOGIN_TEMP_SESSION_TIMEOUT', 300)
+
+    @staticmethod
+    def _make_key(session_id):
+        return f"{LoginSessionCache.KEY_PREFIX}:{session_id}"
+
+    @staticmethod
+    def create(user_id, login_time):
+        """Store a new temporary session and return its id."""
+        session_id = secrets.token_urlsafe(32)
+        cache.set(
+            LoginSessionCache._make_key(session_id),
+            {'user_id': user_id, 'login_time': login_time.isoformat()},
+            timeout=LoginSessionCache.get_timeout()
+        )
+        return session_id
+
+    @staticmethod
+    def get(session_id):
+        """
+        Get a temporary session without consuming it.
+        Returns None if it does not exist, has expired or the cache is unavailable.
+        """
+        try:
+            return cache.get(LoginSessionCache._make_key(session_id))
+        except Exception as e:
+            logger.warning(f"Failed to read temporary login session: {str(e)}")
+            return None
+
+    @staticmethod
+    def pop(session_id):
+        """
+        Atomically get and delete a temporary session.
+        Only one of several concurrent callers gets the session back, the
+        delete reports whether this caller was the one that removed it.
+        """
+        key = LoginSessionCache._make_key(session_id)
+        try:
+            session = cache.get(key)
+            if session is None or not cache.delete(key):
+                return None
+            return session
+        except Exception as e:
+            logger.warning(f"Failed to consume temporary login session: {str(e)}")
+            return None
@@ -1,5 +1,5 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 import re
 
@@ -122,3 +122,30 @@ class User(AbstractUser):
             else:
                 self.is_staff = False
         super().save(*args, **kwargs)
+        
+        # Login only touches last_login, which no cached lookup depends on
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) - {'last_login'}:
+            self.invalidate_caches(self.pk)
+
+    def delete(self, *args, **kwargs):
+        # Deleting clears self.pk
+        user_id = self.pk
+        result = super().delete(*args, **kwargs)
+        self.invalidate_caches(user_id)
+        return result
+
+    @staticmethod
+    def invalidate_caches(user_id):
+        """
+        Invalidate cached user lookups now and again after commit,
+        so a concurrent request cannot re-cache the pre-commit state.
+        """
+        from .cache import ContractorCache, UserAuthCache
+
+        def invalidate():
+            ContractorCache.invalidate(user_id)
+            UserAuthCache.invalidate(user_id)
+
+        invalidate()
+        transaction.on_commit(invalidate)
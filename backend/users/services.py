@@ -5,11 +5,10 @@ Business logic is encapsulated in services.
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.contrib.auth import authenticate
-from django.contrib.sessions.models import Session
 from django.utils import timezone
 from datetime import timedelta
-import secrets
-import string
+
+from .cache import LoginSessionCache
 
 User = get_user_model()
 
@@ -141,20 +140,9 @@ class LoginService:
     def create_temporary_session(user):
         """
         Create a temporary session for 2FA verification.
-        Returns a temporary session ID that expires in 5 minutes.
+        Returns a temporary session ID that expires after LOGIN_TEMP_SESSION_TIMEOUT.
         """
-        # Generate a secure random session ID
-        session_id = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(32))
-        
-        # Store in Django session with expiration
-        from django.contrib.sessions.backends.db import SessionStore
-        session = SessionStore()
-        session['temp_user_id'] = user.id
-        session['temp_login_time'] = timezone.now().isoformat()
-        session.set_expiry(300)  # 5 minutes
-        session.save()
-        
-        return session.session_key
+        return LoginSessionCache.create(user.id, timezone.now())
     
     @staticmethod
     def get_user_from_temp_session(session_id):
@@ -163,22 +151,17 @@ class LoginService:
         Returns user object if session is valid, None otherwise.
         """
         try:
-            from django.contrib.sessions.backends.db import SessionStore
-            session = SessionStore(session_key=session_id)
-            
-            temp_user_id = session.get('temp_user_id')
-            temp_login_time = session.get('temp_login_time')
-            
-            if not temp_user_id or not temp_login_time:
+            session = LoginSessionCache.get(session_id)
+            if not session:
                 return None
             
-            # Check if session has expired (5 minutes)
-            login_time = timezone.datetime.fromisoformat(temp_login_time.replace('Z', '+00:00'))
-            if timezone.now() - login_time > timedelta(minutes=5):
-                session.delete()
+            # The cache TTL expires sessions, this guards against a longer-lived entry
+            login_time = timezone.datetime.fromisoformat(session['login_time'])
+            if timezone.now() - login_time > timedelta(seconds=LoginSessionCache.get_timeout()):
+                LoginSessionCache.pop(session_id)
                 return None
             
-            user = User.objects.get(id=temp_user_id)
+            user = User.objects.get(id=session['user_id'])
             return user
             
         except (User.DoesNotExist, Exception):
@@ -188,13 +171,9 @@ class LoginService:
     def cleanup_temp_session(session_id):
         """
         Clean up temporary session after successful login.
+        Returns True only for the one caller that consumed the session.
         """
-        try:
-            from django.contrib.sessions.backends.db import SessionStore
-            session = SessionStore(session_key=session_id)
-            session.delete()
-        except Exception:
-            pass  # Session might already be expired/deleted
+        return LoginSessionCache.pop(session_id) is not None
     
     @staticmethod
     def verify_2fa_and_login(session_id, code, skip=False):
@@ -223,7 +202,8 @@ class LoginService:
                     return None
             # If skip=True or no code provided, allow login
         
-        # Clean up temporary session
-        LoginService.cleanup_temp_session(session_id)
+        # Consume the temporary session, a concurrent verify that got there first wins
+        if not LoginService.cleanup_temp_session(session_id):
+            return None
         
         return user
@@ -1,6 +1,14 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from unittest.mock import patch
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication import CachedJWTAuthentication
+from users.cache import ContractorCache, UserAuthCache
 
 User = get_user_model()
 
@@ -241,3 +249,145 @@ class TestUserModel:
         user.save()
         
         assert user.updated_at != original_updated_at
+
+
+@pytest.mark.django_db
+class TestContractorCache:
+    """Test cases for the cached contractor lookup."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.contractor = User.objects.create_user(
+            email="contractor@example.com",
+            password="testpass123",
+            role=User.Role.CONTRACTOR,
+        )
+        self.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="testpass123",
+            role=User.Role.ADMIN,
+        )
+
+    def test_get_contractor_is_served_from_cache(self, django_assert_num_queries):
+        """Test that only the first lookup hits the database."""
+        with django_assert_num_queries(2):
+            assert ContractorCache.get_contractor(self.contractor.id) == self.contractor
+            assert ContractorCache.get_contractor(str(self.contractor.id)) == self.contractor
+            assert ContractorCache.get_contractor(self.admin.id) is None
+
+        with django_assert_num_queries(0):
+            contractor = ContractorCache.get_contractor(self.contractor.id)
+            assert contractor == self.contractor
+            assert contractor.email == self.contractor.email
+            assert ContractorCache.get_contractor(self.admin.id) is None
+            assert ContractorCache.get_contractor("not-an-id") is None
+
+    def test_cache_entries_hold_only_listed_fields(self):
+        """Test that cached entries carry no password hash or other columns."""
+        ContractorCache.get_contractor(self.contractor.id)
+        ContractorCache.get_active_contractors()
+
+        assert cache.get(ContractorCache._make_key(self.contractor.id)) == {
+            field: getattr(self.contractor, field) for field in ContractorCache.FIELDS
+        }
+        assert cache.get(ContractorCache.LIST_KEY) == [
+            cache.get(ContractorCache._make_key(self.contractor.id))
+        ]
+
+    def test_get_contractor_is_memoized_per_request(self):
+        """Test that a request only reads the shared cache once."""
+        ContractorCache.start_request()
+        try:
+            ContractorCache.get_contractor(self.contractor.id)
+            ContractorCache.get_active_contractors()
+            with patch("users.cache.cache.get") as mock_get:
+                assert ContractorCache.get_contractor(self.contractor.id) == self.contractor
+                assert ContractorCache.get_active_contractors() == [self.contractor]
+            mock_get.assert_not_called()
+        finally:
+            ContractorCache.end_request()
+
+    def test_user_changes_invalidate_cache(self):
+        """Test that saving a user drops stale contractor entries."""
+        assert ContractorCache.get_contractor(self.contractor.id)
+        assert ContractorCache.get_contractor(self.admin.id) is None
+        assert ContractorCache.get_active_contractors() == [self.contractor]
+
+        self.contractor.is_active = False
+        self.contractor.save()
+
+        assert ContractorCache.get_contractor(self.contractor.id) is None
+        assert ContractorCache.get_active_contractors() == []
+
+        self.admin.role = User.Role.CONTRACTOR
+        self.admin.save()
+
+        assert ContractorCache.get_contractor(self.admin.id) == self.admin
+
+
+@pytest.mark.django_db
+class TestUserAuthCache:
+    """Test cases for cached request authentication."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            email="contractor@example.com",
+            password="testpass123",
+            role=User.Role.CONTRACTOR,
+        )
+
+    def authenticate(self):
+        request = APIRequestFactory().get(
+            "/api/tickets/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}"
+        )
+        return CachedJWTAuthentication().authenticate(request)[0]
+
+    def test_authentication_is_served_from_cache(self, django_assert_num_queries):
+        """Test that only the first request loads the user from the database."""
+        with django_assert_num_queries(1):
+            assert self.authenticate() == self.user
+
+        with django_assert_num_queries(0):
+            user = self.authenticate()
+
+        assert user == self.user
+        assert user.is_contractor
+
+    def test_cache_entry_holds_no_password_hash(self, django_assert_num_queries):
+        """Test that the cached entry omits the password and cached users load it on demand."""
+        self.authenticate()
+
+        entry = cache.get(UserAuthCache._make_key(self.user.id))
+        assert 'password' not in entry['fields']
+        assert self.user.password not in str(entry)
+
+        user = self.authenticate()
+        assert user.get_deferred_fields() == {'password'}
+        with django_assert_num_queries(1):
+            assert user.check_password("testpass123")
+
+        user.first_name = "Changed"
+        user.save()
+        self.user.refresh_from_db()
+        assert self.user.check_password("testpass123")
+
+    def test_user_changes_invalidate_cache(self):
+        """Test that role changes, deactivation and deletion apply to the next request."""
+        self.authenticate()
+
+        self.user.role = User.Role.ADMIN
+        self.user.save()
+        assert self.authenticate().is_admin
+
+        self.user.is_active = False
+        self.user.save()
+        with pytest.raises(AuthenticationFailed):
+            self.authenticate()
+
+        user_id = self.user.id
+        self.user.delete()
+        with pytest.raises(User.DoesNotExist):
+            UserAuthCache.get_user(user_id)
@@ -4,6 +4,7 @@ Tests business logic in services layer.
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
@@ -375,3 +376,23 @@ class TestLoginService:
         # Verify session is cleaned up
         retrieved_user = LoginService.get_user_from_temp_session(session_id)
         assert retrieved_user is None
+
+    def test_temporary_session_does_not_use_database(self, django_assert_num_queries):
+        """Test that temporary sessions live only in the cache."""
+        with django_assert_num_queries(0):
+            session_id = LoginService.create_temporary_session(self.user)
+            LoginService.cleanup_temp_session(session_id)
+        
+        assert not Session.objects.exists()
+
+    def test_verify_2fa_and_login_session_is_single_use(self):
+        """Test that a failed code keeps the session but a successful login consumes it."""
+        self.user.two_factor_enabled = True
+        self.user.save()
+        
+        session_id = LoginService.create_temporary_session(self.user)
+        
+        assert LoginService.verify_2fa_and_login(session_id, "9999", False) is None
+        assert LoginService.verify_2fa_and_login(session_id, "1234", False) == self.user
+        assert LoginService.verify_2fa_and_login(session_id, "1234", False) is None
+        assert LoginService.cleanup_temp_session(session_id) is False